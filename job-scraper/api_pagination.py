@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from typing import Any, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Request parameters that select a result page, by pagination style
+PAGE_KEYS = ("page", "pageNumber", "page_number", "p")
+OFFSET_KEYS = ("offset", "start", "from", "skip")
+SIZE_KEYS = ("per_page", "perPage", "page_size", "pageSize", "hitsPerPage", "limit", "size")
+# Cursor-paginated APIs return the next cursor and take it back as a parameter
+RESPONSE_CURSOR_KEYS = ("next_cursor", "nextCursor", "next_page_token", "nextPageToken", "endCursor", "cursor")
+REQUEST_CURSOR_KEYS = ("cursor", "after", "page_token", "pageToken")
+
+# Headers the browser sets itself and refuses (or ignores) from fetch()
+_BROWSER_HEADERS = {
+    "host", "content-length", "cookie", "user-agent", "accept-encoding",
+    "connection", "origin", "referer",
+}
+
+Path = tuple[Any, ...]
+
+
+@dataclass
+class ApiEndpoint:
+    """A paginated search request learned from one intercepted call.
+
+    ``kind`` is ``"page"``, ``"offset"`` or ``"cursor"``; ``path`` locates
+    the pagination parameter in the query string (``where="query"``) or the
+    JSON body (``where="body"``).  :meth:`request` rebuilds the call for any
+    later page.
+    """
+
+    url: str
+    method: str
+    headers: dict[str, str]
+    body: Any
+    kind: str
+    where: str
+    path: Path
+    start: int = 0
+    step: int = 1
+    cursor: Optional[str] = None
+    cursor_path: Path = field(default_factory=tuple)
+
+    def request(self, n: int = 0, cursor: Optional[str] = None) -> tuple[str, Optional[str]]:
+        """``(url, body)`` of the *n*-th page after the learned one, or of *cursor*."""
+        value: Any = cursor if self.kind == "cursor" else self.start + n * self.step
+        url, body = self.url, self.body
+        if self.where == "query":
+            parts = urlsplit(url)
+            query = dict(parse_qsl(parts.query, keep_blank_values=True))
+            query[self.path[0]] = str(value)
+            url = urlunsplit(parts._replace(query=urlencode(query)))
+        else:
+            body = _set_path(json.loads(json.dumps(body)), self.path, value)
+        return url, json.dumps(body) if body is not None else None
+
+
+def learn_endpoint(
+    url: str,
+    method: str,
+    headers: dict[str, str],
+    post_data: Optional[str],
+    payload: Any,
+    jobs_found: int,
+) -> Optional[ApiEndpoint]:
+    """Work out how to page through the API call that returned *payload*.
+
+    Looks for a page number, then an offset, in the query string and the
+    JSON request body; failing that, for a cursor in the response.  Returns
+    ``None`` if the call doesn't look paginated.
+    """
+    body: Any = None
+    if post_data:
+        try:
+            body = json.loads(post_data)
+        except ValueError:
+            body = None
+    kept = {k: v for k, v in headers.items() if k.lower() not in _BROWSER_HEADERS and not k.startswith(":")}
+    base = {"url": url, "method": method.upper(), "headers": kept, "body": body}
+    query = dict(parse_qsl(urlsplit(url).query))
+
+    for kind, keys in (("page", PAGE_KEYS), ("offset", OFFSET_KEYS)):
+        for where, container in (("query", query), ("body", body)):
+            path = _find_key(container, keys)
+            if path is None:
+                continue
+            start = _as_int(_get_path(container, path))
+            if start is None:
+                continue
+            step = 1
+            if kind == "offset":
+                size_path = _find_key(container, SIZE_KEYS)
+                size = _as_int(_get_path(container, size_path)) if size_path else None
+                step = size or jobs_found
+            if step <= 0:
+                continue
+            return ApiEndpoint(**base, kind=kind, where=where, path=path, start=start, step=step)
+
+    cursor_path = _find_key(payload, RESPONSE_CURSOR_KEYS)
+    cursor = _get_path(payload, cursor_path) if cursor_path else None
+    if isinstance(cursor, str) and cursor:
+        for where, container in (("query", query), ("body", body)):
+            path = _find_key(container, REQUEST_CURSOR_KEYS)
+            if path is not None:
+                break
+        else:
+            where, path = "query", ("cursor",)
+        return ApiEndpoint(**base, kind="cursor", where=where, path=path, cursor=cursor, cursor_path=cursor_path)
+    return None
+
+
+def next_cursor(endpoint: ApiEndpoint, payload: Any) -> Optional[str]:
+    """The cursor for the page after *payload* (``None`` on the last page)."""
+    try:
+        cursor = _get_path(payload, endpoint.cursor_path)
+    except (KeyError, IndexError, TypeError):
+        return None
+    return cursor if isinstance(cursor, str) and cursor else None
+
+
+# -- JSON paths -------------------------------------------------------------
+
+def _find_key(data: Any, keys: tuple[str, ...], depth: int = 4) -> Optional[Path]:
+    """Path to the first of *keys* in *data*; each level is checked before its children."""
+    if depth < 0 or not isinstance(data, (dict, list)):
+        return None
+    if isinstance(data, dict):
+        for key in keys:
+            if key in data:
+                return (key,)
+        children = list(data.items())
+    else:
+        children = list(enumerate(data))
+    for key, value in children:
+        sub = _find_key(value, keys, depth - 1)
+        if sub is not None:
+            return (key, *sub)
+    return None
+
+
+def _get_path(data: Any, path: Path) -> Any:
+    for key in path:
+        data = data[key]
+    return data
+
+
+def _set_path(data: Any, path: Path, value: Any) -> Any:
+    _get_path(data, path[:-1])[path[-1]] = value
+    return data
+
+
+def _as_int(value: Any) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
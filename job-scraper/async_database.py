@@ -0,0 +1,375 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import random
+from typing import Any, Awaitable, Callable, Optional, TypeVar, Union
+
+import psycopg
+from psycopg_pool import AsyncConnectionPool, PoolTimeout
+
+from database import (
+    COUNT_NEW_SQL,
+    DB_NOW_SQL,
+    DEACTIVATE_STALE_SQL,
+    EXISTING_URLS_SQL,
+    FRONTIER_ACTIVE_SQL,
+    FRONTIER_ADD_SQL,
+    FRONTIER_CLOSE_SQL,
+    FRONTIER_COMPLETE_SQL,
+    FRONTIER_CURSOR_SQL,
+    FRONTIER_ENQUEUE_SQL,
+    FRONTIER_LEASE_SQL,
+    FRONTIER_RELEASE_SQL,
+    FRONTIER_SAVE_CURSOR_SQL,
+    FRONTIER_SETTLE_SQL,
+    INDEX_TERMS_SQL,
+    JOBS_PAGE_SQL,
+    ON_CONFLICT_SQL,
+    REINDEX_BATCH_SIZE,
+    TOUCH_SEEN_SQL,
+    ConnectionSettings,
+    DatabaseManager,
+    index_params,
+    log_upsert,
+    with_content_hash,
+)
+from utils import STALE_AFTER_DAYS, logger
+
+T = TypeVar("T")
+
+# Pool sizing / resilience
+DB_POOL_MIN_SIZE = int(os.getenv("SCRAPER_DB_POOL_MIN_SIZE", "1"))
+DB_POOL_MAX_SIZE = int(os.getenv("SCRAPER_DB_POOL_MAX_SIZE", "4"))
+DB_MAX_RETRIES = int(os.getenv("SCRAPER_DB_MAX_RETRIES", "5"))
+DB_RETRY_BASE_DELAY = float(os.getenv("SCRAPER_DB_RETRY_BASE_DELAY", "0.5"))
+DB_CONNECT_TIMEOUT = float(os.getenv("SCRAPER_DB_CONNECT_TIMEOUT", "10"))
+# Disable server-side prepared statements behind a transaction-mode PgBouncer
+DB_PREPARE = os.getenv("SCRAPER_DB_PREPARE", "1") != "0"
+
+# (column, element type) in insert order — one unnest() array per column
+JOB_COLUMNS: list[tuple[str, str]] = [
+    ("title", "varchar"),
+    ("companyName", "varchar"),
+    ("description", "text"),
+    ("wage", "varchar"),
+    ("wageMin", "real"),
+    ("wageMax", "real"),
+    ("wageCurrency", "varchar"),
+    ("wagePeriod", "varchar"),
+    ("wageAnnualized", "integer"),
+    ("locationRequirement", "varchar"),
+    ("experienceLevel", "varchar"),
+    ("location", "varchar"),
+    ("sourceUrl", "text"),
+    ("sourceSite", "varchar"),
+    ("postedAt", "varchar"),
+    ("contentHash", "varchar"),
+]
+
+# Array-based bulk upsert: the statement text is the same for every batch
+# size, so it is prepared once per connection and reused.
+UNNEST_UPSERT_SQL = (
+    "INSERT INTO scraped_jobs ("
+    + ", ".join(f'"{col}"' for col, _ in JOB_COLUMNS)
+    + ") SELECT * FROM unnest("
+    + ", ".join(f"%s::{typ}[]" for _, typ in JOB_COLUMNS)
+    + ")"
+    + ON_CONFLICT_SQL
+)
+
+HEALTH_CHECK_SQL = "SELECT 1"
+
+
+class AsyncDatabaseManager(ConnectionSettings):
+    """Async counterpart of :class:`database.DatabaseManager`.
+
+    Holds a small psycopg 3 ``AsyncConnectionPool`` so concurrent scrapers
+    write in parallel without blocking the event loop.  Connections are
+    health-checked on checkout, the upsert runs as a prepared statement, and
+    transient connection failures are retried with jittered exponential
+    backoff.  Same ``DATABASE_URL`` / ``DB_HOST``… configuration.
+    """
+
+    def __init__(self, min_size: int = DB_POOL_MIN_SIZE, max_size: int = DB_POOL_MAX_SIZE) -> None:
+        super().__init__()
+        self.min_size = min_size
+        self.max_size = max(min_size, max_size)
+        self.prepare = DB_PREPARE
+        self.pool: Optional[AsyncConnectionPool] = None
+
+    # -- connection helpers -------------------------------------------------
+
+    async def connect(self) -> None:
+        """Open the pool (idempotent); waits until *min_size* connections work."""
+        if self.pool is not None:
+            return
+        try:
+            self.pool = await self._retry("connect", self._open_pool)
+        except (psycopg.Error, PoolTimeout) as exc:
+            logger.error("Failed to connect to PostgreSQL: %s", exc)
+            raise
+        logger.info(
+            "Connected to PostgreSQL %s (async pool %d–%d).",
+            self._describe(), self.min_size, self.max_size,
+        )
+
+    async def _open_pool(self) -> AsyncConnectionPool:
+        # A pool that failed to open cannot be reopened, so each attempt
+        # builds a fresh one.
+        pool = AsyncConnectionPool(
+            self._conninfo(),
+            min_size=self.min_size,
+            max_size=self.max_size,
+            open=False,
+            check=AsyncConnectionPool.check_connection,
+            kwargs={"autocommit": True, "prepare_threshold": 5 if self.prepare else None},
+        )
+        try:
+            await pool.open(wait=True, timeout=DB_CONNECT_TIMEOUT)
+        except BaseException:
+            await pool.close()
+            raise
+        return pool
+
+    async def close(self) -> None:
+        """Close the pool if open."""
+        if self.pool is not None:
+            await self.pool.close()
+            self.pool = None
+            logger.info("PostgreSQL pool closed.")
+
+    async def ping(self) -> bool:
+        """Health check: ``True`` if a pooled connection answers ``SELECT 1``."""
+        try:
+            await self._fetch(HEALTH_CHECK_SQL, None)
+            return True
+        except (psycopg.Error, PoolTimeout):
+            return False
+
+    async def _retry(self, what: str, op: Callable[[], Awaitable[T]]) -> T:
+        attempt = 1
+        while True:
+            try:
+                return await op()
+            except (psycopg.OperationalError, PoolTimeout) as exc:
+                if attempt >= DB_MAX_RETRIES:
+                    raise
+                delay = DB_RETRY_BASE_DELAY * 2 ** (attempt - 1)
+                delay += random.uniform(0, DB_RETRY_BASE_DELAY)
+                logger.warning(
+                    "DB %s failed (attempt %d/%d): %s — retrying in %.1fs",
+                    what, attempt, DB_MAX_RETRIES, exc, delay,
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    async def _fetch(self, sql: str, params: Any, prepare: Optional[bool] = None) -> list[tuple]:
+        if self.pool is None:
+            await self.connect()
+
+        async def op() -> list[tuple]:
+            async with self.pool.connection() as conn:  # type: ignore[union-attr]
+                cur = await conn.execute(sql, params, prepare=prepare)
+                return await cur.fetchall()
+
+        return await self._retry("query", op)
+
+    async def _execute(self, sql: str, params: Any) -> int:
+        if self.pool is None:
+            await self.connect()
+
+        async def op() -> int:
+            async with self.pool.connection() as conn:  # type: ignore[union-attr]
+                cur = await conn.execute(sql, params)
+                return cur.rowcount
+
+        return await self._retry("query", op)
+
+    # -- data operations ----------------------------------------------------
+
+    async def insert_job(self, job: dict[str, Any]) -> bool:
+        """Insert a single job; ``True`` if a new row was inserted."""
+        return bool(await self.insert_jobs([job]))
+
+    async def insert_jobs(self, batch: list[dict[str, Any]]) -> Optional[list[dict[str, Any]]]:
+        """Upsert many job dicts with one prepared statement.
+
+        Same contract as :meth:`database.DatabaseManager.insert_jobs`.  A
+        retried batch is harmless: rows that landed before the failure are
+        simply reported as unchanged.
+        """
+        if not batch:
+            return []
+
+        jobs = with_content_hash(batch)
+        params = [[job.get(col) for job in jobs] for col, _ in JOB_COLUMNS]
+
+        try:
+            rows = await self._fetch(UNNEST_UPSERT_SQL, params, prepare=self.prepare or None)
+        except (psycopg.Error, PoolTimeout) as exc:
+            logger.error("DB bulk insert error (%d jobs): %s", len(jobs), exc)
+            return None
+        await self.index_terms(jobs, rows)
+        return log_upsert(jobs, rows)
+
+    async def index_terms(self, jobs: list[dict[str, Any]], rows: list[tuple]) -> None:
+        """Same contract as :meth:`database.DatabaseManager.index_terms`."""
+        params = index_params(jobs, rows)
+        if params is None:
+            return
+        try:
+            await self._execute(INDEX_TERMS_SQL, params)
+        except (psycopg.Error, PoolTimeout) as exc:
+            logger.error("DB term index error (%d jobs): %s", len(params[3]), exc)
+
+    async def reindex_terms(self, batch_size: int = REINDEX_BATCH_SIZE) -> int:
+        """Same contract as :meth:`database.DatabaseManager.reindex_terms`."""
+        done, after = 0, ""
+        while True:
+            page = await self._fetch(JOBS_PAGE_SQL, (after, batch_size))
+            if not page:
+                return done
+            jobs = [{"sourceUrl": url, "title": title, "description": desc} for url, title, desc in page]
+            await self._execute(INDEX_TERMS_SQL, index_params(jobs, page))
+            done += len(page)
+            after = page[-1][0]
+            logger.info("Indexed terms of %d postings.", done)
+
+    async def existing_source_urls(self, urls: list[str]) -> set[str]:
+        """Return the subset of *urls* already stored (empty set on error)."""
+        if not urls:
+            return set()
+        try:
+            rows = await self._fetch(EXISTING_URLS_SQL, (list(urls),))
+        except (psycopg.Error, PoolTimeout) as exc:
+            logger.error("DB lookup error for %d URLs: %s", len(urls), exc)
+            return set()
+        return {row[0] for row in rows}
+
+    async def db_now(self) -> Optional[float]:
+        """Same contract as :meth:`database.DatabaseManager.db_now`."""
+        try:
+            rows = await self._fetch(DB_NOW_SQL, ())
+        except (psycopg.Error, PoolTimeout) as exc:
+            logger.error("DB clock read error: %s", exc)
+            return None
+        return rows[0][0]
+
+    async def count_new_jobs(self, source_site: str, since: float) -> int:
+        """Same contract as :meth:`database.DatabaseManager.count_new_jobs`."""
+        try:
+            rows = await self._fetch(COUNT_NEW_SQL, (source_site, since))
+        except (psycopg.Error, PoolTimeout) as exc:
+            logger.error("DB count error for %s: %s", source_site, exc)
+            return 0
+        return rows[0][0]
+
+    # -- crawl frontier -----------------------------------------------------
+
+    async def frontier_add(self, source: str, kind: str, keys: list[str], payloads: list[str]) -> None:
+        """Same contract as :meth:`database.DatabaseManager.frontier_add`."""
+        if not keys:
+            return
+        try:
+            await self._execute(FRONTIER_ADD_SQL, (source, kind, keys, payloads))
+        except (psycopg.Error, PoolTimeout) as exc:
+            logger.error("DB frontier add error for %s: %s", source, exc)
+
+    async def frontier_enqueue(self, source: str, key: str, kind: str) -> None:
+        try:
+            await self._execute(FRONTIER_ENQUEUE_SQL, (source, key, kind))
+        except (psycopg.Error, PoolTimeout) as exc:
+            logger.error("DB frontier add error for %s: %s", source, exc)
+
+    async def frontier_lease(
+        self,
+        source: str,
+        kind: str,
+        keys: Optional[list[str]],
+        owner: str,
+        lease_seconds: float,
+        max_attempts: int,
+        limit: int,
+    ) -> list[tuple[str, Any]]:
+        """Same contract as :meth:`database.DatabaseManager.frontier_lease`."""
+        try:
+            return await self._fetch(FRONTIER_LEASE_SQL, (
+                source, kind, max_attempts, keys, keys, limit, owner, lease_seconds, source,
+            ))
+        except (psycopg.Error, PoolTimeout) as exc:
+            logger.error("DB frontier lease error for %s: %s", source, exc)
+            return [(key, None) for key in keys or []]
+
+    async def frontier_complete(self, source: str, keys: list[str]) -> None:
+        if not keys:
+            return
+        try:
+            await self._execute(FRONTIER_COMPLETE_SQL, (source, keys))
+        except (psycopg.Error, PoolTimeout) as exc:
+            logger.error("DB frontier update error for %s: %s", source, exc)
+
+    async def frontier_release(self, source: str, keys: list[str], owner: str, max_attempts: int) -> list[tuple[str, str]]:
+        """Same contract as :meth:`database.DatabaseManager.frontier_release`."""
+        try:
+            return await self._fetch(FRONTIER_RELEASE_SQL, (max_attempts, source, keys, owner))
+        except (psycopg.Error, PoolTimeout) as exc:
+            logger.error("DB frontier release error for %s: %s", source, exc)
+            return []
+
+    async def frontier_cursor(self, source: str, key: str) -> Optional[dict[str, Any]]:
+        try:
+            rows = await self._fetch(FRONTIER_CURSOR_SQL, (source, key))
+        except (psycopg.Error, PoolTimeout) as exc:
+            logger.error("DB frontier lookup error for %s: %s", source, exc)
+            return None
+        return rows[0][0] if rows else None
+
+    async def frontier_save_cursor(self, source: str, key: str, payload: str) -> None:
+        try:
+            await self._execute(FRONTIER_SAVE_CURSOR_SQL, (source, key, payload))
+        except (psycopg.Error, PoolTimeout) as exc:
+            logger.error("DB frontier update error for %s: %s", source, exc)
+
+    async def frontier_finish(self, source: str, owner: str, max_attempts: int) -> bool:
+        """Same contract as :meth:`database.DatabaseManager.frontier_finish`."""
+        try:
+            await self._execute(FRONTIER_SETTLE_SQL, (source, owner))
+            return await self._execute(FRONTIER_CLOSE_SQL, (source, source, max_attempts)) > 0
+        except (psycopg.Error, PoolTimeout) as exc:
+            logger.error("DB frontier update error for %s: %s", source, exc)
+            return False
+
+    async def frontier_active(self, sources: list[str], max_attempts: int) -> set[str]:
+        """Same contract as :meth:`database.DatabaseManager.frontier_active`."""
+        try:
+            rows = await self._fetch(FRONTIER_ACTIVE_SQL, (sources, max_attempts))
+        except (psycopg.Error, PoolTimeout) as exc:
+            logger.error("DB frontier lookup error: %s", exc)
+            return set(sources)
+        return {row[0] for row in rows}
+
+    async def touch_listed(self, urls: list[str]) -> None:
+        """Same contract as :meth:`database.DatabaseManager.touch_listed`."""
+        if not urls:
+            return
+        try:
+            await self._execute(TOUCH_SEEN_SQL, (list(urls),))
+        except (psycopg.Error, PoolTimeout) as exc:
+            logger.error("DB listing sync error for %d URLs: %s", len(urls), exc)
+
+    async def sync_listing(self, source_site: str, urls: list[str], complete: bool = False) -> int:
+        """Same contract as :meth:`database.DatabaseManager.sync_listing`."""
+        try:
+            if urls:
+                await self._execute(TOUCH_SEEN_SQL, (list(urls),))
+            return await self._execute(
+                DEACTIVATE_STALE_SQL, (source_site, STALE_AFTER_DAYS, complete and bool(urls), list(urls)),
+            )
+        except (psycopg.Error, PoolTimeout) as exc:
+            logger.error("DB listing sync error for %s: %s", source_site, exc)
+            return 0
+
+
+# Either backend; scrapers talk to it through ``database.db_call``
+AnyDatabase = Union[DatabaseManager, AsyncDatabaseManager]
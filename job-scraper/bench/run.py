@@ -0,0 +1,467 @@
+"""Offline benchmarks for every scraper stage.
+
+Replays the recorded pages in ``bench/fixtures`` — python.org listing and
+detail pages, a SimplifyJobs search API payload and its rendered DOM —
+scaled up to any number of jobs, so nothing touches python.org,
+simplify.jobs or a live database unless asked to::
+
+    python bench/run.py                              # scales 10, 100, 1000
+    python bench/run.py --scales 10,1000,100000 --only parse_listing,db_write
+    python bench/run.py --save-baseline              # store as bench/baseline.json
+    python bench/run.py --database-url postgresql://…  # DB write path on a real Postgres
+    python bench/run.py --browser                    # also replay through Playwright
+
+Each result is compared with the stored baseline; a stage whose median
+per-job latency got more than ``--tolerance`` slower is a regression and
+makes the exit status 1.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import copy
+import json
+import logging
+import math
+import os
+import platform
+import re
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx  # noqa: E402
+from bs4 import BeautifulSoup  # noqa: E402
+
+from classifier import classify  # noqa: E402
+from database import JobBatcher, with_content_hash  # noqa: E402
+from http_client import HttpFetcher  # noqa: E402
+from json_extract import JsonJobExtractor  # noqa: E402
+from scrapers import PythonOrgScraper, SimplifyJobsScraper  # noqa: E402
+from utils import (  # noqa: E402
+    CrawlBudget,
+    HostThrottle,
+    extract_salary,
+    infer_experience_level,
+    infer_location_requirement,
+)
+
+BENCH_DIR = Path(__file__).resolve().parent
+FIXTURES_DIR = BENCH_DIR / "fixtures"
+BASELINE_PATH = BENCH_DIR / "baseline.json"
+DEFAULT_SCALES = (10, 100, 1000)
+# Cards per replayed python.org listing page
+LISTING_PAGE_SIZE = 25
+BENCH_SITE = "Benchmark"
+
+
+# -- fixtures ---------------------------------------------------------------
+
+class Fixtures:
+    """The recorded pages, and copies of them scaled to *n* jobs."""
+
+    _LISTING_ITEM = re.compile(r"<li>\s*<h2 class=\"listing-company\">.*?</li>", re.DOTALL)
+    _LISTING_BODY = re.compile(r"(<ol class=\"list-recent-jobs[^\"]*\">).*?(</ol>)", re.DOTALL)
+    _PAGINATION = re.compile(r"<ul class=\"pagination menu\">.*?</ul>", re.DOTALL)
+    _DOM_CARD = re.compile(r"<button class=\"flex w-full.*?</button>", re.DOTALL)
+    _DOM_BODY = re.compile(r"(<div class=\"flex flex-col gap-2\" role=\"list\">).*?(</div>\s*</main>)", re.DOTALL)
+
+    def __init__(self, directory: Path = FIXTURES_DIR) -> None:
+        self.listing_html = (directory / "python_listing.html").read_text()
+        self.detail_html = (directory / "python_detail.html").read_text()
+        self.dom_html = (directory / "simplify_dom.html").read_text()
+        self.search_payload = json.loads((directory / "simplify_search.json").read_text())
+        self._listing_items = self._LISTING_ITEM.findall(self.listing_html)
+        self._dom_cards = self._DOM_CARD.findall(self.dom_html)
+        self._hits = self.search_payload["results"][0]["hits"]
+
+    def listing_page(self, count: int, first_id: int = 0, pages: int = 1) -> str:
+        """A listing page of *count* cards (ids from *first_id*) linking *pages* pages."""
+        items = [
+            re.sub(r"/jobs/\d+/", f"/jobs/{first_id + i}/", self._listing_items[i % len(self._listing_items)], count=1)
+            for i in range(count)
+        ]
+        html = self._LISTING_BODY.sub(lambda m: m.group(1) + "\n".join(items) + m.group(2), self.listing_html)
+        links = "".join(f'<li><a href="?page={n}">{n}</a></li>' for n in range(1, pages + 1))
+        return self._PAGINATION.sub(f'<ul class="pagination menu">{links}</ul>', html)
+
+    def dom_page(self, count: int) -> str:
+        cards = [self._dom_cards[i % len(self._dom_cards)] for i in range(count)]
+        return self._DOM_BODY.sub(lambda m: m.group(1) + "\n".join(cards) + m.group(2), self.dom_html)
+
+    def api_jobs(self, count: int) -> list[dict[str, Any]]:
+        jobs = []
+        for i in range(count):
+            job = copy.deepcopy(self._hits[i % len(self._hits)]["document"])
+            job["id"] = f"{job['id']}-{i}"
+            jobs.append(job)
+        return jobs
+
+    def search_response(self, count: int) -> dict[str, Any]:
+        payload = copy.deepcopy(self.search_payload)
+        template = self._hits[0]
+        payload["results"][0]["hits"] = [{**template, "document": job} for job in self.api_jobs(count)]
+        return payload
+
+    def descriptions(self, count: int) -> list[tuple[str, str, str]]:
+        """``(title, location, description)`` triples for the inference benchmarks."""
+        detail = PythonOrgScraper._parse_detail(self.detail_html)
+        samples = [("Senior Backend Engineer (Python/Django)", "Remote, United States", detail)]
+        samples += [
+            (job["title"], ", ".join(job["locations"]), job["description"])
+            for job in (hit["document"] for hit in self._hits)
+        ]
+        return [samples[i % len(samples)] for i in range(count)]
+
+
+# -- stand-ins --------------------------------------------------------------
+
+class MemoryDatabase:
+    """In-memory stand-in for the database managers' scraper-facing methods.
+
+    Applies the same ``sourceUrl`` / content-hash upsert rules, so the
+    hashing and batching work of a real write is still measured.
+    """
+
+    def __init__(self) -> None:
+        self.rows: dict[str, str] = {}
+
+    def connect(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def insert_jobs(self, batch: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        inserted = []
+        for job in with_content_hash(batch):
+            if job["sourceUrl"] not in self.rows:
+                inserted.append(job)
+            self.rows[job["sourceUrl"]] = job["contentHash"]
+        return inserted
+
+    def existing_source_urls(self, urls: list[str]) -> set[str]:
+        return {url for url in urls if url in self.rows}
+
+    def sync_listing(self, source_site: str, urls: list[str], complete: bool = False) -> int:
+        return 0
+
+
+def replay_transport(fx: Fixtures, total: int) -> httpx.MockTransport:
+    """Serves a python.org with *total* jobs over ``LISTING_PAGE_SIZE``-card pages."""
+    pages = max(1, math.ceil(total / LISTING_PAGE_SIZE))
+    listing_path = urlsplit(PythonOrgScraper.LISTING_URL).path
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        if request.url.path == listing_path:
+            page = int(parse_qs(request.url.query.decode()).get("page", ["1"])[0])
+            first = (page - 1) * LISTING_PAGE_SIZE
+            count = max(0, min(LISTING_PAGE_SIZE, total - first))
+            return httpx.Response(200, text=fx.listing_page(count, first, pages))
+        return httpx.Response(200, text=fx.detail_html)
+
+    return httpx.MockTransport(handle)
+
+
+def unthrottled(scraper: PythonOrgScraper, total: int) -> PythonOrgScraper:
+    """Lift the politeness pauses and crawl limits: measure work, not waiting."""
+    scraper.throttle = HostThrottle.unlimited()
+    scraper.budget = CrawlBudget(max_jobs=total, max_seconds=math.inf, max_bytes=2**62)
+    scraper.max_pages = math.ceil(total / LISTING_PAGE_SIZE)
+    return scraper
+
+
+# -- measurement ------------------------------------------------------------
+
+@dataclass
+class Result:
+    name: str
+    scale: int
+    items: int
+    seconds: float
+    p50: float  # seconds per call
+    p95: float
+    batch: int = 1  # jobs per call
+
+    @property
+    def per_item(self) -> float:
+        """Median seconds per job — what the baseline comparison uses."""
+        return self.p50 / self.batch
+
+    @property
+    def rate(self) -> float:
+        return self.items / self.seconds if self.seconds else 0.0
+
+
+def timed_calls(name: str, scale: int, calls: list[Callable[[], Any]], items_per_call: int = 1) -> Result:
+    """Time each call; small batches are repeated until about 2000 jobs were processed."""
+    rounds = max(1, min(100, 2000 // (len(calls) * items_per_call)))
+    calls[0]()  # warm-up: imports, regex compilation, first-use caches
+    latencies = []
+    for call in calls * rounds:
+        start = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    return Result(
+        name, scale, len(latencies) * items_per_call, sum(latencies),
+        statistics.median(latencies), latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+        items_per_call,
+    )
+
+
+# -- benchmarks -------------------------------------------------------------
+
+def bench_parse_listing(fx: Fixtures, scale: int, args: argparse.Namespace) -> Result:
+    scraper = PythonOrgScraper(None, MemoryDatabase(), http=HttpFetcher())
+    html = fx.listing_page(scale)
+    return timed_calls("parse_listing", scale, [lambda: scraper._parse_listing_page(html)], scale)
+
+
+def bench_parse_detail(fx: Fixtures, scale: int, args: argparse.Namespace) -> Result:
+    scraper = PythonOrgScraper(None, MemoryDatabase(), http=HttpFetcher())
+    card = {"title": "Senior Backend Engineer", "companyName": "Northwind", "location": "Remote", "sourceUrl": "x"}
+    return timed_calls("parse_detail", scale, [lambda: scraper.map_job((card, fx.detail_html))] * scale)
+
+
+def bench_parse_dom_card(fx: Fixtures, scale: int, args: argparse.Namespace) -> Result:
+    scraper = SimplifyJobsScraper(None, MemoryDatabase())  # type: ignore[arg-type]
+    cards = BeautifulSoup(fx.dom_page(scale), "lxml").select("button:has(h3)")
+    return timed_calls("parse_dom_card", scale, [lambda i=i, c=c: scraper._parse_dom_card(c, i) for i, c in enumerate(cards)])
+
+
+def bench_extract_json_cold(fx: Fixtures, scale: int, args: argparse.Namespace) -> Result:
+    payload = fx.search_response(scale)
+    url = "https://api.simplify.test/multi_search"
+    return timed_calls("extract_json_cold", scale, [lambda: JsonJobExtractor().extract(url, payload)], scale)
+
+
+def bench_extract_json_warm(fx: Fixtures, scale: int, args: argparse.Namespace) -> Result:
+    payload = fx.search_response(scale)
+    url = "https://api.simplify.test/multi_search"
+    extractor = JsonJobExtractor()
+    extractor.extract(url, payload)
+    return timed_calls("extract_json_warm", scale, [lambda: extractor.extract(url, payload)], scale)
+
+
+def bench_map_api_job(fx: Fixtures, scale: int, args: argparse.Namespace) -> Result:
+    scraper = SimplifyJobsScraper(None, MemoryDatabase())  # type: ignore[arg-type]
+    return timed_calls("map_api_job", scale, [lambda job=job: scraper._map_api_job(job) for job in fx.api_jobs(scale)])
+
+
+def bench_inference_utils(fx: Fixtures, scale: int, args: argparse.Namespace) -> Result:
+    def infer(title: str, location: str, description: str) -> None:
+        extract_salary(description)
+        infer_experience_level(title, description)
+        infer_location_requirement(title, location, description)
+
+    return timed_calls("inference_utils", scale, [lambda s=s: infer(*s) for s in fx.descriptions(scale)])
+
+
+def bench_inference_classify(fx: Fixtures, scale: int, args: argparse.Namespace) -> Result:
+    return timed_calls("inference_classify", scale, [lambda s=s: classify(*s) for s in fx.descriptions(scale)])
+
+
+def bench_db_write(fx: Fixtures, scale: int, args: argparse.Namespace) -> Result:
+    template = PythonOrgScraper._fill_defaults(
+        {"title": "Senior Backend Engineer", "companyName": "Northwind", "location": "Remote"},
+        PythonOrgScraper._parse_detail(fx.detail_html),
+    )
+    run_id = time.time_ns()
+    jobs = [
+        {**template, "sourceSite": BENCH_SITE, "sourceUrl": f"https://bench.invalid/{run_id}/{i}"}
+        for i in range(scale)
+    ]
+    db = args.database() if args.database else MemoryDatabase()
+    db.connect()
+    try:
+        batcher = JobBatcher(db, source="bench")
+        flushes: list[float] = []  # latency of each round trip
+
+        async def write() -> float:
+            start = time.perf_counter()
+            for job in jobs:
+                before = time.perf_counter()
+                await batcher.add(job)
+                if not batcher._pending:
+                    flushes.append(time.perf_counter() - before)
+            if batcher._pending:
+                before = time.perf_counter()
+                await batcher.flush()
+                flushes.append(time.perf_counter() - before)
+            return time.perf_counter() - start
+
+        seconds = asyncio.run(write())
+    finally:
+        if args.database:
+            with db.conn.cursor() as cur:
+                cur.execute('DELETE FROM scraped_jobs WHERE "sourceSite" = %s', (BENCH_SITE,))
+        db.close()
+    flushes.sort()
+    return Result(
+        "db_write", scale, scale, seconds, statistics.median(flushes), flushes[int(len(flushes) * 0.95)],
+        min(scale, batcher.batch_size),
+    )
+
+
+def bench_e2e_http(fx: Fixtures, scale: int, args: argparse.Namespace) -> Result:
+    async def run() -> int:
+        http = HttpFetcher(transport=replay_transport(fx, scale))
+        try:
+            scraper = unthrottled(PythonOrgScraper(None, MemoryDatabase(), http=http), scale)
+            return await scraper.scrape()
+        finally:
+            await http.close()
+
+    start = time.perf_counter()
+    inserted = asyncio.run(run())
+    seconds = time.perf_counter() - start
+    return Result("e2e_http", scale, inserted, seconds, seconds / max(1, inserted), seconds / max(1, inserted))
+
+
+def bench_e2e_browser(fx: Fixtures, scale: int, args: argparse.Namespace) -> Result:
+    from playwright.async_api import Route, async_playwright
+
+    transport = replay_transport(fx, scale)
+
+    async def fulfil(route: Route) -> None:
+        response = transport.handle_request(httpx.Request("GET", route.request.url))
+        await route.fulfill(status=response.status_code, body=response.text, content_type="text/html")
+
+    async def run() -> int:
+        async with async_playwright() as pw:
+            browser = await pw.chromium.launch()
+            try:
+                page = await browser.new_page()
+                await page.route("**/*", fulfil)
+                scraper = unthrottled(PythonOrgScraper(page, MemoryDatabase()), scale)
+                return await scraper.scrape()
+            finally:
+                await browser.close()
+
+    start = time.perf_counter()
+    inserted = asyncio.run(run())
+    seconds = time.perf_counter() - start
+    return Result("e2e_browser", scale, inserted, seconds, seconds / max(1, inserted), seconds / max(1, inserted))
+
+
+BENCHMARKS: dict[str, Callable[[Fixtures, int, argparse.Namespace], Result]] = {
+    "parse_listing": bench_parse_listing,
+    "parse_detail": bench_parse_detail,
+    "parse_dom_card": bench_parse_dom_card,
+    "extract_json_cold": bench_extract_json_cold,
+    "extract_json_warm": bench_extract_json_warm,
+    "map_api_job": bench_map_api_job,
+    "inference_utils": bench_inference_utils,
+    "inference_classify": bench_inference_classify,
+    "db_write": bench_db_write,
+    "e2e_http": bench_e2e_http,
+    "e2e_browser": bench_e2e_browser,
+}
+# Need a browser; only run with --browser
+BROWSER_BENCHMARKS = {"e2e_browser"}
+
+
+# -- baseline ---------------------------------------------------------------
+
+def compare(results: list[Result], baseline: dict[str, Any], tolerance: float) -> list[str]:
+    """Print the results table; returns the keys that regressed."""
+    regressions = []
+    print(f"{'benchmark':<20} {'scale':>7} {'jobs/s':>12} {'p50':>11} {'p95':>11} {'vs baseline':>12}")
+    for result in results:
+        key = f"{result.name}@{result.scale}"
+        base = baseline.get(key, {}).get("per_item")
+        delta = ""
+        if base:
+            change = result.per_item / base - 1
+            delta = f"{change:+.1%}"
+            if change > tolerance:
+                regressions.append(key)
+                delta += "  REGRESSION"
+        print(
+            f"{result.name:<20} {result.scale:>7} {result.rate:>12,.0f} "
+            f"{_fmt_seconds(result.p50):>11} {_fmt_seconds(result.p95):>11} {delta:>12}"
+        )
+    return regressions
+
+
+def _fmt_seconds(seconds: float) -> str:
+    if seconds >= 1:
+        return f"{seconds:.2f}s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds * 1e6:.1f}µs"
+
+
+def as_json(results: list[Result]) -> dict[str, Any]:
+    return {
+        "createdAt": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "machine": platform.platform(),
+        "results": {
+            f"{r.name}@{r.scale}": {**asdict(r), "per_item": r.per_item, "rate": r.rate} for r in results
+        },
+    }
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Offline benchmarks for the job scraper.")
+    parser.add_argument("--scales", default=",".join(map(str, DEFAULT_SCALES)),
+                        help="Comma-separated job counts (default: %(default)s).")
+    parser.add_argument("--only", help="Comma-separated benchmarks to run (default: all).")
+    parser.add_argument("--browser", action="store_true", help="Also replay through Playwright route fulfilment.")
+    parser.add_argument("--database-url", help="Measure the DB write path on this Postgres instead of in memory.")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="Baseline file (default: %(default)s).")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the new baseline.")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Slowdown per job counted as a regression (default: %(default)s).")
+    parser.add_argument("--output", type=Path, help="Also write this run's results as JSON here.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = parse_args(argv)
+    logging.disable(logging.INFO)  # scrapers log every job
+    args.database = None
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+        from database import DatabaseManager
+        args.database = DatabaseManager
+
+    names = args.only.split(",") if args.only else [
+        name for name in BENCHMARKS if args.browser or name not in BROWSER_BENCHMARKS
+    ]
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        print(f"Unknown benchmarks: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+
+    fx = Fixtures()
+    results = []
+    for name in names:
+        for scale in (int(s) for s in args.scales.split(",")):
+            results.append(BENCHMARKS[name](fx, scale, args))
+
+    baseline = json.loads(args.baseline.read_text())["results"] if args.baseline.exists() else {}
+    regressions = compare(results, baseline, args.tolerance)
+    report = as_json(results)
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2))
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+    if regressions:
+        print(f"{len(regressions)} regression(s) over {args.tolerance:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
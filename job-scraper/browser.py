@@ -1,17 +1,71 @@
 from __future__ import annotations
 
+import asyncio
 import random
-from typing import Optional
+import time
+from collections import Counter
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+from urllib.parse import urlsplit
 
-from fake_useragent import UserAgent
 from playwright.async_api import (
     Browser,
     BrowserContext,
     Page,
     Playwright,
+    Request,
+    Route,
 )
+from playwright.async_api import Error as PlaywrightError
+
+from metrics import METRICS
+from utils import (
+    BLOCK_RESOURCES,
+    BLOCKED_DOMAINS,
+    BLOCKED_RESOURCE_TYPES,
+    CONTEXT_MAX_HEAP_GROWTH_MB,
+    CONTEXT_MAX_PAGES,
+    CONTEXT_POOL_SIZE,
+    VIEWPORT_POOL,
+    logger,
+    random_user_agent,
+)
+
+LAUNCH_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+]
+
+# Used JS heap of a page, in bytes (0 where performance.memory is missing)
+_HEAP_JS = "() => (performance.memory && performance.memory.usedJSHeapSize) || 0"
+
+
+async def launch_chromium(playwright: Playwright, extra_args: Optional[list[str]] = None) -> Browser:
+    with METRICS.timer("browser_launch_seconds", source=""):
+        return await playwright.chromium.launch(headless=True, args=LAUNCH_ARGS + (extra_args or []))
 
-from utils import VIEWPORT_POOL, logger
+
+async def new_stealth_context(browser: Browser, blocker: Optional[RequestBlocker]) -> tuple[BrowserContext, str, dict[str, int]]:
+    """A context with a freshly rotated User-Agent and viewport, plus *blocker*.
+
+    Returns ``(context, user_agent, viewport)``.
+    """
+    user_agent = random_user_agent()
+    viewport = random.choice(VIEWPORT_POOL)
+    with METRICS.timer("browser_context_seconds", source=""):
+        context = await browser.new_context(
+            user_agent=user_agent,
+            viewport=viewport,
+            locale="en-US",
+            extra_http_headers={
+                "Accept-Language": "en-US,en;q=0.9",
+                "Sec-CH-UA-Platform": '"Linux"',
+            },
+        )
+        if blocker:
+            await blocker.install(context)
+    return context, user_agent, viewport
 
 
 class StealthBrowser:
@@ -22,36 +76,21 @@ class StealthBrowser:
     • Randomly chosen realistic viewport
     • ``--disable-blink-features=AutomationControlled``
     • Extra Accept-Language / Sec-CH-UA headers
+
+    Unless disabled, a :class:`RequestBlocker` on the context aborts images,
+    fonts, stylesheets and known analytics/ad hosts.
     """
 
-    def __init__(self, playwright: Playwright) -> None:
+    def __init__(self, playwright: Playwright, blocker: Optional[RequestBlocker] = None) -> None:
         self._pw = playwright
         self._browser: Optional[Browser] = None
         self._context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        self.blocker = blocker if blocker is not None else (RequestBlocker() if BLOCK_RESOURCES else None)
 
     async def launch(self) -> Page:
-        ua = UserAgent(browsers=["chrome", "edge", "firefox"])
-        user_agent: str = ua.random
-        viewport = random.choice(VIEWPORT_POOL)
-
-        self._browser = await self._pw.chromium.launch(
-            headless=True,
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--no-sandbox",
-                "--disable-dev-shm-usage",
-            ],
-        )
-        self._context = await self._browser.new_context(
-            user_agent=user_agent,
-            viewport=viewport,
-            locale="en-US",
-            extra_http_headers={
-                "Accept-Language": "en-US,en;q=0.9",
-                "Sec-CH-UA-Platform": '"Linux"',
-            },
-        )
+        self._browser = await launch_chromium(self._pw)
+        self._context, user_agent, viewport = await new_stealth_context(self._browser, self.blocker)
         self.page = await self._context.new_page()
         logger.info(
             "Browser launched  UA=%s…  viewport=%sx%s",
@@ -59,9 +98,330 @@ class StealthBrowser:
         )
         return self.page
 
+    def page_pool(self, size: int) -> PagePool:
+        """Return a pool of up to *size* pages sharing this browser's context.
+
+        The page created by :meth:`launch` is handed out first; further pages
+        are opened lazily on demand.
+        """
+        if self._context is None:
+            raise RuntimeError("StealthBrowser.launch() must be called first.")
+        return PagePool(self._context, size, seed=[self.page] if self.page else [])
+
     async def close(self) -> None:
         if self._context:
             await self._context.close()
         if self._browser:
             await self._browser.close()
+        if self.blocker:
+            self.blocker.log_summary()
         logger.info("Browser closed.")
+
+
+class RequestBlocker:
+    """Context-wide request router that aborts what we never read.
+
+    Requests are aborted by resource type (``image``, ``font``, …) or when
+    their host matches a blocklisted domain (or any of its subdomains).
+    Documents, scripts and XHR/fetch responses — which
+    ``SimplifyJobsScraper`` intercepts — are only ever blocked by domain.
+    Counts blocked requests and the bytes actually transferred (headers
+    and body, as Playwright measured them) into ``METRICS``.  Blocked
+    requests never load, so their size is unknown: compare the transferred
+    bytes of a run with ``SCRAPER_BLOCK_RESOURCES=0`` to see the savings.
+    """
+
+    NEVER_BLOCK_TYPES = frozenset({"document", "script", "xhr", "fetch"})
+
+    def __init__(
+        self,
+        resource_types: frozenset[str] = BLOCKED_RESOURCE_TYPES,
+        domains: tuple[str, ...] = BLOCKED_DOMAINS,
+    ) -> None:
+        self.resource_types = resource_types - self.NEVER_BLOCK_TYPES
+        self.domains = tuple(d.lower().lstrip(".") for d in domains)
+        self.blocked: Counter[str] = Counter()
+        self.allowed = 0
+        self.bytes_transferred = 0
+
+    async def install(self, context: BrowserContext) -> None:
+        await context.route("**/*", self._handle)
+        context.on("requestfinished", self._on_finished)
+
+    def block_reason(self, request: Request) -> Optional[str]:
+        """Return why *request* should be blocked, or ``None`` to allow it."""
+        host = (urlsplit(request.url).hostname or "").lower()
+        for domain in self.domains:
+            if host == domain or host.endswith("." + domain):
+                return f"domain:{domain}"
+        if request.resource_type in self.resource_types:
+            return f"type:{request.resource_type}"
+        return None
+
+    async def _handle(self, route: Route) -> None:
+        reason = self.block_reason(route.request)
+        # The context is shared by every source, so the counts are the engine's
+        if reason:
+            self.blocked[reason] += 1
+            METRICS.inc("browser_requests_blocked_total", source="")
+            await route.abort("blockedbyclient")
+        else:
+            self.allowed += 1
+            METRICS.inc("browser_requests_allowed_total", source="")
+            await route.continue_()
+
+    async def _on_finished(self, request: Request) -> None:
+        # Unlike Content-Length, also right for chunked and compressed responses
+        try:
+            sizes = await request.sizes()
+        except PlaywrightError:  # the page or context is already gone
+            return
+        size = max(0, sizes["responseHeadersSize"]) + max(0, sizes["responseBodySize"])
+        self.bytes_transferred += size
+        METRICS.inc("browser_bytes_transferred_total", size, source="")
+
+    def log_summary(self) -> None:
+        total = sum(self.blocked.values())
+        logger.info(
+            "Request blocker: blocked %d of %d requests; %.1f KiB transferred by the rest "
+            "(blocked ones not measured).",
+            total, total + self.allowed, self.bytes_transferred / 1024,
+        )
+        for reason, count in self.blocked.most_common():
+            logger.info("  blocked %-40s %d", reason, count)
+
+
+class PagePool:
+    """Bounded set of pages from one ``BrowserContext``.
+
+    Borrow with ``async with pool.page() as page:``; callers block once
+    *size* pages are checked out, which makes the pool the global cap on
+    concurrent navigations.
+    """
+
+    def __init__(self, context: BrowserContext, size: int, seed: Optional[list[Page]] = None) -> None:
+        self._context = context
+        self._size = max(1, size)
+        self._idle: asyncio.Queue[Page] = asyncio.Queue()
+        self._created = 0
+        for page in seed or []:
+            self._idle.put_nowait(page)
+            self._created += 1
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Page]:
+        page = await self._acquire()
+        try:
+            yield page
+        finally:
+            self._idle.put_nowait(page)
+
+    async def _acquire(self) -> Page:
+        if self._idle.empty() and self._created < self._size:
+            self._created += 1
+            try:
+                return await self._context.new_page()
+            except Exception:
+                self._created -= 1
+                raise
+        return await self._idle.get()
+
+
+class PooledContext:
+    """One warm context of a :class:`ContextPool`.
+
+    Offers the same ``page`` / :meth:`page_pool` interface as a launched
+    :class:`StealthBrowser`, and counts the top-level navigations it serves.
+    """
+
+    def __init__(
+        self,
+        browser: Browser,
+        context: BrowserContext,
+        page: Page,
+        blocker: Optional[RequestBlocker],
+        user_agent: str,
+        viewport: dict[str, int],
+    ) -> None:
+        self.browser = browser
+        self.context = context
+        self.page = page
+        self.blocker = blocker
+        self.user_agent = user_agent
+        self.viewport = viewport
+        self.created_at = time.monotonic()
+        self.pages_served = 0
+        self.heap_baseline = 0
+        context.on("request", self._on_request)
+
+    def _on_request(self, request: Request) -> None:
+        try:
+            if request.is_navigation_request() and request.frame.parent_frame is None:
+                self.pages_served += 1
+        except Exception:  # service worker requests have no frame
+            pass
+
+    def page_pool(self, size: int) -> PagePool:
+        return PagePool(self.context, size, seed=[self.page])
+
+    async def heap_used(self) -> int:
+        """Used JS heap over the context's open pages, in bytes."""
+        total = 0
+        for page in self.context.pages:
+            try:
+                total += int(await page.evaluate(_HEAP_JS))
+            except Exception:
+                pass
+        return total
+
+    async def reset(self) -> None:
+        """Close pages a borrower opened and blank the main one."""
+        for page in self.context.pages:
+            if page is not self.page:
+                await page.close()
+        await self.page.goto("about:blank")
+
+    async def close(self) -> None:
+        try:
+            await self.context.close()
+        except Exception as exc:
+            logger.debug("Closing browser context failed: %s", exc)
+        if self.blocker:
+            self.blocker.log_summary()
+
+
+class ContextPool:
+    """Warm browser contexts on one long-lived Chromium, for daemon mode.
+
+    :meth:`start` launches the browser and opens *size* contexts, each with
+    its own rotated User-Agent, viewport and :class:`RequestBlocker`.
+    Borrow one with ``async with pool.borrow() as session:`` instead of
+    cold-starting a browser.  When it comes back its extra pages are closed
+    and its main page blanked; a context that has served *max_pages* pages,
+    or whose JS heap grew by more than *max_heap_growth_mb* while borrowed,
+    is closed and replaced with a fresh one.  Chromium is relaunched if it
+    crashes.
+    """
+
+    def __init__(
+        self,
+        playwright: Playwright,
+        size: int = CONTEXT_POOL_SIZE,
+        max_pages: int = CONTEXT_MAX_PAGES,
+        max_heap_growth_mb: float = CONTEXT_MAX_HEAP_GROWTH_MB,
+    ) -> None:
+        self._pw = playwright
+        self.size = max(1, size)
+        self.max_pages = max_pages
+        self.max_heap_growth = int(max_heap_growth_mb * 1024 * 1024)
+        self._browser: Optional[Browser] = None
+        self._launch_lock = asyncio.Lock()
+        self._idle: asyncio.Queue[PooledContext] = asyncio.Queue()
+        self._created = 0
+
+    async def start(self) -> None:
+        """Launch Chromium and open every context up front."""
+        while self._created < self.size:
+            self._created += 1
+            try:
+                self._idle.put_nowait(await self._new_context())
+            except Exception:
+                self._created -= 1
+                raise
+        logger.info("Context pool warm: %d contexts.", self.size)
+
+    @asynccontextmanager
+    async def borrow(self) -> AsyncIterator[PooledContext]:
+        session = await self._acquire()
+        try:
+            yield session
+        finally:
+            await self._release(session)
+
+    async def close(self) -> None:
+        while not self._idle.empty():
+            await self._idle.get_nowait().close()
+        self._created = 0
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception as exc:
+                logger.debug("Closing browser failed: %s", exc)
+            self._browser = None
+        logger.info("Context pool closed.")
+
+    # -- internals ----------------------------------------------------------
+
+    async def _ensure_browser(self) -> Browser:
+        async with self._launch_lock:
+            if self._browser is None or not self._browser.is_connected():
+                if self._browser is not None:
+                    logger.warning("Browser disconnected — relaunching.")
+                # Unquantised performance.memory for the heap-growth check
+                self._browser = await launch_chromium(self._pw, ["--enable-precise-memory-info"])
+            return self._browser
+
+    async def _new_context(self) -> PooledContext:
+        browser = await self._ensure_browser()
+        blocker = RequestBlocker() if BLOCK_RESOURCES else None
+        context, user_agent, viewport = await new_stealth_context(browser, blocker)
+        session = PooledContext(browser, context, await context.new_page(), blocker, user_agent, viewport)
+        session.heap_baseline = await session.heap_used()
+        METRICS.inc("browser_contexts_created_total", source="")
+        logger.info(
+            "Browser context opened  UA=%s…  viewport=%sx%s",
+            user_agent[:50], viewport["width"], viewport["height"],
+        )
+        return session
+
+    async def _acquire(self) -> PooledContext:
+        if self._idle.empty() and self._created < self.size:
+            self._created += 1
+            try:
+                return await self._new_context()
+            except Exception:
+                self._created -= 1
+                raise
+        session = await self._idle.get()
+        if session.browser.is_connected():
+            return session
+        # Its browser crashed while the context sat idle
+        await session.close()
+        try:
+            return await self._new_context()
+        except Exception:
+            self._created -= 1
+            raise
+
+    def _recycle_reason(self, session: PooledContext, heap: int) -> Optional[str]:
+        if not session.browser.is_connected():
+            return "browser disconnected"
+        if session.pages_served >= self.max_pages:
+            return f"{session.pages_served} pages served"
+        if heap - session.heap_baseline > self.max_heap_growth:
+            return f"heap grew {(heap - session.heap_baseline) / 1024 / 1024:.0f} MiB"
+        return None
+
+    async def _release(self, session: PooledContext) -> None:
+        reason = self._recycle_reason(session, await session.heap_used())
+        if reason is None:
+            try:
+                await session.reset()
+            except Exception as exc:
+                reason = f"reset failed: {exc}"
+        if reason is None:
+            self._idle.put_nowait(session)
+            return
+        logger.info("Recycling browser context (%s).", reason)
+        METRICS.inc("browser_contexts_recycled_total", source="")
+        await session.close()
+        try:
+            self._idle.put_nowait(await self._new_context())
+        except Exception as exc:
+            # The next borrow opens one instead
+            logger.warning("Could not replace browser context: %s", exc)
+            self._created -= 1
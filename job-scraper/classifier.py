@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from utils import extract_salary, infer_experience_level, infer_location_requirement
+
+# Every rule of ``utils.extract_salary`` and ``utils.infer_experience_level``,
+# compiled once at import and kept in the originals' priority order, as
+# (label, literals, pattern).  A pattern can only match if one of its
+# *literals* occurs in the lowercased text, so most rules are skipped with a
+# plain substring check.  Salary rules stay case-insensitive, the others run
+# on lowercased text, exactly like the originals.
+_SALARY_RULES: list[tuple[str, tuple[str, ...], re.Pattern[str]]] = [
+    ("", ("$",), re.compile(
+        r"\$[\d,]+(?:\s*[-–—to]+\s*\$?[\d,]+)?(?:\s*(?:per\s+)?(?:year|yr|annum|annually|hour|hr|month|mo))?",
+        re.IGNORECASE,
+    )),
+    ("", ("usd", "eur", "gbp"), re.compile(r"(?:USD|EUR|GBP)\s*[\d,]+(?:\s*[-–—to]+\s*[\d,]+)?", re.IGNORECASE)),
+    ("", ("usd", "eur", "gbp"), re.compile(r"[\d,]+\s*(?:USD|EUR|GBP)", re.IGNORECASE)),
+]
+_EXPERIENCE_RULES: list[tuple[str, tuple[str, ...], re.Pattern[str]]] = [
+    ("Intern", ("intern",), re.compile(r"\b(?:intern|internship)\b")),
+    ("Junior", ("junior", "entry"), re.compile(r"\bjunior\b|entry[\s-]?level")),
+    ("Mid", ("mid", "intermediate"), re.compile(r"\bmid[\s-]?level\b|\bintermediate\b")),
+    ("Senior", ("senior", "sr"), re.compile(r"\bsenior\b|\bsr\.?\b")),
+    ("Lead", ("lead", "principal", "staff"), re.compile(r"\b(?:lead|principal|staff)\b")),
+    ("Director", ("director", "head of", "vp", "vice president"),
+     re.compile(r"\b(?:director|head of|vp|vice president)\b")),
+]
+# IGNORECASE also folds 'ſ' (U+017F) onto 's' — the only non-ASCII character
+# that can complete a currency code — so its presence disables the shortcut.
+_LONG_S = "ſ"
+
+
+@dataclass(frozen=True)
+class Classification:
+    salary: Optional[str]
+    experience_level: Optional[str]
+    location_requirement: str
+
+
+def classify(title: str, location: str, description: str) -> Classification:
+    """Infer salary, experience level and location requirement together.
+
+    Returns exactly what ``extract_salary(description)``,
+    ``infer_experience_level(title, description)`` and
+    ``infer_location_requirement(title, location, description)`` would, but
+    builds and lowercases the text once and only runs a compiled pattern
+    when a substring check shows it can match.
+    """
+    text = f"{title} {description}"
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        # Rare: case mapping changed the length, so spans no longer line up
+        return _classify_reference(title, location, description)
+    desc_start = len(title) + 1
+
+    salary: Optional[str] = None
+    long_s = _LONG_S in lowered
+    for _, literals, pattern in _SALARY_RULES:
+        if long_s or any(lit in lowered for lit in literals):
+            # No salary pattern looks behind, so searching from desc_start
+            # is the same as searching the description alone.
+            match = pattern.search(lowered, desc_start)
+            if match:
+                salary = text[match.start():match.end()].strip()
+                break
+
+    experience: Optional[str] = None
+    for label, literals, pattern in _EXPERIENCE_RULES:
+        if any(lit in lowered for lit in literals) and pattern.search(lowered):
+            experience = label
+            break
+
+    # Keywords contain no spaces, so a match never spans the joined parts
+    loc_lowered = location.lower()
+    if any(kw in part for part in (lowered, loc_lowered) for kw in ("remote", "telecommut")):
+        loc_req = "Remote"
+    elif "hybrid" in lowered or "hybrid" in loc_lowered:
+        loc_req = "Hybrid"
+    else:
+        loc_req = "On-site"
+
+    return Classification(salary, experience, loc_req)
+
+
+def classify_many(jobs: Iterable[tuple[str, str, str]]) -> list[Classification]:
+    """Batch form of :func:`classify` for ``(title, location, description)`` tuples."""
+    return [classify(title, location, description) for title, location, description in jobs]
+
+
+def _classify_reference(title: str, location: str, description: str) -> Classification:
+    return Classification(
+        extract_salary(description),
+        infer_experience_level(title, description),
+        infer_location_requirement(title, location, description),
+    )
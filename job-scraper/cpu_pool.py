@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from utils import logger
+
+T = TypeVar("T")
+
+# SCRAPER_CPU_WORKERS > 0 moves parsing and mapping into that many worker
+# processes, so the event loop (and Playwright's callbacks on it) never
+# waits on the GIL; 0 keeps them in threads of this process.
+CPU_WORKERS = int(os.getenv("SCRAPER_CPU_WORKERS", "0"))
+# Items handed to a worker per round trip, to amortise pickling
+CPU_BATCH_SIZE = int(os.getenv("SCRAPER_CPU_BATCH_SIZE", "16"))
+# "spawn" avoids forking a process that runs threads and an event loop
+CPU_START_METHOD = os.getenv("SCRAPER_CPU_START_METHOD", "spawn")
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def enabled() -> bool:
+    return CPU_WORKERS > 0
+
+
+def process_pool() -> ProcessPoolExecutor:
+    """The shared worker pool, started on first use."""
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(
+            max_workers=CPU_WORKERS,
+            mp_context=multiprocessing.get_context(CPU_START_METHOD),
+        )
+        logger.info("CPU offload: %d worker processes (%s).", CPU_WORKERS, CPU_START_METHOD)
+    return _pool
+
+
+async def start() -> None:
+    """Spawn the workers up front: starting one blocks, so not on the event loop."""
+    if enabled():
+        await asyncio.to_thread(_warm_up)
+
+
+def _warm_up() -> None:
+    # A task per worker makes the executor start all of them
+    list(process_pool().map(abs, range(CPU_WORKERS)))
+
+
+def shutdown() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(cancel_futures=True)
+        _pool = None
+
+
+async def run(fn: Callable[..., T], *args: Any) -> T:
+    """``fn(*args)`` off the event loop: in a worker process if enabled, else a thread.
+
+    *fn* and its arguments must be picklable (module-level functions,
+    plain data) for the process mode.
+    """
+    if enabled():
+        return await asyncio.get_running_loop().run_in_executor(process_pool(), fn, *args)
+    return await asyncio.to_thread(fn, *args)
+
+
+def map_batch(fn: Callable[[Any], T], items: list[Any]) -> list[tuple[Optional[T], Optional[str], float]]:
+    """``(result, error, seconds)`` of ``fn(item)`` for each of *items*.
+
+    Runs in a worker process.  A failing item doesn't fail the batch; its
+    error comes back as text, since not every exception pickles.
+    """
+    outcomes: list[tuple[Optional[T], Optional[str], float]] = []
+    for item in items:
+        start = time.perf_counter()
+        try:
+            outcomes.append((fn(item), None, time.perf_counter() - start))
+        except Exception as exc:
+            outcomes.append((None, f"{type(exc).__name__}: {exc}", time.perf_counter() - start))
+    return outcomes
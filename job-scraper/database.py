@@ -1,14 +1,19 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import inspect
 import os
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Optional
 
 import psycopg2
 import psycopg2.extras
 from dotenv import load_dotenv
 
-from utils import logger
+from job_terms import term_params
+from metrics import METRICS
+from utils import DB_BATCH_SIZE, STALE_AFTER_DAYS, logger
 
 # Resolve the project-root .env file
 _PROJECT_ROOT = Path(__file__).resolve().parent.parent
@@ -16,26 +21,257 @@ _ENV_PATH = _PROJECT_ROOT / ".env"
 load_dotenv(dotenv_path=_ENV_PATH)
 
 # SQL
+# Hashed content columns: a re-scraped posting only rewrites its row when
+# one of these changed.
+CONTENT_COLUMNS = (
+    "title", "companyName", "description", "wage", "locationRequirement",
+    "experienceLevel", "location", "postedAt",
+)
+
+# Shared conflict clause: an edited posting is updated in place, an
+# unchanged one is left alone.  RETURNING reports which rows were new
+# (xmax = 0) and which were updated.
+ON_CONFLICT_SQL = """
+ON CONFLICT ("sourceUrl") DO UPDATE SET
+    title = EXCLUDED.title,
+    "companyName" = EXCLUDED."companyName",
+    description = EXCLUDED.description,
+    wage = EXCLUDED.wage,
+    "wageMin" = EXCLUDED."wageMin",
+    "wageMax" = EXCLUDED."wageMax",
+    "wageCurrency" = EXCLUDED."wageCurrency",
+    "wagePeriod" = EXCLUDED."wagePeriod",
+    "wageAnnualized" = EXCLUDED."wageAnnualized",
+    "locationRequirement" = EXCLUDED."locationRequirement",
+    "experienceLevel" = EXCLUDED."experienceLevel",
+    location = EXCLUDED.location,
+    "postedAt" = EXCLUDED."postedAt",
+    "contentHash" = EXCLUDED."contentHash",
+    "lastSeenAt" = now(),
+    "isActive" = true
+WHERE scraped_jobs."contentHash" IS DISTINCT FROM EXCLUDED."contentHash"
+RETURNING "sourceUrl", (xmax = 0) AS inserted
+"""
+
 UPSERT_SQL = """
 INSERT INTO scraped_jobs (
     title, "companyName", description, wage,
+    "wageMin", "wageMax", "wageCurrency", "wagePeriod", "wageAnnualized",
     "locationRequirement", "experienceLevel", location,
-    "sourceUrl", "sourceSite", "postedAt"
+    "sourceUrl", "sourceSite", "postedAt", "contentHash"
 ) VALUES (
     %(title)s, %(companyName)s, %(description)s, %(wage)s,
+    %(wageMin)s, %(wageMax)s, %(wageCurrency)s, %(wagePeriod)s, %(wageAnnualized)s,
     %(locationRequirement)s, %(experienceLevel)s, %(location)s,
-    %(sourceUrl)s, %(sourceSite)s, %(postedAt)s
+    %(sourceUrl)s, %(sourceSite)s, %(postedAt)s, %(contentHash)s
+)""" + ON_CONFLICT_SQL
+
+# Multi-row variant of UPSERT_SQL for ``psycopg2.extras.execute_values``
+BULK_UPSERT_SQL = """
+INSERT INTO scraped_jobs (
+    title, "companyName", description, wage,
+    "wageMin", "wageMax", "wageCurrency", "wagePeriod", "wageAnnualized",
+    "locationRequirement", "experienceLevel", location,
+    "sourceUrl", "sourceSite", "postedAt", "contentHash"
+) VALUES %s""" + ON_CONFLICT_SQL
+
+BULK_UPSERT_TEMPLATE = """(
+    %(title)s, %(companyName)s, %(description)s, %(wage)s,
+    %(wageMin)s, %(wageMax)s, %(wageCurrency)s, %(wagePeriod)s, %(wageAnnualized)s,
+    %(locationRequirement)s, %(experienceLevel)s, %(location)s,
+    %(sourceUrl)s, %(sourceSite)s, %(postedAt)s, %(contentHash)s
+)"""
+
+EXISTING_URLS_SQL = """
+SELECT "sourceUrl" FROM scraped_jobs WHERE "sourceUrl" = ANY(%s);
+"""
+
+# The database's clock, which also stamps scrapedAt
+DB_NOW_SQL = """
+SELECT extract(epoch FROM now())::float8;
+"""
+
+# scrapedAt is only set on insert, so this counts new postings
+COUNT_NEW_SQL = """
+SELECT count(*) FROM scraped_jobs WHERE "sourceSite" = %s AND "scrapedAt" >= to_timestamp(%s);
+"""
+
+# Listing sync: postings seen on a listing are (re)activated; postings of
+# that source not seen for STALE_AFTER_DAYS — or, after a complete listing
+# walk, not seen at all — are marked inactive.
+TOUCH_SEEN_SQL = """
+UPDATE scraped_jobs SET "lastSeenAt" = now(), "isActive" = true
+WHERE "sourceUrl" = ANY(%s);
+"""
+
+DEACTIVATE_STALE_SQL = """
+UPDATE scraped_jobs SET "isActive" = false
+WHERE "sourceSite" = %s AND "isActive"
+  AND ("lastSeenAt" < now() - make_interval(days => %s) OR (%s AND NOT ("sourceUrl" = ANY(%s))));
+"""
+
+# Search index: brings the terms of the given (new or changed) postings up
+# to date.  Stale entries are deleted and missing ones added in the same
+# statement, so running it twice is harmless.
+INDEX_TERMS_SQL = """
+WITH terms AS (
+    SELECT j.id AS "jobId", t.field, t.term
+    FROM unnest(%s::text[], %s::varchar[], %s::varchar[]) AS t(url, field, term)
+    JOIN scraped_jobs j ON j."sourceUrl" = t.url
+), stale AS (
+    DELETE FROM scraped_job_terms s
+    USING scraped_jobs j
+    WHERE j."sourceUrl" = ANY(%s) AND s."jobId" = j.id
+      AND NOT EXISTS (
+          SELECT 1 FROM terms
+          WHERE terms."jobId" = s."jobId" AND terms.field = s.field AND terms.term = s.term
+      )
+)
+INSERT INTO scraped_job_terms ("jobId", field, term)
+SELECT "jobId", field, term FROM terms
+ON CONFLICT DO NOTHING;
+"""
+
+# Keyset-paginated scan for rebuilding the search index
+JOBS_PAGE_SQL = """
+SELECT "sourceUrl", title, description FROM scraped_jobs
+WHERE "sourceUrl" > %s ORDER BY "sourceUrl" LIMIT %s;
+"""
+REINDEX_BATCH_SIZE = 500
+
+# Crawl frontier (see frontier.py).  Items are keyed per source; leasing
+# skips rows another run has locked, so concurrent runs split the work.
+FRONTIER_ADD_SQL = """
+INSERT INTO scrape_frontier (source, key, kind, payload)
+SELECT %s, t.key, %s, t.payload::jsonb FROM unnest(%s::text[], %s::text[]) AS t(key, payload)
+ON CONFLICT DO NOTHING;
+"""
+
+FRONTIER_LEASE_SQL = """
+WITH claimable AS (
+    SELECT key FROM scrape_frontier
+    WHERE source = %s AND kind = %s AND attempts < %s
+      AND (status = 'pending' OR (status = 'leased' AND "leaseExpiresAt" < now()))
+      AND (%s::text[] IS NULL OR key = ANY(%s::text[]))
+    ORDER BY "createdAt", key
+    LIMIT %s
+    FOR UPDATE SKIP LOCKED
 )
-ON CONFLICT ("sourceUrl") DO NOTHING;
+UPDATE scrape_frontier f
+SET status = 'leased', "leaseOwner" = %s, "leaseExpiresAt" = now() + make_interval(secs => %s),
+    attempts = f.attempts + 1, "updatedAt" = now()
+FROM claimable c
+WHERE f.source = %s AND f.key = c.key
+RETURNING f.key, f.payload;
 """
 
+# Queues a listing walk; one left over from a crawl that wasn't closed is
+# started over (the coordinator only queues sources with nothing active)
+FRONTIER_ENQUEUE_SQL = """
+INSERT INTO scrape_frontier (source, key, kind) VALUES (%s, %s, %s)
+ON CONFLICT (source, key) DO UPDATE
+SET status = 'pending', attempts = 0, "leaseOwner" = NULL, "leaseExpiresAt" = NULL, "updatedAt" = now()
+WHERE scrape_frontier.status IN ('done', 'failed');
+"""
+
+FRONTIER_COMPLETE_SQL = """
+UPDATE scrape_frontier
+SET status = 'done', "leaseOwner" = NULL, "leaseExpiresAt" = NULL, "updatedAt" = now()
+WHERE source = %s AND key = ANY(%s) AND status <> 'done';
+"""
+
+# A released item goes back to pending, or to failed once out of attempts
+FRONTIER_RELEASE_SQL = """
+UPDATE scrape_frontier
+SET status = CASE WHEN attempts >= %s THEN 'failed' ELSE 'pending' END,
+    "leaseOwner" = NULL, "leaseExpiresAt" = NULL, "updatedAt" = now()
+WHERE source = %s AND key = ANY(%s) AND "leaseOwner" = %s AND status = 'leased'
+RETURNING key, status;
+"""
+
+FRONTIER_SAVE_CURSOR_SQL = """
+INSERT INTO scrape_frontier (source, key, kind, payload) VALUES (%s, %s, 'cursor', %s::jsonb)
+ON CONFLICT (source, key) DO UPDATE SET payload = EXCLUDED.payload, "updatedAt" = now();
+"""
+
+FRONTIER_CURSOR_SQL = """
+SELECT payload FROM scrape_frontier WHERE source = %s AND key = %s AND kind = 'cursor';
+"""
+
+# Ending a run settles whatever it still holds (items the pipeline dropped
+# on purpose), then closes the crawl — deletes the source's rows — unless
+# an item or listing walk is still waiting or in flight elsewhere.
+FRONTIER_SETTLE_SQL = """
+UPDATE scrape_frontier
+SET status = 'done', "leaseOwner" = NULL, "leaseExpiresAt" = NULL, "updatedAt" = now()
+WHERE source = %s AND "leaseOwner" = %s AND status = 'leased';
+"""
+
+FRONTIER_CLOSE_SQL = """
+DELETE FROM scrape_frontier
+WHERE source = %s AND NOT EXISTS (
+    SELECT 1 FROM scrape_frontier
+    WHERE source = %s AND kind <> 'cursor'
+      AND (status = 'pending' OR (status = 'leased' AND ("leaseExpiresAt" > now() OR attempts < %s)))
+);
+"""
+
+FRONTIER_ACTIVE_SQL = """
+SELECT DISTINCT source FROM scrape_frontier
+WHERE source = ANY(%s) AND kind <> 'cursor'
+  AND (status = 'pending' OR (status = 'leased' AND ("leaseExpiresAt" > now() OR attempts < %s)));
+"""
+
+
+def content_hash(job: dict[str, Any]) -> str:
+    """SHA-256 over the posting's content columns (``None`` and ``""`` differ)."""
+    digest = hashlib.sha256()
+    for col in CONTENT_COLUMNS:
+        value = job.get(col)
+        digest.update(b"\x00" if value is None else b"\x01" + str(value).encode("utf-8"))
+        digest.update(b"\x1f")
+    return digest.hexdigest()
+
+
+def with_content_hash(jobs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Collapse duplicate ``sourceUrl``s (first wins) and stamp ``contentHash``."""
+    unique: dict[str, dict[str, Any]] = {}
+    for job in jobs:
+        unique.setdefault(job["sourceUrl"], job)
+    for job in unique.values():
+        job.setdefault("contentHash", content_hash(job))
+    return list(unique.values())
+
+
+def log_upsert(jobs: list[dict[str, Any]], rows: list[tuple]) -> list[dict[str, Any]]:
+    """Log an upsert's outcome from its ``(sourceUrl, inserted)`` rows; return the new jobs."""
+    new_urls = {url for url, inserted in rows if inserted}
+    inserted = [job for job in jobs if job["sourceUrl"] in new_urls]
+    for job in inserted:
+        logger.info("  ✓ Inserted: %s", job.get("title", "?"))
+    updated = len(rows) - len(inserted)
+    if updated:
+        logger.info("  ↻ Updated %d changed postings.", updated)
+    logger.debug("  ⊘ Skipped %d unchanged jobs in batch.", len(jobs) - len(rows))
+    return inserted
+
+
+def index_params(jobs: list[dict[str, Any]], rows: list[tuple]) -> Optional[tuple[list[str], ...]]:
+    """:data:`INDEX_TERMS_SQL` parameters for the jobs an upsert wrote (``None`` if none)."""
+    written = {row[0] for row in rows}
+    if not written:
+        return None
+    return (*term_params(job for job in jobs if job["sourceUrl"] in written), sorted(written))
+
+
 # DatabaseManager
 
-class DatabaseManager:
-    """Manages PostgreSQL connections and performs upsert operations.
+class ConnectionSettings:
+    """PostgreSQL connection settings read from the environment.
 
-    Constructs the DSN from individual env vars (DB_HOST, DB_PORT, …) exactly
-    mirroring the logic in src/data/env/server.ts.
+    Uses ``DATABASE_URL`` when set, otherwise constructs the DSN from
+    individual env vars (DB_HOST, DB_PORT, …) exactly mirroring the logic in
+    src/data/env/server.ts.
     """
 
     def __init__(self) -> None:
@@ -46,17 +282,32 @@ class DatabaseManager:
         self.user = os.getenv("DB_USER", "postgres")
         self.password = os.getenv("DB_PASSWORD", "")
         self.dbname = os.getenv("DB_NAME", "career-copilot")
-        self.conn: Optional[psycopg2.extensions.connection] = None
-
-    # -- connection helpers -------------------------------------------------
 
     def _dsn(self) -> str:
-        """Build a psycopg2-compatible DSN string."""
+        """Build a libpq-compatible DSN string."""
         return (
             f"host={self.host} port={self.port} dbname={self.dbname} "
             f"user={self.user} password={self.password}"
         )
 
+    def _conninfo(self) -> str:
+        return self.db_url or self._dsn()
+
+    def _describe(self) -> str:
+        if self.db_url:
+            return "via Cloud URL"
+        return f"{self.user}@{self.host}:{self.port}/{self.dbname}"
+
+
+class DatabaseManager(ConnectionSettings):
+    """Manages PostgreSQL connections and performs upsert operations."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.conn: Optional[psycopg2.extensions.connection] = None
+
+    # -- connection helpers -------------------------------------------------
+
     def connect(self) -> None:
         """Open a persistent connection (idempotent)."""
         if self.conn and not self.conn.closed:
@@ -86,7 +337,8 @@ class DatabaseManager:
     def insert_job(self, job: dict[str, Any]) -> bool:
         """Insert a single job dict into *scraped_jobs*.
 
-        Uses ``ON CONFLICT ("sourceUrl") DO NOTHING`` so duplicate runs are
+        A posting already stored under the same ``sourceUrl`` is updated in
+        place only if its content hash changed, so duplicate runs are
         harmless.  Returns ``True`` if a new row was inserted.
         """
         if not self.conn or self.conn.closed:
@@ -94,15 +346,367 @@ class DatabaseManager:
 
         try:
             with self.conn.cursor() as cur:  # type: ignore[union-attr]
-                cur.execute(UPSERT_SQL, job)
-                inserted = cur.rowcount > 0
-                if inserted:
-                    logger.info("  ✓ Inserted: %s", job.get("title", "?"))
-                else:
-                    logger.debug("  ⊘ Skipped (duplicate): %s", job.get("title", "?"))
-                return inserted
+                cur.execute(UPSERT_SQL, with_content_hash([job])[0])
+                rows = cur.fetchall()
         except psycopg2.Error as exc:
             logger.error("DB insert error for '%s': %s", job.get("title", "?"), exc)
             if self.conn and not self.conn.closed:
                 self.conn.rollback()
             return False
+        self.index_terms([job], rows)
+        return bool(log_upsert([job], rows))
+
+    def existing_source_urls(self, urls: list[str]) -> set[str]:
+        """Return the subset of *urls* already stored, in one query.
+
+        On error an empty set is returned, so callers fall back to treating
+        every URL as new.
+        """
+        if not urls:
+            return set()
+        try:
+            if not self.conn or self.conn.closed:
+                self.connect()
+            with self.conn.cursor() as cur:  # type: ignore[union-attr]
+                cur.execute(EXISTING_URLS_SQL, (list(urls),))
+                return {row[0] for row in cur.fetchall()}
+        except psycopg2.Error as exc:
+            logger.error("DB lookup error for %d URLs: %s", len(urls), exc)
+            if self.conn and not self.conn.closed:
+                self.conn.rollback()
+            return set()
+
+    def db_now(self) -> Optional[float]:
+        """The database server's current time (epoch seconds); ``None`` on error."""
+        try:
+            if not self.conn or self.conn.closed:
+                self.connect()
+            with self.conn.cursor() as cur:  # type: ignore[union-attr]
+                cur.execute(DB_NOW_SQL)
+                return cur.fetchone()[0]
+        except psycopg2.Error as exc:
+            logger.error("DB clock read error: %s", exc)
+            if self.conn and not self.conn.closed:
+                self.conn.rollback()
+            return None
+
+    def count_new_jobs(self, source_site: str, since: float) -> int:
+        """Postings of *source_site* first stored at or after *since* (epoch seconds)."""
+        try:
+            if not self.conn or self.conn.closed:
+                self.connect()
+            with self.conn.cursor() as cur:  # type: ignore[union-attr]
+                cur.execute(COUNT_NEW_SQL, (source_site, since))
+                return cur.fetchone()[0]
+        except psycopg2.Error as exc:
+            logger.error("DB count error for %s: %s", source_site, exc)
+            if self.conn and not self.conn.closed:
+                self.conn.rollback()
+            return 0
+
+    def insert_jobs(self, batch: list[dict[str, Any]]) -> Optional[list[dict[str, Any]]]:
+        """Upsert many job dicts in a single statement / round trip.
+
+        Duplicate ``sourceUrl``s inside *batch* are collapsed (first wins);
+        stored postings whose content changed are updated in place.
+        Returns the jobs that were actually new, in batch order; ``None``
+        on error, when nothing of the batch was written.
+        """
+        if not batch:
+            return []
+        jobs = with_content_hash(batch)
+
+        try:
+            if not self.conn or self.conn.closed:
+                self.connect()
+            with self.conn.cursor() as cur:  # type: ignore[union-attr]
+                rows = psycopg2.extras.execute_values(
+                    cur, BULK_UPSERT_SQL, jobs,
+                    template=BULK_UPSERT_TEMPLATE, page_size=len(jobs), fetch=True,
+                )
+        except psycopg2.Error as exc:
+            logger.error("DB bulk insert error (%d jobs): %s", len(jobs), exc)
+            if self.conn and not self.conn.closed:
+                self.conn.rollback()
+            return None
+        self.index_terms(jobs, rows)
+        return log_upsert(jobs, rows)
+
+    def index_terms(self, jobs: list[dict[str, Any]], rows: list[tuple]) -> None:
+        """Update the search index for the jobs an upsert returned in *rows*.
+
+        A failure is logged, not raised: the postings themselves are stored.
+        """
+        params = index_params(jobs, rows)
+        if params is None:
+            return
+        try:
+            with self.conn.cursor() as cur:  # type: ignore[union-attr]
+                cur.execute(INDEX_TERMS_SQL, params)
+        except psycopg2.Error as exc:
+            logger.error("DB term index error (%d jobs): %s", len(params[3]), exc)
+            if self.conn and not self.conn.closed:
+                self.conn.rollback()
+
+    def reindex_terms(self, batch_size: int = REINDEX_BATCH_SIZE) -> int:
+        """Rebuild the search index of every stored posting; returns the count."""
+        if not self.conn or self.conn.closed:
+            self.connect()
+
+        done, after = 0, ""
+        while True:
+            with self.conn.cursor() as cur:  # type: ignore[union-attr]
+                cur.execute(JOBS_PAGE_SQL, (after, batch_size))
+                page = cur.fetchall()
+                if not page:
+                    return done
+                jobs = [{"sourceUrl": url, "title": title, "description": desc} for url, title, desc in page]
+                cur.execute(INDEX_TERMS_SQL, index_params(jobs, page))
+            done += len(page)
+            after = page[-1][0]
+            logger.info("Indexed terms of %d postings.", done)
+
+    # -- crawl frontier -----------------------------------------------------
+
+    def frontier_add(self, source: str, kind: str, keys: list[str], payloads: list[str]) -> None:
+        """Record items (JSON *payloads*) as pending unless already known."""
+        if not keys:
+            return
+        try:
+            if not self.conn or self.conn.closed:
+                self.connect()
+            with self.conn.cursor() as cur:  # type: ignore[union-attr]
+                cur.execute(FRONTIER_ADD_SQL, (source, kind, keys, payloads))
+        except psycopg2.Error as exc:
+            logger.error("DB frontier add error for %s: %s", source, exc)
+            if self.conn and not self.conn.closed:
+                self.conn.rollback()
+
+    def frontier_enqueue(self, source: str, key: str, kind: str) -> None:
+        """Queue the work unit *key* (no payload) as pending unless already queued."""
+        try:
+            if not self.conn or self.conn.closed:
+                self.connect()
+            with self.conn.cursor() as cur:  # type: ignore[union-attr]
+                cur.execute(FRONTIER_ENQUEUE_SQL, (source, key, kind))
+        except psycopg2.Error as exc:
+            logger.error("DB frontier add error for %s: %s", source, exc)
+            if self.conn and not self.conn.closed:
+                self.conn.rollback()
+
+    def frontier_lease(
+        self,
+        source: str,
+        kind: str,
+        keys: Optional[list[str]],
+        owner: str,
+        lease_seconds: float,
+        max_attempts: int,
+        limit: int,
+    ) -> list[tuple[str, Any]]:
+        """Lease up to *limit* claimable items (only *keys*, if given) to *owner*.
+
+        Returns ``(key, payload)`` pairs.  On error every requested key
+        counts as leased (with no payload), so a broken frontier never
+        stops a crawl.
+        """
+        try:
+            if not self.conn or self.conn.closed:
+                self.connect()
+            with self.conn.cursor() as cur:  # type: ignore[union-attr]
+                cur.execute(FRONTIER_LEASE_SQL, (
+                    source, kind, max_attempts, keys, keys, limit, owner, lease_seconds, source,
+                ))
+                return cur.fetchall()
+        except psycopg2.Error as exc:
+            logger.error("DB frontier lease error for %s: %s", source, exc)
+            if self.conn and not self.conn.closed:
+                self.conn.rollback()
+            return [(key, None) for key in keys or []]
+
+    def frontier_complete(self, source: str, keys: list[str]) -> None:
+        if not keys:
+            return
+        try:
+            if not self.conn or self.conn.closed:
+                self.connect()
+            with self.conn.cursor() as cur:  # type: ignore[union-attr]
+                cur.execute(FRONTIER_COMPLETE_SQL, (source, keys))
+        except psycopg2.Error as exc:
+            logger.error("DB frontier update error for %s: %s", source, exc)
+            if self.conn and not self.conn.closed:
+                self.conn.rollback()
+
+    def frontier_release(self, source: str, keys: list[str], owner: str, max_attempts: int) -> list[tuple[str, str]]:
+        """Give leased items back; returns each one's new status (``pending``/``failed``)."""
+        try:
+            if not self.conn or self.conn.closed:
+                self.connect()
+            with self.conn.cursor() as cur:  # type: ignore[union-attr]
+                cur.execute(FRONTIER_RELEASE_SQL, (max_attempts, source, keys, owner))
+                return cur.fetchall()
+        except psycopg2.Error as exc:
+            logger.error("DB frontier release error for %s: %s", source, exc)
+            if self.conn and not self.conn.closed:
+                self.conn.rollback()
+            return []
+
+    def frontier_cursor(self, source: str, key: str) -> Optional[dict[str, Any]]:
+        """The listing position last saved under *key*, if any."""
+        try:
+            if not self.conn or self.conn.closed:
+                self.connect()
+            with self.conn.cursor() as cur:  # type: ignore[union-attr]
+                cur.execute(FRONTIER_CURSOR_SQL, (source, key))
+                row = cur.fetchone()
+        except psycopg2.Error as exc:
+            logger.error("DB frontier lookup error for %s: %s", source, exc)
+            if self.conn and not self.conn.closed:
+                self.conn.rollback()
+            return None
+        return row[0] if row else None
+
+    def frontier_save_cursor(self, source: str, key: str, payload: str) -> None:
+        try:
+            if not self.conn or self.conn.closed:
+                self.connect()
+            with self.conn.cursor() as cur:  # type: ignore[union-attr]
+                cur.execute(FRONTIER_SAVE_CURSOR_SQL, (source, key, payload))
+        except psycopg2.Error as exc:
+            logger.error("DB frontier update error for %s: %s", source, exc)
+            if self.conn and not self.conn.closed:
+                self.conn.rollback()
+
+    def frontier_finish(self, source: str, owner: str, max_attempts: int) -> bool:
+        """Settle *owner*'s remaining leases; ``True`` if the crawl could be closed."""
+        try:
+            if not self.conn or self.conn.closed:
+                self.connect()
+            with self.conn.cursor() as cur:  # type: ignore[union-attr]
+                cur.execute(FRONTIER_SETTLE_SQL, (source, owner))
+                cur.execute(FRONTIER_CLOSE_SQL, (source, source, max_attempts))
+                return cur.rowcount > 0
+        except psycopg2.Error as exc:
+            logger.error("DB frontier update error for %s: %s", source, exc)
+            if self.conn and not self.conn.closed:
+                self.conn.rollback()
+            return False
+
+    def frontier_active(self, sources: list[str], max_attempts: int) -> set[str]:
+        """Those of *sources* with work waiting or in flight.
+
+        On error every source counts as active, so nobody gives up on a
+        crawl that may still be running.
+        """
+        try:
+            if not self.conn or self.conn.closed:
+                self.connect()
+            with self.conn.cursor() as cur:  # type: ignore[union-attr]
+                cur.execute(FRONTIER_ACTIVE_SQL, (sources, max_attempts))
+                return {row[0] for row in cur.fetchall()}
+        except psycopg2.Error as exc:
+            logger.error("DB frontier lookup error: %s", exc)
+            if self.conn and not self.conn.closed:
+                self.conn.rollback()
+            return set(sources)
+
+    def touch_listed(self, urls: list[str]) -> None:
+        """Mark *urls* seen and active, as if listed again."""
+        if not urls:
+            return
+        try:
+            if not self.conn or self.conn.closed:
+                self.connect()
+            with self.conn.cursor() as cur:  # type: ignore[union-attr]
+                cur.execute(TOUCH_SEEN_SQL, (list(urls),))
+        except psycopg2.Error as exc:
+            logger.error("DB listing sync error for %d URLs: %s", len(urls), exc)
+            if self.conn and not self.conn.closed:
+                self.conn.rollback()
+
+    def sync_listing(self, source_site: str, urls: list[str], complete: bool = False) -> int:
+        """Record which postings a source still lists; returns rows deactivated.
+
+        *urls* are marked seen and active.  Postings of *source_site* not
+        seen for ``STALE_AFTER_DAYS`` are deactivated, and with *complete*
+        (the whole listing was walked) so is every posting not in *urls*.
+        """
+        try:
+            if not self.conn or self.conn.closed:
+                self.connect()
+            with self.conn.cursor() as cur:  # type: ignore[union-attr]
+                if urls:
+                    cur.execute(TOUCH_SEEN_SQL, (list(urls),))
+                cur.execute(DEACTIVATE_STALE_SQL, (source_site, STALE_AFTER_DAYS, complete and bool(urls), list(urls)))
+                return cur.rowcount
+        except psycopg2.Error as exc:
+            logger.error("DB listing sync error for %s: %s", source_site, exc)
+            if self.conn and not self.conn.closed:
+                self.conn.rollback()
+            return 0
+
+
+async def db_call(method: Callable[..., Any], *args: Any) -> Any:
+    """Call a database-manager method from async code.
+
+    Coroutine methods (``AsyncDatabaseManager``) are awaited directly;
+    blocking ones (``DatabaseManager``) run in a worker thread.
+    """
+    if inspect.iscoroutinefunction(method):
+        return await method(*args)
+    return await asyncio.to_thread(method, *args)
+
+
+class JobBatcher:
+    """Buffers mapped jobs and flushes them through ``insert_jobs``.
+
+    ``add`` flushes automatically once *batch_size* jobs are pending; call
+    ``flush`` at the end of a scrape.  Both return the number of new rows.
+    Works with either database manager; a blocking round trip runs in a
+    worker thread so the event loop keeps going.  ``seen_urls`` collects
+    every ``sourceUrl`` written, new or not, for the listing sync.
+    Round trips and new/written counts are recorded under *source*;
+    *on_flush*, if given, is awaited with the ``sourceUrl``s of each batch
+    once it is stored, and *on_error* with those of a batch that failed.
+    """
+
+    def __init__(
+        self,
+        db: Any,
+        batch_size: int = DB_BATCH_SIZE,
+        source: Optional[str] = None,
+        on_flush: Optional[Callable[[list[str]], Awaitable[None]]] = None,
+        on_error: Optional[Callable[[list[str]], Awaitable[None]]] = None,
+    ) -> None:
+        self.db = db
+        self.source = source
+        self.on_flush = on_flush
+        self.on_error = on_error
+        self.batch_size = max(1, batch_size)
+        self.seen_urls: list[str] = []
+        self._pending: list[dict[str, Any]] = []
+
+    async def add(self, job: dict[str, Any]) -> int:
+        self._pending.append(job)
+        self.seen_urls.append(job["sourceUrl"])
+        if len(self._pending) >= self.batch_size:
+            return await self.flush()
+        return 0
+
+    async def flush(self) -> int:
+        if not self._pending:
+            return 0
+        batch, self._pending = self._pending, []
+        with METRICS.timer("db_insert_seconds", self.source):
+            new_jobs = await db_call(self.db.insert_jobs, batch)
+        urls = [job["sourceUrl"] for job in batch]
+        if new_jobs is None:
+            METRICS.inc("jobs_failed_total", len(batch), self.source)
+            if self.on_error is not None:
+                await self.on_error(urls)
+            return 0
+        METRICS.inc("jobs_written_total", len(batch), self.source)
+        METRICS.inc("jobs_new_total", len(new_jobs), self.source)
+        if self.on_flush is not None:
+            await self.on_flush(urls)
+        return len(new_jobs)
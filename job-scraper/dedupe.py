@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import random
+import re
+import sqlite3
+import struct
+import threading
+import time
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from http_cache import CACHE_DIR
+from metrics import METRICS
+from pipeline import Stage
+from utils import logger
+
+# Near-duplicate detection — SCRAPER_NEAR_DUP=0 turns it off.  Two postings
+# whose estimated shingle Jaccard similarity reaches NEAR_DUP_THRESHOLD are the same job.
+NEAR_DUP_ENABLED = os.getenv("SCRAPER_NEAR_DUP", "1") != "0"
+NEAR_DUP_THRESHOLD = float(os.getenv("SCRAPER_NEAR_DUP_THRESHOLD", "0.8"))
+NEAR_DUP_TTL_SECONDS = int(os.getenv("SCRAPER_NEAR_DUP_TTL_DAYS", "90")) * 24 * 3600
+SHINGLE_SIZE = 3
+# 64 MinHash permutations in 16 LSH bands of 4 rows: pairs at Jaccard 0.8
+# become candidates with probability > 0.999, pairs at 0.3 below 0.13.
+NUM_PERM = 64
+NUM_BANDS = 16
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS fingerprints (
+    url        TEXT PRIMARY KEY,
+    signature  BLOB NOT NULL,
+    seen_at    REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS bands (
+    band  INTEGER NOT NULL,
+    key   INTEGER NOT NULL,
+    url   TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS bands_lookup ON bands (band, key);
+CREATE INDEX IF NOT EXISTS bands_url ON bands (url);
+"""
+
+_WORD = re.compile(r"[a-z0-9]+")
+_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+# Fixed seed: signatures must stay comparable across runs
+_rng = random.Random(0x5EED)
+_PERMUTATIONS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+_ROWS = NUM_PERM // NUM_BANDS
+_SIGNATURE = struct.Struct(f"<{NUM_PERM}I")
+
+Signature = tuple[int, ...]
+
+
+def _shingles(text: str) -> set[str]:
+    words = _WORD.findall(text.lower())
+    if len(words) <= SHINGLE_SIZE:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)}
+
+
+def minhash(text: str) -> Signature:
+    """MinHash signature of the word shingles of *text*."""
+    hashes = [
+        int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=4).digest(), "little")
+        for s in _shingles(text)
+    ] or [0]
+    return tuple(min((a * h + b) % _PRIME for h in hashes) & _MAX_HASH for a, b in _PERMUTATIONS)
+
+
+def similarity(sig_a: Signature, sig_b: Signature) -> float:
+    """Estimated Jaccard similarity of the shingle sets behind two signatures."""
+    return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / NUM_PERM
+
+
+def job_signature(job: dict[str, Any]) -> Signature:
+    return minhash(f"{job.get('title', '')} {job.get('companyName', '')} {job.get('description', '')}")
+
+
+def _band_keys(sig: Signature) -> list[tuple[int, int]]:
+    # One signed 64-bit key per band (SQLite integers are signed)
+    packed = _SIGNATURE.pack(*sig)
+    width = _ROWS * 4
+    return [
+        (band, int.from_bytes(
+            hashlib.blake2b(packed[band * width:(band + 1) * width], digest_size=8).digest(), "little", signed=True,
+        ))
+        for band in range(NUM_BANDS)
+    ]
+
+
+class NearDuplicateIndex:
+    """Persistent MinHash/LSH index of scraped postings (SQLite, next to the HTTP cache).
+
+    A lookup only compares against postings that share at least one LSH band
+    with the new one, so it stays sub-linear in the number of stored jobs.
+    Entries not seen for *ttl* seconds are evicted.
+    """
+
+    def __init__(
+        self,
+        path: Path = CACHE_DIR / "near_duplicates.sqlite3",
+        threshold: float = NEAR_DUP_THRESHOLD,
+        ttl: int = NEAR_DUP_TTL_SECONDS,
+    ) -> None:
+        self.path = Path(path)
+        self.threshold = threshold
+        self.ttl = ttl
+        self.duplicates = 0
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    # -- lifecycle ----------------------------------------------------------
+
+    def open(self) -> None:
+        if self._conn is not None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Used from the pipeline's worker threads, serialized by _lock
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.executescript(SCHEMA_SQL)
+        with self._conn:
+            self._conn.execute("DELETE FROM fingerprints WHERE seen_at < ?", (time.time() - self.ttl,))
+            self._conn.execute("DELETE FROM bands WHERE url NOT IN (SELECT url FROM fingerprints)")
+        count = self._conn.execute("SELECT COUNT(*) FROM fingerprints").fetchone()[0]
+        logger.info("Near-duplicate index opened  %s  (%d fingerprints)", self.path, count)
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+            if self.duplicates:
+                logger.info("Near-duplicate index dropped %d duplicate postings.", self.duplicates)
+
+    # -- lookups ------------------------------------------------------------
+
+    def find(self, sig: Signature, url: str) -> Optional[str]:
+        """URL of another stored posting at least ``threshold`` similar, if any."""
+        self.open()
+        keys = _band_keys(sig)
+        clauses = " OR ".join("(b.band = ? AND b.key = ?)" for _ in keys)
+        rows = self._conn.execute(  # type: ignore[union-attr]
+            "SELECT DISTINCT f.url, f.signature FROM bands b JOIN fingerprints f ON f.url = b.url "
+            f"WHERE {clauses}",
+            [p for key in keys for p in key],
+        ).fetchall()
+        for other_url, blob in rows:
+            if other_url != url and similarity(sig, _SIGNATURE.unpack(blob)) >= self.threshold:
+                return other_url
+        return None
+
+    def add(self, sig: Signature, url: str) -> None:
+        self.open()
+        with self._conn:  # type: ignore[union-attr]
+            self._conn.execute("DELETE FROM bands WHERE url = ?", (url,))  # type: ignore[union-attr]
+            self._conn.execute(  # type: ignore[union-attr]
+                "INSERT OR REPLACE INTO fingerprints VALUES (?, ?, ?)",
+                (url, _SIGNATURE.pack(*sig), time.time()),
+            )
+            self._conn.executemany(  # type: ignore[union-attr]
+                "INSERT INTO bands VALUES (?, ?, ?)",
+                [(band, key, url) for band, key in _band_keys(sig)],
+            )
+
+    def check(
+        self,
+        job: dict[str, Any],
+        source: Optional[str] = None,
+        on_duplicate: Optional[Callable[[str], None]] = None,
+    ) -> Optional[dict[str, Any]]:
+        """Pipeline stage: drop *job* if it near-duplicates a known posting.
+
+        New postings are added to the index; the same ``sourceUrl`` seen
+        again is never its own duplicate (the upsert handles that case).
+        Drops are counted under *source*, and *on_duplicate* gets the URL
+        of the posting each dropped one repeats.
+        """
+        sig = job_signature(job)
+        url = job.get("sourceUrl", "")
+        with self._lock:
+            original = self.find(sig, url)
+            if original is None:
+                self.add(sig, url)
+                return job
+            self.duplicates += 1
+        METRICS.inc("near_duplicates_total", source=source)
+        logger.info("  ≈ Near-duplicate of %s: %s", original, job.get("title", "?"))
+        if on_duplicate is not None:
+            on_duplicate(original)
+        return None
+
+
+def dedupe_stages(
+    index: Optional[NearDuplicateIndex],
+    source: Optional[str] = None,
+    on_duplicate: Optional[Callable[[str], None]] = None,
+) -> list[Stage]:
+    """The fingerprinting stage to append to a scraper pipeline (none if disabled)."""
+    if not index:
+        return []
+    return [Stage("dedupe", partial(index.check, source=source, on_duplicate=on_duplicate), offload=True)]
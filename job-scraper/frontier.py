@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import json
+import os
+import socket
+import uuid
+from typing import Any, Callable, Optional, TypeVar
+
+from database import db_call
+from utils import logger
+
+T = TypeVar("T")
+
+# Set SCRAPER_FRONTIER=0 to crawl without recording progress in Postgres
+FRONTIER_ENABLED = os.getenv("SCRAPER_FRONTIER", "1") != "0"
+# A leased item whose run died is handed out again after this long; keep
+# it above SCRAPER_CRAWL_MAX_SECONDS so live runs never lose their leases.
+FRONTIER_LEASE_SECONDS = float(os.getenv("SCRAPER_FRONTIER_LEASE_SECONDS", "900"))
+# Leases per item before it is given up on as failed
+FRONTIER_MAX_ATTEMPTS = int(os.getenv("SCRAPER_FRONTIER_MAX_ATTEMPTS", "3"))
+# Names this process in leases; unique per container and restart
+WORKER_ID = os.getenv("SCRAPER_WORKER_ID") or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+# Items a sharded worker leases at a time; smaller spreads the tail of a
+# crawl more evenly across workers, larger means fewer round trips.
+FRONTIER_CHUNK = int(os.getenv("SCRAPER_FRONTIER_CHUNK", "20"))
+
+ITEM = "item"
+# A source's listing walk as a work unit of its own (key and kind alike)
+CRAWL = "crawl"
+
+
+class CrawlFrontier:
+    """One source's crawl, persisted in ``scrape_frontier`` across runs.
+
+    Work items (detail URLs, API job objects) are recorded as pending when
+    discovered and leased to the run that processes them, row by row with
+    ``SKIP LOCKED``, so runs sharing a frontier never take the same item.
+    A run marks items done as their rows are written and settles the rest
+    when it finishes.  If it dies instead, its leases expire after
+    *lease_seconds* and the next run resumes them; once nothing is left
+    pending or in flight the crawl is closed and its rows deleted, so the
+    next crawl starts fresh.  Listing positions can be saved alongside
+    with :meth:`save_cursor`.
+
+    Sharded across workers, the crawl itself is queued as a unit
+    (:meth:`enqueue_crawl`) that one worker takes to walk the listing.  Its
+    frontier is *shared*: items it finds are only recorded, and every
+    worker leases them in chunks with :meth:`resume`.
+    """
+
+    def __init__(
+        self,
+        db: Any,
+        source: str,
+        owner: str = WORKER_ID,
+        lease_seconds: float = FRONTIER_LEASE_SECONDS,
+        max_attempts: int = FRONTIER_MAX_ATTEMPTS,
+        shared: bool = False,
+    ) -> None:
+        self.db = db
+        self.source = source
+        self.owner = owner
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.shared = shared
+
+    async def resume(self, limit: int) -> list[Any]:
+        """Lease up to *limit* items an earlier run left unfinished; returns their payloads."""
+        if limit <= 0:
+            return []
+        rows = await db_call(
+            self.db.frontier_lease, self.source, ITEM, None,
+            self.owner, self.lease_seconds, self.max_attempts, limit,
+        )
+        return [payload for _, payload in rows if payload is not None]
+
+    async def claim(self, items: list[T], key: Callable[[T], str]) -> list[T]:
+        """The *items* this run gets to work on, in order.
+
+        All are recorded; those already done, failed or leased by another
+        run are left out.
+        """
+        if not items:
+            return []
+        keys = await self.add(items, key)
+        rows = await db_call(
+            self.db.frontier_lease, self.source, ITEM, keys,
+            self.owner, self.lease_seconds, self.max_attempts, len(keys),
+        )
+        leased = {k for k, _ in rows}
+        if len(leased) < len(keys):
+            logger.info("Skipping %d items finished or in flight elsewhere.", len(keys) - len(leased))
+        return [item for item, k in zip(items, keys) if k in leased]
+
+    async def add(self, items: list[T], key: Callable[[T], str]) -> list[str]:
+        """Record *items* as pending unless already known; returns their keys."""
+        keys = [key(item) for item in items]
+        if keys:
+            await db_call(self.db.frontier_add, self.source, ITEM, keys, [json.dumps(item) for item in items])
+        return keys
+
+    async def complete(self, keys: list[str]) -> None:
+        await db_call(self.db.frontier_complete, self.source, keys)
+
+    async def release(self, key: str) -> bool:
+        """Hand a leased item back after a failure.
+
+        ``True`` if a later run will try it again, ``False`` once it has
+        used up its attempts.
+        """
+        rows = await db_call(self.db.frontier_release, self.source, [key], self.owner, self.max_attempts)
+        return any(status == "pending" for _, status in rows)
+
+    async def release_all(self, keys: list[str]) -> None:
+        """Hand back leased items whose rows could not be written, for a later try."""
+        rows = await db_call(self.db.frontier_release, self.source, keys, self.owner, self.max_attempts)
+        if rows:
+            logger.info("Handed %d unwritten items back to the frontier.", len(rows))
+
+    async def cursor(self, key: str) -> Optional[dict[str, Any]]:
+        return await db_call(self.db.frontier_cursor, self.source, key)
+
+    async def save_cursor(self, key: str, position: dict[str, Any]) -> None:
+        await db_call(self.db.frontier_save_cursor, self.source, key, json.dumps(position))
+
+    async def finish(self) -> None:
+        """Settle this run's leases and close the crawl if nothing is left."""
+        if await db_call(self.db.frontier_finish, self.source, self.owner, self.max_attempts):
+            logger.info("Crawl of %s complete — frontier cleared.", self.source)
+
+    # -- crawl units ----------------------------------------------------------
+
+    async def enqueue_crawl(self) -> None:
+        """Queue a walk of the source's listing for a worker to take."""
+        await db_call(self.db.frontier_enqueue, self.source, CRAWL, CRAWL)
+
+    async def take_crawl(self) -> bool:
+        """Lease the queued listing walk; ``False`` if none is waiting."""
+        rows = await db_call(
+            self.db.frontier_lease, self.source, CRAWL, None,
+            self.owner, self.lease_seconds, self.max_attempts, 1,
+        )
+        return bool(rows)
+
+    async def end_crawl(self, ok: bool) -> None:
+        """Mark the walk done, or hand it back after a failure."""
+        if ok:
+            await self.complete([CRAWL])
+        elif await self.release(CRAWL):
+            logger.info("Listing walk of %s handed back for another worker.", self.source)
+        await self.finish()
+
+
+async def active_crawls(db: Any, sources: list[str], max_attempts: int = FRONTIER_MAX_ATTEMPTS) -> set[str]:
+    """Those of *sources* with a listing walk or items still waiting or in flight."""
+    if not sources:
+        return set()
+    return await db_call(db.frontier_active, sources, max_attempts)
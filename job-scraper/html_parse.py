@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import os
+import re
+from typing import Any, Iterator, Optional
+
+import lxml.html
+from bs4 import BeautifulSoup, Tag
+from lxml import etree
+
+from utils import logger
+
+# "lxml" (default): compiled XPath over only the subtree a page needs;
+# "bs4": the original BeautifulSoup parsing of the whole document.
+HTML_PARSER = os.getenv("SCRAPER_HTML_PARSER", "lxml")
+
+_PAGE_PARAM = re.compile(r"[?&]page=(\d+)")
+
+
+def _has_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Compiled once; each mirrors the CSS selector the bs4 backend uses
+_LISTING_OL = etree.XPath(f"(//ol[{_has_class('list-recent-jobs')}])[1]")
+_PAGINATION_LINKS = etree.XPath(f"//ul[{_has_class('pagination')}]//a[@href]")
+_TITLE_LINK = etree.XPath(f"(.//h2[{_has_class('listing-company')}]//a)[1]")
+_COMPANY_SPAN = etree.XPath(f"(.//span[{_has_class('listing-company-name')}])[1]")
+_LOCATION_LINK = etree.XPath(f"(.//span[{_has_class('listing-location')}]//a)[1]")
+_POSTED_TIME = etree.XPath(f"(.//span[{_has_class('listing-posted')}]//time)[1]")
+_DESCRIPTION_DIV = etree.XPath(f"(//div[{_has_class('job-description')}])[1]")
+
+# Elements whose text BeautifulSoup leaves out of get_text()
+_SKIPPED_TEXT = {"script", "style", "template"}
+# Open/close tag patterns used to cut a subtree out of the page source
+_TAG_PATTERNS: dict[str, re.Pattern[str]] = {}
+
+
+# -- public API ---------------------------------------------------------------
+
+def parse_listing(html: str, base_url: str, backend: str = HTML_PARSER) -> tuple[list[dict[str, Any]], int]:
+    """Cards of a python.org listing page, and the last page number it links.
+
+    Each card has ``title``, ``companyName``, ``location``, ``sourceUrl``
+    and ``postedAt``; the last page is 1 if the listing isn't paginated.
+    """
+    if backend == "bs4":
+        return _bs4_listing(html, base_url)
+    # Parse just the job list and the pager instead of the whole document
+    job_list = _slice_element(html, '<ol class="list-recent-jobs', "ol")
+    pager = _slice_element(html, '<ul class="pagination', "ul")
+    if job_list is None:
+        root = _parse(html)
+        pages_root = root
+    else:
+        root = _parse(job_list)
+        if pager is not None:
+            pages_root = _parse(pager)
+        else:  # no pager, or one written differently: look in the whole page
+            pages_root = _parse(html) if "pagination" in html else None
+    pages = [
+        int(m.group(1))
+        for a in (_PAGINATION_LINKS(pages_root) if pages_root is not None else [])
+        if (m := _PAGE_PARAM.search(a.get("href", "")))
+    ]
+    last_page = max(pages, default=1)
+
+    ol = _LISTING_OL(root) if root is not None else []
+    if not ol:
+        logger.warning("Could not find ol.list-recent-jobs.")
+        return [], last_page
+    results: list[dict[str, Any]] = []
+    for li in ol[0]:
+        if li.tag != "li":
+            continue
+        try:
+            # Title + URL
+            title_link = _TITLE_LINK(li)
+            if not title_link:
+                continue
+            title = _text(title_link[0])
+            href = title_link[0].get("href", "")
+            source_url = href if href.startswith("http") else f"{base_url}{href}"
+
+            # Company name — the span's own text, minus its child elements' text
+            company_span = _COMPANY_SPAN(li)
+            company = ""
+            if company_span:
+                company = _text(company_span[0], " ")
+                for child in company_span[0]:
+                    if isinstance(child.tag, str):
+                        company = company.replace(_text(child), "", 1)
+                company = company.strip().strip("—–-").strip()
+
+            loc_link = _LOCATION_LINK(li)
+            location = _text(loc_link[0]) if loc_link else ""
+
+            time_tag = _POSTED_TIME(li)
+            posted_at = ""
+            if time_tag:
+                posted_at = time_tag[0].get("datetime", "") or _text(time_tag[0])
+
+            results.append({
+                "title": title,
+                "companyName": company or "Unknown",
+                "location": location or "Not specified",
+                "sourceUrl": source_url,
+                "postedAt": posted_at,
+            })
+        except Exception as exc:
+            logger.debug("Skipping malformed <li>: %s", exc)
+    return results, last_page
+
+
+def parse_description(html: str, backend: str = HTML_PARSER) -> str:
+    """Plain-text job description of a python.org detail page (``""`` if none)."""
+    if not html:
+        return ""
+    if backend == "bs4":
+        soup = BeautifulSoup(html, "lxml")
+        desc_div = soup.select_one("div.job-description")
+        return desc_div.get_text(separator="\n", strip=True) if desc_div else ""
+    root = _parse(_slice_element(html, '<div class="job-description', "div") or html)
+    desc_div = _DESCRIPTION_DIV(root) if root is not None else []
+    return _text(desc_div[0], "\n") if desc_div else ""
+
+
+# -- lxml helpers -------------------------------------------------------------
+
+def _parse(html: str) -> Optional[Any]:
+    try:
+        return lxml.html.document_fromstring(html)
+    except (etree.ParserError, ValueError):  # empty or unparseable document
+        return None
+
+
+def _strings(el: Any) -> Iterator[str]:
+    if el.tag in _SKIPPED_TEXT:  # along with anything a <template> nests
+        return
+    if el.text:
+        yield el.text
+    for child in el:
+        # Comments and processing instructions have a non-string tag
+        if isinstance(child.tag, str):
+            yield from _strings(child)
+        if child.tail:
+            yield child.tail
+
+
+def _text(el: Any, separator: str = "") -> str:
+    """Same as BeautifulSoup's ``get_text(separator, strip=True)``."""
+    return separator.join(s for s in (s.strip() for s in _strings(el)) if s)
+
+
+def _slice_element(html: str, marker: str, tag: str) -> Optional[str]:
+    """Source of the first element starting with *marker*, up to its matching close tag.
+
+    Returns ``None`` when the marker is missing or the tags don't balance,
+    so the caller parses the whole document instead.
+    """
+    start = html.find(marker)
+    if start < 0:
+        return None
+    pattern = _TAG_PATTERNS.get(tag)
+    if pattern is None:
+        pattern = _TAG_PATTERNS[tag] = re.compile(rf"<(/?){tag}\b[^>]*>", re.IGNORECASE)
+    depth = 0
+    for m in pattern.finditer(html, start):
+        depth += -1 if m.group(1) else 1
+        if depth == 0:
+            return html[start:m.end()]
+    return None
+
+
+# -- BeautifulSoup backend ------------------------------------------------------
+
+def _bs4_listing(html: str, base_url: str) -> tuple[list[dict[str, Any]], int]:
+    soup = BeautifulSoup(html, "lxml")
+    pages = [
+        int(m.group(1))
+        for a in soup.select("ul.pagination a[href]")
+        if (m := _PAGE_PARAM.search(a.get("href", "")))
+    ]
+    last_page = max(pages, default=1)
+    ol = soup.select_one("ol.list-recent-jobs")
+    if not ol:
+        logger.warning("Could not find ol.list-recent-jobs.")
+        return [], last_page
+
+    results: list[dict[str, Any]] = []
+    for li in ol.find_all("li", recursive=False):
+        try:
+            # Title + URL
+            title_link = li.select_one("h2.listing-company a")
+            if not title_link:
+                continue
+            title = title_link.get_text(strip=True)
+            href = title_link.get("href", "")
+            source_url = href if href.startswith("http") else f"{base_url}{href}"
+
+            # Company name —  extract from <span class="listing-company-name">
+            company_span = li.select_one("span.listing-company-name")
+            company = ""
+            if company_span:
+                full_span_text = company_span.get_text(separator=" ", strip=True)
+                company = full_span_text
+                for child in company_span.children:
+                    if isinstance(child, Tag):
+                        child_text = child.get_text(strip=True)
+                        company = company.replace(child_text, "", 1)
+                company = company.strip().strip("—–-").strip()
+
+            # Location
+            loc_tag = li.select_one("span.listing-location a")
+            location = loc_tag.get_text(strip=True) if loc_tag else ""
+
+            # Posted at
+            time_tag = li.select_one("span.listing-posted time")
+            posted_at = ""
+            if time_tag:
+                posted_at = time_tag.get("datetime", "") or time_tag.get_text(strip=True)
+
+            results.append({
+                "title": title,
+                "companyName": company or "Unknown",
+                "location": location or "Not specified",
+                "sourceUrl": source_url,
+                "postedAt": posted_at,
+            })
+        except Exception as exc:
+            logger.debug("Skipping malformed <li>: %s", exc)
+
+    return results, last_page
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from utils import logger
+
+# Persistent cache location / limits (mount this directory to keep it across runs)
+CACHE_DIR = Path(os.getenv("SCRAPER_CACHE_DIR", Path(__file__).resolve().parent / ".cache"))
+CACHE_TTL_SECONDS = int(os.getenv("SCRAPER_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+CACHE_MAX_BYTES = int(os.getenv("SCRAPER_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS responses (
+    url           TEXT PRIMARY KEY,
+    etag          TEXT,
+    last_modified TEXT,
+    body_hash     TEXT NOT NULL,
+    body          BLOB NOT NULL,
+    size          INTEGER NOT NULL,
+    validated_at  REAL NOT NULL,
+    last_used_at  REAL NOT NULL
+);
+"""
+
+
+@dataclass
+class CacheEntry:
+    url: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body_hash: str
+    body: str
+
+
+def body_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """On-disk (SQLite) response cache keyed by URL.
+
+    Stores each response's ``ETag`` / ``Last-Modified`` validators, a SHA-256
+    of the body and the zlib-compressed body itself.  Entries older than
+    *ttl* are ignored and evicted; once the stored bodies exceed *max_bytes*
+    the least recently used entries are dropped.
+    """
+
+    def __init__(
+        self,
+        path: Path = CACHE_DIR / "http_cache.sqlite3",
+        ttl: int = CACHE_TTL_SECONDS,
+        max_bytes: int = CACHE_MAX_BYTES,
+    ) -> None:
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._conn: Optional[sqlite3.Connection] = None
+
+    # -- lifecycle ----------------------------------------------------------
+
+    def open(self) -> None:
+        if self._conn is not None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute(SCHEMA_SQL)
+        self.evict()
+        count, size = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        logger.info("HTTP cache opened  %s  (%d entries, %.1f MiB)", self.path, count, size / 2**20)
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self.evict()
+            self._conn.close()
+            self._conn = None
+
+    # -- lookups ------------------------------------------------------------
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        """Return the fresh entry for *url*, or ``None`` if missing/expired."""
+        self.open()
+        row = self._conn.execute(  # type: ignore[union-attr]
+            "SELECT etag, last_modified, body_hash, body FROM responses "
+            "WHERE url = ? AND validated_at >= ?",
+            (url, time.time() - self.ttl),
+        ).fetchone()
+        if row is None:
+            return None
+        etag, last_modified, digest, body = row
+        return CacheEntry(url, etag, last_modified, digest, zlib.decompress(body).decode("utf-8"))
+
+    def put(self, url: str, text: str, etag: Optional[str], last_modified: Optional[str]) -> str:
+        """Store a fresh 200 response and return its body hash."""
+        self.open()
+        digest = body_hash(text)
+        body = zlib.compress(text.encode("utf-8"))
+        now = time.time()
+        with self._conn:  # type: ignore[union-attr]
+            self._conn.execute(  # type: ignore[union-attr]
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, etag, last_modified, digest, body, len(body), now, now),
+            )
+        return digest
+
+    def touch(self, url: str) -> None:
+        """Mark *url* as revalidated (a 304 extends its TTL)."""
+        now = time.time()
+        with self._conn:  # type: ignore[union-attr]
+            self._conn.execute(  # type: ignore[union-attr]
+                "UPDATE responses SET validated_at = ?, last_used_at = ? WHERE url = ?",
+                (now, now, url),
+            )
+
+    # -- eviction -----------------------------------------------------------
+
+    def evict(self) -> None:
+        """Drop expired entries, then LRU entries beyond ``max_bytes``."""
+        conn = self._conn
+        if conn is None:
+            return
+        with conn:
+            expired = conn.execute(
+                "DELETE FROM responses WHERE validated_at < ?", (time.time() - self.ttl,)
+            ).rowcount
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            dropped = 0
+            if total > self.max_bytes:
+                for url, size in conn.execute(
+                    "SELECT url, size FROM responses ORDER BY last_used_at"
+                ).fetchall():
+                    if total <= self.max_bytes:
+                        break
+                    conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+                    total -= size
+                    dropped += 1
+        if expired or dropped:
+            logger.debug("HTTP cache evicted %d expired and %d LRU entries.", expired, dropped)
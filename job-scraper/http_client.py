@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import httpx
+
+from http_cache import ResponseCache
+from utils import MAX_CONCURRENCY, logger, random_user_agent
+
+try:  # HTTP/2 needs the optional ``h2`` package (``httpx[http2]``)
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Statuses worth another try later, and those among them that mean the
+# host wants fewer requests
+RETRYABLE_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+CONGESTION_STATUSES = frozenset({429, 503})
+
+
+@dataclass
+class FetchResult:
+    text: str
+    changed: bool  # False when the page is identical to the cached copy
+
+
+class FetchError(Exception):
+    """A page that could not be loaded.
+
+    *status* is the HTTP status, or ``None`` when there was no response at
+    all (timeout, connection error); *retry_after* is the server's
+    ``Retry-After`` in seconds, if it sent one.
+    """
+
+    def __init__(self, url: str, status: Optional[int] = None, retry_after: Optional[float] = None, reason: str = "") -> None:
+        super().__init__(f"{reason or f'HTTP {status}'} — {url}")
+        self.url = url
+        self.status = status
+        self.retry_after = retry_after
+
+    @property
+    def congested(self) -> bool:
+        """Whether the host is signalling overload: slow down, not just retry."""
+        return self.status is None or self.status in CONGESTION_STATUSES
+
+    @property
+    def retryable(self) -> bool:
+        return self.status is None or self.status in RETRYABLE_STATUSES
+
+
+def retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait per a ``Retry-After`` header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class HttpFetcher:
+    """Lightweight async HTTP tier for sources that don't need a browser.
+
+    One ``httpx.AsyncClient`` with a keep-alive connection pool (HTTP/2 when
+    ``h2`` is installed) is shared by every request of the run.  Mirrors
+    :class:`browser.StealthBrowser`: call :meth:`open` first, :meth:`close`
+    when done.
+
+    With a :class:`http_cache.ResponseCache`, revisits send
+    ``If-None-Match`` / ``If-Modified-Since`` and :meth:`fetch` reports
+    whether the page changed since it was last seen.  A custom *transport*
+    (e.g. ``httpx.MockTransport``) replaces the network, as in the
+    benchmarks.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = MAX_CONCURRENCY,
+        timeout: float = 30.0,
+        cache: Optional[ResponseCache] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.cache = cache
+        self.transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def open(self) -> None:
+        if self._client is not None:
+            return
+        user_agent = random_user_agent()
+        self._client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            transport=self.transport,
+            follow_redirects=True,
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            ),
+            headers={
+                "User-Agent": user_agent,
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                "Accept-Language": "en-US,en;q=0.9",
+            },
+        )
+        logger.info("HTTP client opened  UA=%s…  http2=%s", user_agent[:50], HTTP2_AVAILABLE)
+
+    async def get_text(self, url: str) -> str:
+        """GET *url* and return the decoded body; raises on HTTP errors."""
+        return (await self.fetch(url)).text
+
+    async def fetch(self, url: str) -> FetchResult:
+        """Conditional GET of *url*; raises :class:`FetchError` on HTTP errors.
+
+        A ``304`` (or a ``200`` whose body hash matches the cached one) is
+        reported as ``changed=False`` with the cached body.
+        """
+        if self._client is None:
+            await self.open()
+
+        cached = self.cache.get(url) if self.cache else None
+        headers: dict[str, str] = {}
+        if cached:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        try:
+            response = await self._client.get(url, headers=headers)  # type: ignore[union-attr]
+        except httpx.TransportError as exc:
+            raise FetchError(url, reason=f"{type(exc).__name__}: {exc}") from exc
+        if cached and response.status_code == 304:
+            self.cache.touch(url)  # type: ignore[union-attr]
+            return FetchResult(cached.body, changed=False)
+        if response.is_error:
+            raise FetchError(url, response.status_code, retry_after_seconds(response.headers.get("retry-after")))
+
+        text = response.text
+        if self.cache is None:
+            return FetchResult(text, changed=True)
+        # Servers that ignore validators still short-circuit on an identical body
+        digest = self.cache.put(url, text, response.headers.get("etag"), response.headers.get("last-modified"))
+        return FetchResult(text, changed=cached is None or cached.body_hash != digest)
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            logger.info("HTTP client closed.")
+        if self.cache is not None:
+            self.cache.close()
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterable
+
+# Shared with the dashboard (src/lib/jobTerms.ts), which normalizes a
+# user's skills and job titles the same way before looking them up.
+VOCABULARY_PATH = Path(__file__).with_name("skill_vocabulary.json")
+
+# Term kinds stored in scraped_job_terms.field
+SKILL = "skill"
+TITLE = "title"
+
+_HYPHEN = re.compile(r"(?<=[a-z0-9])-(?=[a-z0-9])")
+_TOKEN = re.compile(r"[a-z0-9.+#]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lower-cased word tokens of *text*.
+
+    Keeps ``+ # .`` inside tokens (``c++``, ``c#``, ``node.js``, ``.net``),
+    joins hyphenated words (``front-end`` → ``frontend``) and drops
+    sentence punctuation.
+    """
+    tokens: list[str] = []
+    for raw in _TOKEN.findall(_HYPHEN.sub("", text.lower())):
+        token = raw.rstrip(".")
+        if token.startswith(".."):
+            token = "." + token.lstrip(".")
+        if token and token != ".":
+            tokens.append(token)
+    return tokens
+
+
+def _phrase(text: str) -> str:
+    return " ".join(tokenize(text))
+
+
+@dataclass(frozen=True)
+class Vocabulary:
+    """Normalized skill phrases, each mapped to its canonical term."""
+
+    aliases: dict[str, str]
+    # Same, minus ambiguous words ("go", "rest") that only count via an alias
+    text_aliases: dict[str, str]
+    # Terms of ambiguous words: only partly indexed, so never looked up
+    ambiguous_terms: frozenset[str]
+    max_words: int
+    stopwords: frozenset[str]
+    title_aliases: dict[str, str]
+
+
+@lru_cache(maxsize=1)
+def vocabulary(path: Path = VOCABULARY_PATH) -> Vocabulary:
+    raw = json.loads(Path(path).read_text())
+    aliases: dict[str, str] = {}
+    for canonical, names in raw["skills"].items():
+        term = _phrase(canonical)
+        for name in (canonical, *names):
+            aliases.setdefault(_phrase(name), term)
+    ambiguous = {_phrase(word) for word in raw.get("ambiguous", [])}
+    return Vocabulary(
+        aliases=aliases,
+        text_aliases={phrase: term for phrase, term in aliases.items() if phrase not in ambiguous},
+        ambiguous_terms=frozenset(aliases[phrase] for phrase in ambiguous if phrase in aliases),
+        max_words=max(phrase.count(" ") + 1 for phrase in aliases),
+        stopwords=frozenset(raw.get("stopwords", [])),
+        title_aliases={_phrase(k): _phrase(v) for k, v in raw.get("titleAliases", {}).items()},
+    )
+
+
+def skill_terms(text: str) -> set[str]:
+    """Canonical terms of every vocabulary skill mentioned in *text*."""
+    vocab = vocabulary()
+    tokens = tokenize(text)
+    found: set[str] = set()
+    for i in range(len(tokens)):
+        for n in range(1, min(vocab.max_words, len(tokens) - i) + 1):
+            term = vocab.text_aliases.get(" ".join(tokens[i:i + n]))
+            if term is not None:
+                found.add(term)
+    return found
+
+
+def skill_term(skill: str) -> str | None:
+    """Index term to look a user's *skill* up by, or ``None`` to search job text for it.
+
+    Ambiguous words ("Rust", "Go") are only indexed when spelled out
+    ("rustlang", "golang"), so looking them up would miss most postings.
+    """
+    vocab = vocabulary()
+    term = vocab.aliases.get(_phrase(skill))
+    return None if term in vocab.ambiguous_terms else term
+
+
+def title_terms(title: str) -> set[str]:
+    """Normalized words of a job title, without stopwords."""
+    vocab = vocabulary()
+    return {
+        vocab.title_aliases.get(token, token)
+        for token in tokenize(title)
+        if token not in vocab.stopwords
+    }
+
+
+def job_terms(job: dict[str, Any]) -> set[tuple[str, str]]:
+    """``(field, term)`` index entries of a mapped job."""
+    title = job.get("title") or ""
+    terms = {(SKILL, term) for term in skill_terms(f"{title}\n{job.get('description') or ''}")}
+    terms.update((TITLE, term) for term in title_terms(title))
+    return terms
+
+
+def term_params(jobs: Iterable[dict[str, Any]]) -> tuple[list[str], list[str], list[str]]:
+    """Parallel ``(sourceUrl, field, term)`` arrays for :data:`database.INDEX_TERMS_SQL`."""
+    urls: list[str] = []
+    fields: list[str] = []
+    terms: list[str] = []
+    for job in jobs:
+        for field, term in sorted(job_terms(job)):
+            urls.append(job["sourceUrl"])
+            fields.append(field)
+            terms.append(term)
+    return urls, fields, terms
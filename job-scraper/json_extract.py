@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import re
+from collections import Counter
+from typing import Any, Iterator
+from urllib.parse import parse_qsl, urlsplit
+
+# A path into a JSON document; "*" stands for every element of a list
+Path = tuple[Any, ...]
+ANY = "*"
+
+# Container keys that hold the result list, preferred over other values
+LIST_KEYS = ("jobs", "results", "data", "items", "listings", "hits")
+# Ids and hashes in URL paths vary per request; the pattern keeps the rest
+_VOLATILE_SEGMENT = re.compile(r"^(?:\d+|[0-9a-f]{8,}|[0-9a-f-]{32,36})$", re.IGNORECASE)
+# Job-less payloads in a row before a kind of response is skipped unparsed;
+# even then every UNRELATED_RECHECK-th one is looked at again.
+UNRELATED_AFTER = 3
+UNRELATED_RECHECK = 10
+
+
+def url_pattern(url: str) -> str:
+    """``host/path`` of *url* with numeric / hex segments replaced by ``*``."""
+    parts = urlsplit(url)
+    segments = [ANY if _VOLATILE_SEGMENT.match(seg) else seg for seg in parts.path.split("/")]
+    return f"{parts.netloc}{'/'.join(segments)}"
+
+
+def response_kind(url: str) -> str:
+    """:func:`url_pattern` plus the names of the query parameters.
+
+    Tells apart calls on one endpoint that differ only in their query,
+    such as a facet count next to the search itself.
+    """
+    keys = sorted({key for key, _ in parse_qsl(urlsplit(url).query, keep_blank_values=True)})
+    return f"{url_pattern(url)}?{'&'.join(keys)}"
+
+
+def is_job(data: dict[str, Any]) -> bool:
+    return ("company_name" in data or "companyName" in data) and ("title" in data or "name" in data)
+
+
+def find_jobs(data: Any) -> list[tuple[Path, dict[str, Any]]]:
+    """Every job-like object in *data* with its wildcard path, in document order.
+
+    Iterative depth-first walk: a job object is not searched further, and
+    a dict holding one of :data:`LIST_KEYS` as a list is only searched
+    there.
+    """
+    found: list[tuple[Path, dict[str, Any]]] = []
+    stack: list[tuple[Path, Any]] = [((), data)]
+    while stack:
+        path, node = stack.pop()
+        if isinstance(node, dict):
+            if is_job(node):
+                found.append((path, node))
+                continue
+            key = next((k for k in LIST_KEYS if isinstance(node.get(k), list)), None)
+            if key is not None:
+                children = [((*path, key), node[key])]
+            else:
+                children = [((*path, k), v) for k, v in node.items() if isinstance(v, (dict, list))]
+        elif isinstance(node, list):
+            children = [((*path, ANY), item) for item in node]
+        else:
+            continue
+        stack.extend(reversed(children))
+    return found
+
+
+def read_path(data: Any, path: Path) -> Iterator[Any]:
+    """Values at *path* in *data*, expanding ``*`` over list elements."""
+    nodes = [data]
+    for key in path:
+        step: list[Any] = []
+        for node in nodes:
+            if key == ANY:
+                if isinstance(node, list):
+                    step.extend(node)
+            elif isinstance(node, dict) and key in node:
+                step.append(node[key])
+        nodes = step
+        if not nodes:
+            break
+    return iter(nodes)
+
+
+class JsonJobExtractor:
+    """Finds job objects in intercepted API payloads, learning where they live.
+
+    The first payload from a URL pattern is walked in full; the paths that
+    held jobs are cached, and later payloads from that pattern are read at
+    those paths directly (walked again only if they come up empty).  Once
+    :data:`UNRELATED_AFTER` payloads of one :func:`response_kind` in a row
+    held no jobs, :meth:`wants` skips most of its later responses before
+    the body is parsed — not all, so a kind that starts carrying jobs is
+    noticed.
+    """
+
+    def __init__(self) -> None:
+        self._paths: dict[str, list[Path]] = {}
+        self._misses: Counter[str] = Counter()
+        self._skipped: Counter[str] = Counter()
+
+    def wants(self, url: str) -> bool:
+        kind = response_kind(url)
+        if self._misses[kind] < UNRELATED_AFTER:
+            return True
+        self._skipped[kind] += 1
+        return self._skipped[kind] % UNRELATED_RECHECK == 0
+
+    def extract(self, url: str, data: Any) -> list[dict[str, Any]]:
+        kind = response_kind(url)
+        pattern = url_pattern(url)
+        paths = self._paths.get(pattern)
+        if paths:
+            jobs = [job for path in paths for job in read_path(data, path) if isinstance(job, dict) and is_job(job)]
+            if jobs:
+                return jobs
+
+        found = find_jobs(data)
+        if found:
+            self._paths[pattern] = list(dict.fromkeys(path for path, _ in found))
+            self._misses.pop(kind, None)
+            self._skipped.pop(kind, None)
+        elif paths is None:
+            self._misses[kind] += 1
+        return [job for _, job in found]
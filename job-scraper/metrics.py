@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import bisect
+import contextvars
+import json
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+# Upper bounds (seconds) of the timer histogram buckets
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+PROMETHEUS_PREFIX = "scraper_"
+
+# Source the current task works for; set once per scraper run so helpers
+# like ``human_delay`` are attributed without being passed a name.  Code
+# offloaded to an executor doesn't inherit it and passes ``source`` instead.
+current_source: contextvars.ContextVar[str] = contextvars.ContextVar("current_source", default="")
+
+
+class _Histogram:
+    __slots__ = ("counts", "sum", "count", "max")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(BUCKETS) + 1)  # last bucket is +Inf
+        self.sum = 0.0
+        self.count = 0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(BUCKETS, value)] += 1
+        self.sum += value
+        self.count += 1
+        self.max = max(self.max, value)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "mean": round(self.sum / self.count, 6) if self.count else 0.0,
+            "max": round(self.max, 6),
+            "buckets": {str(le): n for le, n in zip((*BUCKETS, "+Inf"), self.counts)},
+        }
+
+
+class Metrics:
+    """Per-source counters and timer histograms for one engine run.
+
+    Timers (``*_seconds``) are histograms over :data:`BUCKETS`; counters
+    (``*_total``) just add up.  Safe to use from worker threads.  Export
+    with :meth:`report` (JSON) or :meth:`prometheus` (text exposition
+    format).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Start a new run: drop everything recorded so far."""
+        with self._lock:
+            self.started_at = time.time()
+            self._counters: dict[tuple[str, str], float] = {}
+            self._timers: dict[tuple[str, str], _Histogram] = {}
+
+    def inc(self, name: str, value: float = 1, source: Optional[str] = None) -> None:
+        key = (name, source if source is not None else current_source.get())
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, seconds: float, source: Optional[str] = None) -> None:
+        key = (name, source if source is not None else current_source.get())
+        with self._lock:
+            hist = self._timers.get(key)
+            if hist is None:
+                hist = self._timers[key] = _Histogram()
+            hist.observe(seconds)
+
+    @contextmanager
+    def timer(self, name: str, source: Optional[str] = None) -> Iterator[None]:
+        """Time the block (success or failure) into histogram *name*."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, source)
+
+    # -- export -------------------------------------------------------------
+
+    def report(self) -> dict[str, Any]:
+        """The run as JSON-ready data, grouped by source."""
+        with self._lock:
+            counters = dict(self._counters)
+            timers = {key: hist.as_dict() for key, hist in self._timers.items()}
+        sources: dict[str, dict[str, Any]] = {}
+        for (name, source), value in counters.items():
+            sources.setdefault(source or "engine", {"counters": {}, "timers": {}})["counters"][name] = value
+        for (name, source), hist in timers.items():
+            sources.setdefault(source or "engine", {"counters": {}, "timers": {}})["timers"][name] = hist
+        for data in sources.values():
+            written = data["counters"].get("jobs_written_total", 0)
+            if written:
+                new = data["counters"].get("jobs_new_total", 0)
+                data["duplicateRatio"] = round(1 - new / written, 4)
+        finished_at = time.time()
+        return {
+            "startedAt": self.started_at,
+            "finishedAt": finished_at,
+            "durationSeconds": round(finished_at - self.started_at, 3),
+            "sources": sources,
+        }
+
+    def prometheus(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        with self._lock:
+            counters = sorted(self._counters.items())
+            timers = sorted(self._timers.items(), key=lambda item: item[0])
+        lines: list[str] = []
+        typed: set[str] = set()
+        for (name, source), value in counters:
+            metric = PROMETHEUS_PREFIX + name
+            if metric not in typed:
+                typed.add(metric)
+                lines.append(f"# TYPE {metric} counter")
+            lines.append(f'{metric}{{source="{source or "engine"}"}} {value:g}')
+        for (name, source), hist in timers:
+            metric = PROMETHEUS_PREFIX + name
+            if metric not in typed:
+                typed.add(metric)
+                lines.append(f"# TYPE {metric} histogram")
+            label = f'source="{source or "engine"}"'
+            cumulative = 0
+            for le, count in zip((*BUCKETS, "+Inf"), hist.counts):
+                cumulative += count
+                lines.append(f'{metric}_bucket{{{label},le="{le}"}} {cumulative}')
+            lines.append(f"{metric}_sum{{{label}}} {hist.sum:.6f}")
+            lines.append(f"{metric}_count{{{label}}} {hist.count}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, directory: Path) -> tuple[Path, Path]:
+        """Write ``run-<timestamp>.json`` and ``metrics.prom`` to *directory*."""
+        directory.mkdir(parents=True, exist_ok=True)
+        stamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime(self.started_at))
+        report_path = directory / f"run-{stamp}.json"
+        report_path.write_text(json.dumps(self.report(), indent=2, sort_keys=True))
+        # Replaced atomically: a textfile collector may be reading it
+        prom_path = directory / "metrics.prom"
+        tmp_path = prom_path.with_suffix(".prom.tmp")
+        tmp_path.write_text(self.prometheus())
+        tmp_path.replace(prom_path)
+        return report_path, prom_path
+
+
+# The current run's metrics
+METRICS = Metrics()
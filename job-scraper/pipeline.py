@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterable, Iterable
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Union
+
+from database import JobBatcher
+from utils import PIPELINE_QUEUE_SIZE, logger
+
+_DONE = object()
+
+
+@dataclass
+class Stage:
+    """One step of a :func:`run_pipeline` chain.
+
+    *fn* receives one item and returns the item for the next stage, or
+    ``None`` to drop it.  Async functions run on the event loop with
+    *workers* concurrent copies; with ``offload=True`` a plain function runs
+    in *executor* (default: the loop's thread pool) so CPU-bound parsing
+    never blocks network I/O.
+
+    With ``batch_size > 1`` *fn* takes a list of up to that many queued
+    items instead and returns one result per item, where an ``Exception``
+    instance drops that item with a warning.
+    """
+
+    name: str
+    fn: Callable[[Any], Any]
+    workers: int = 1
+    offload: bool = False
+    executor: Optional[Executor] = None
+    batch_size: int = 1
+
+
+async def _feed(items: Union[Iterable[Any], AsyncIterable[Any]], out_q: asyncio.Queue, consumers: int) -> None:
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            await out_q.put(item)
+    else:
+        for item in items:
+            await out_q.put(item)
+    for _ in range(consumers):
+        await out_q.put(_DONE)
+
+
+async def _run_stage(stage: Stage, in_q: asyncio.Queue, out_q: asyncio.Queue, consumers: int) -> None:
+    loop = asyncio.get_running_loop()
+
+    async def call(arg: Any) -> Any:
+        if stage.offload:
+            return await loop.run_in_executor(stage.executor, stage.fn, arg)
+        return await stage.fn(arg)
+
+    async def worker() -> None:
+        while True:
+            item = await in_q.get()
+            if item is _DONE:
+                return
+            if stage.batch_size <= 1:
+                try:
+                    result = await call(item)
+                except Exception as exc:
+                    logger.warning("  ⚠  %s stage dropped an item: %s", stage.name, exc)
+                    continue
+                if result is not None:
+                    await out_q.put(result)
+                continue
+
+            # Batch whatever is already queued: no waiting for stragglers,
+            # so batches only grow when this stage is the bottleneck.
+            batch, done = [item], False
+            while len(batch) < stage.batch_size and not in_q.empty():
+                item = in_q.get_nowait()
+                if item is _DONE:
+                    done = True
+                    break
+                batch.append(item)
+            try:
+                results = await call(batch)
+            except Exception as exc:
+                logger.warning("  ⚠  %s stage dropped %d items: %s", stage.name, len(batch), exc)
+                results = []
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.warning("  ⚠  %s stage dropped an item: %s", stage.name, result)
+                elif result is not None:
+                    await out_q.put(result)
+            if done:
+                return
+
+    await asyncio.gather(*(worker() for _ in range(max(1, stage.workers))))
+    for _ in range(consumers):
+        await out_q.put(_DONE)
+
+
+async def _write(in_q: asyncio.Queue, batcher: JobBatcher) -> int:
+    inserted = 0
+    while True:
+        job = await in_q.get()
+        if job is _DONE:
+            return inserted + await batcher.flush()
+        inserted += await batcher.add(job)
+
+
+async def run_pipeline(
+    items: Union[Iterable[Any], AsyncIterable[Any]],
+    stages: list[Stage],
+    batcher: JobBatcher,
+    queue_size: int = PIPELINE_QUEUE_SIZE,
+) -> int:
+    """Stream *items* through *stages* into *batcher*; returns rows inserted.
+
+    Stages are linked by bounded ``asyncio.Queue``s, so a slow stage
+    applies backpressure upstream while fetching, parsing and DB writes
+    overlap instead of adding up.
+    """
+    queues = [asyncio.Queue(maxsize=queue_size) for _ in range(len(stages) + 1)]
+    consumers = [max(1, stage.workers) for stage in stages] + [1]
+
+    tasks = [asyncio.create_task(_feed(items, queues[0], consumers[0]))]
+    for idx, stage in enumerate(stages):
+        tasks.append(asyncio.create_task(_run_stage(stage, queues[idx], queues[idx + 1], consumers[idx + 1])))
+    writer = asyncio.create_task(_write(queues[-1], batcher))
+    tasks.append(writer)
+
+    # Any task failing stops the rest: a dead writer would otherwise leave
+    # the stages blocked on a full queue forever
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        for task in done:
+            task.result()
+        return writer.result()
+    finally:
+        for task in tasks:
+            task.cancel()
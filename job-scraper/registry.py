@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+from functools import partial
+from typing import Any, AsyncIterable, Awaitable, Callable, Iterable, Optional, TypeVar, Union
+
+from playwright.async_api import Page
+
+import cpu_pool
+from async_database import AnyDatabase
+from browser import PagePool
+from database import JobBatcher, db_call
+from dedupe import NearDuplicateIndex, dedupe_stages
+from frontier import CrawlFrontier
+from http_client import FetchError, HttpFetcher
+from metrics import METRICS, current_source
+from pipeline import Stage, run_pipeline
+from utils import CrawlBudget, HostThrottle, RetryPolicy, logger
+
+T = TypeVar("T")
+
+
+class BaseScraper:
+    """Common interface of every job source.
+
+    A scrape is ``list_jobs`` → ``enrich`` → ``map_job`` → write:
+
+    * :meth:`list_jobs` collects the source's items (listing cards, API
+      objects, …) — either all at once or as an async iterator, so detail
+      fetches start while later listing pages are still loading;
+    * :meth:`enrich` runs on the event loop per item, e.g. to fetch a detail
+      page (optional);
+    * :meth:`map_job` turns an item into a ``scraped_jobs`` row in a worker
+      thread (``None`` drops it) — or, with ``SCRAPER_CPU_WORKERS`` set, the
+      module-level function from :meth:`cpu_map` does so in batches in
+      worker processes;
+    * :meth:`finish` runs after the last row is written.
+
+    Subclasses set ``NAME`` (the ``--source`` key), ``SOURCE_SITE``,
+    ``REQUIRES_BROWSER`` and ``SCHEDULE_HOURS`` (the default crawl interval
+    used by :class:`scheduler.AdaptiveScheduler`), and are added to
+    :data:`REGISTRY` with :func:`register`.  ``budget`` caps how much of
+    the source one run may crawl; ``throttle`` paces its requests per host
+    and ``retry`` says how often a transient failure is tried again.  With
+    a ``frontier`` the crawl's progress is persisted: sources pass new work
+    through :meth:`claim` and start with :meth:`resume_items`, so an
+    interrupted crawl is picked up where it stopped.  With a *shared*
+    frontier the listing walk only records what it finds; workers lease
+    those items in chunks and pass them to :meth:`scrape`.
+    """
+
+    NAME = ""
+    SOURCE_SITE = ""
+    REQUIRES_BROWSER = False
+    SCHEDULE_HOURS = 4.0
+
+    def __init__(
+        self,
+        page: Optional[Page],
+        db: AnyDatabase,
+        pool: Optional[PagePool] = None,
+        throttle: Optional[HostThrottle] = None,
+        http: Optional[HttpFetcher] = None,
+        dedupe: Optional[NearDuplicateIndex] = None,
+        budget: Optional[CrawlBudget] = None,
+        retry: Optional[RetryPolicy] = None,
+        frontier: Optional[CrawlFrontier] = None,
+    ) -> None:
+        self.page = page
+        self.db = db
+        self.pool = pool
+        self.http = http
+        self.throttle = throttle or HostThrottle()
+        self.dedupe = dedupe
+        self.budget = budget or CrawlBudget()
+        self.retry = retry or RetryPolicy()
+        self.frontier = frontier
+        self._claimed: set[str] = set()  # frontier keys this run has taken
+        # Stored postings whose reposts under a new URL were dropped as near-duplicates
+        self.reposted: set[str] = set()
+        self.batcher = JobBatcher(
+            db, source=self.NAME,
+            on_flush=frontier.complete if frontier else None,
+            on_error=frontier.release_all if frontier else None,
+        )
+
+    def list_jobs(self) -> Union[Awaitable[Iterable[Any]], AsyncIterable[Any]]:
+        raise NotImplementedError
+
+    async def enrich(self, item: Any) -> Any:
+        return item
+
+    def map_job(self, item: Any) -> Optional[dict[str, Any]]:
+        raise NotImplementedError
+
+    async def finish(self) -> None:
+        pass
+
+    def enrich_workers(self) -> int:
+        return 1
+
+    def frontier_item(self, payload: Any) -> Any:
+        """The pipeline item for a *payload* leased from the frontier."""
+        return payload
+
+    async def claim(self, items: list[T], key: Callable[[T], str]) -> list[T]:
+        """The *items* to queue, cut to the budget.
+
+        With a frontier, items finished or in flight elsewhere — or taken
+        by this run already — are left out.  *key* gives an item's
+        ``sourceUrl``, so it counts as done as soon as its row is written.
+        A shared frontier gets all of them and none are queued here.
+        """
+        if self.frontier and self.frontier.shared:
+            items = items[:self.budget.take_jobs(len(items))]
+            await self.frontier.add(items, key)
+            return []
+        if self.frontier:
+            items = [item for item in items if key(item) not in self._claimed]
+        items = items[:self.budget.jobs_left]
+        if self.frontier:
+            items = await self.frontier.claim(items, key)
+            self._claimed.update(key(item) for item in items)
+        return items[:self.budget.take_jobs(len(items))]
+
+    async def resume_items(self, key: Callable[[Any], str]) -> list[Any]:
+        """Items an interrupted crawl left unfinished, leased to this run."""
+        if not self.frontier or self.frontier.shared:
+            return []
+        items = await self.frontier.resume(self.budget.jobs_left)
+        self._claimed.update(key(item) for item in items)
+        self.budget.take_jobs(len(items))
+        if items:
+            logger.info("Resuming %d unfinished items of an interrupted crawl.", len(items))
+        return items
+
+    async def retry_later(self, error: FetchError, attempt: int) -> bool:
+        """Back off before trying again after *error* on try *attempt* (from 0).
+
+        Returns ``False`` straight away if the failure isn't transient or
+        the tries are used up.  A server's ``Retry-After`` is honoured.
+        """
+        if not error.retryable or attempt + 1 >= self.retry.attempts:
+            return False
+        delay = max(self.retry.delay(attempt), error.retry_after or 0.0)
+        logger.info("  ↻ %s — try %d of %d in %.1fs", error, attempt + 2, self.retry.attempts, delay)
+        METRICS.inc("fetch_retries_total")
+        with METRICS.timer("retry_backoff_seconds"):
+            await asyncio.sleep(delay)
+        return True
+
+    async def _keep_reposted(self) -> None:
+        # A dropped repost is a sighting of the posting it repeats: keep that
+        # one listed, or the listing sync retires it once its own URL is gone
+        # (after the sync, so a complete walk can't undo it).
+        if self.reposted:
+            await db_call(self.db.touch_listed, sorted(self.reposted))
+
+    def cpu_map(self) -> Optional[Callable[[Any], Optional[dict[str, Any]]]]:
+        """Picklable function doing exactly what :meth:`map_job` does.
+
+        Used by the process-pool mode; ``None`` keeps mapping in a thread.
+        """
+        return None
+
+    def _timed_map(self, item: Any) -> Optional[dict[str, Any]]:
+        # Runs in a worker thread, outside the run's context
+        with METRICS.timer("map_seconds", self.NAME):
+            return self.map_job(item)
+
+    async def _map_batch(self, fn: Callable[[Any], Any], items: list[Any]) -> list[Any]:
+        outcomes = await asyncio.get_running_loop().run_in_executor(
+            cpu_pool.process_pool(), cpu_pool.map_batch, fn, items,
+        )
+        results: list[Any] = []
+        for row, error, seconds in outcomes:
+            METRICS.observe("map_seconds", seconds)
+            results.append(RuntimeError(error) if error is not None else row)
+        return results
+
+    def _map_stage(self) -> Stage:
+        fn = self.cpu_map() if cpu_pool.enabled() else None
+        if fn is None:
+            return Stage("map", self._timed_map, offload=True)
+        # One batch in flight per worker process
+        return Stage(
+            "map", partial(self._map_batch, fn),
+            workers=cpu_pool.CPU_WORKERS, batch_size=cpu_pool.CPU_BATCH_SIZE,
+        )
+
+    async def scrape(self, items: Union[Iterable[Any], AsyncIterable[Any], None] = None) -> int:
+        """Run the full scrape pipeline.  Returns count of new rows inserted.
+
+        *items*, if given, are processed instead of what :meth:`list_jobs` finds.
+        """
+        name = type(self).__name__
+        logger.info("━━  %s  ━━  starting …", name)
+        token = current_source.set(self.NAME)
+        try:
+            with METRICS.timer("scrape_seconds"):
+                if items is None:
+                    items = self.list_jobs()
+                if inspect.isawaitable(items):
+                    items = await items
+                stages = [self._map_stage(), *dedupe_stages(self.dedupe, self.NAME, self.reposted.add)]
+                if type(self).enrich is not BaseScraper.enrich:
+                    stages.insert(0, Stage("enrich", self.enrich, workers=self.enrich_workers()))
+                inserted = await run_pipeline(items, stages, self.batcher)
+                await self.finish()
+                await self._keep_reposted()
+                if self.frontier:
+                    await self.frontier.finish()
+        finally:
+            current_source.reset(token)
+
+        logger.info("━━  %s  ━━  done.  Inserted %d new jobs.", name, inserted)
+        return inserted
+
+
+# Every known source by ``NAME``, in registration order
+REGISTRY: dict[str, type[BaseScraper]] = {}
+
+
+def register(cls: type[BaseScraper]) -> type[BaseScraper]:
+    """Class decorator adding a scraper to :data:`REGISTRY`."""
+    if not cls.NAME:
+        raise ValueError(f"{cls.__name__} needs a NAME to be registered.")
+    REGISTRY[cls.NAME] = cls
+    return cls
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Any, Optional
+
+# Hours / days / … per year used to annualize a wage
+PERIOD_FACTORS: dict[str, int] = {
+    "hour": 2080,
+    "day": 260,
+    "week": 52,
+    "month": 12,
+    "year": 1,
+}
+
+_PERIOD_WORDS: list[tuple[str, re.Pattern[str]]] = [
+    ("hour", re.compile(r"\b(?:hour|hr|hourly|h)\b")),
+    ("day", re.compile(r"\b(?:day|daily)\b")),
+    ("week", re.compile(r"\b(?:week|wk|weekly)\b")),
+    ("month", re.compile(r"\b(?:month|mo|monthly)\b")),
+    ("year", re.compile(r"\b(?:year|yr|annum|annually|annual|pa|p\.a)\b")),
+]
+
+# Longest symbols first so "CA$" wins over "$"
+_CURRENCY_SYMBOLS: list[tuple[str, str]] = [
+    ("CA$", "CAD"), ("AU$", "AUD"), ("C$", "CAD"), ("A$", "AUD"),
+    ("US$", "USD"), ("$", "USD"), ("€", "EUR"), ("£", "GBP"), ("₹", "INR"),
+]
+_CURRENCY_CODES = re.compile(r"(?<![a-z])(USD|EUR|GBP|CAD|AUD|INR|CHF)(?![a-z])", re.IGNORECASE)
+
+# A number with optional thousands separators / decimals and a "k" suffix
+_AMOUNT = re.compile(r"(\d[\d,]*(?:\.\d+)*)\s*(k\b)?", re.IGNORECASE)
+# "4.500" / "1.250.000": dots used as thousands separators
+_DOT_THOUSANDS = re.compile(r"\d{1,3}(?:\.\d{3})+")
+
+# Without an explicit period, guess it from the magnitude of the lower bound
+_HOURLY_BELOW = 500
+_MONTHLY_BELOW = 20_000
+
+# Yearly amounts outside this band aren't pay (a funding round, a typo) and
+# must never reach wageAnnualized, a 32-bit integer column.  Wide enough for
+# currencies like INR.
+_ANNUALIZED_MIN = 100
+_ANNUALIZED_MAX = 100_000_000
+
+
+@dataclass(frozen=True)
+class SalaryRange:
+    min: float
+    max: float
+    currency: Optional[str]  # ISO 4217 code
+    period: str  # one of PERIOD_FACTORS
+    annualized: int  # midpoint converted to a yearly amount
+
+
+def parse_wage(wage: Optional[str]) -> Optional[SalaryRange]:
+    """Parse a free-form wage such as ``"$55/hr"`` or ``"USD 120000–150000"``.
+
+    Returns ``None`` when no amount can be found, or when the yearly amount
+    isn't a plausible salary.  Currency defaults to USD
+    only for a bare ``$``; the period is inferred from magnitude when the
+    text doesn't name one.
+    """
+    if not wage:
+        return None
+    amounts = [_to_number(num) * (1000 if k else 1) for num, k in _AMOUNT.findall(wage)]
+    amounts = [amount for amount in amounts if amount > 0][:2]
+    if not amounts:
+        return None
+    lo, hi = min(amounts), max(amounts)
+
+    lowered = wage.lower()
+    period = next((name for name, pattern in _PERIOD_WORDS if pattern.search(lowered)), None)
+    if period is None:
+        period = "hour" if lo < _HOURLY_BELOW else "month" if lo < _MONTHLY_BELOW else "year"
+
+    code = _CURRENCY_CODES.search(wage)
+    if code:
+        currency: Optional[str] = code.group(1).upper()
+    else:
+        currency = next((iso for symbol, iso in _CURRENCY_SYMBOLS if symbol in wage), None)
+
+    annualized = round((lo + hi) / 2 * PERIOD_FACTORS[period])
+    if not _ANNUALIZED_MIN <= annualized <= _ANNUALIZED_MAX:
+        return None
+    return SalaryRange(lo, hi, currency, period, annualized)
+
+
+def _to_number(num: str) -> float:
+    num = num.replace(",", "")
+    if _DOT_THOUSANDS.fullmatch(num):
+        num = num.replace(".", "")
+    try:
+        return float(num)
+    except ValueError:  # e.g. "1.2.3"
+        return 0.0
+
+
+def wage_columns(wage: Optional[str]) -> dict[str, Any]:
+    """The structured ``scraped_jobs`` wage columns for a raw *wage* string."""
+    parsed = parse_wage(wage)
+    if parsed is None:
+        return {"wageMin": None, "wageMax": None, "wageCurrency": None, "wagePeriod": None, "wageAnnualized": None}
+    return {
+        "wageMin": parsed.min,
+        "wageMax": parsed.max,
+        "wageCurrency": parsed.currency,
+        "wagePeriod": parsed.period,
+        "wageAnnualized": parsed.annualized,
+    }
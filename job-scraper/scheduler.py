@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional
+
+from http_cache import CACHE_DIR
+from utils import logger
+
+# Adaptive crawl frequency: a source's interval shrinks while runs keep
+# yielding new jobs and grows while they don't, within these bounds.
+SCHEDULE_MIN_HOURS = float(os.getenv("SCRAPER_SCHEDULE_MIN_HOURS", "1"))
+SCHEDULE_MAX_HOURS = float(os.getenv("SCRAPER_SCHEDULE_MAX_HOURS", "24"))
+# New rows per run that justify the current interval
+SCHEDULE_TARGET_YIELD = float(os.getenv("SCRAPER_SCHEDULE_TARGET_YIELD", "3"))
+# Weight of the latest run in the smoothed yield
+SCHEDULE_SMOOTHING = 0.5
+# Cron runs are not exactly on time; a source due within this window runs now
+SCHEDULE_SLACK_SECONDS = 10 * 60
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS sources (
+    name            TEXT PRIMARY KEY,
+    interval_hours  REAL NOT NULL,
+    yield_avg       REAL NOT NULL,
+    next_run_at     REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS runs (
+    name         TEXT NOT NULL,
+    started_at   REAL NOT NULL,
+    finished_at  REAL NOT NULL,
+    inserted     INTEGER NOT NULL,
+    ok           INTEGER NOT NULL
+);
+"""
+
+
+class AdaptiveScheduler:
+    """Per-source crawl schedule driven by each run's new-row yield.
+
+    Every run is recorded.  After a successful run the source's smoothed
+    yield is updated and its interval scaled by ``target / yield`` (at most
+    halved or doubled per run, clamped to ``[min_hours, max_hours]``), so
+    sources that keep producing new jobs are crawled more often and idle
+    ones back off.  State lives in SQLite next to the HTTP cache.
+    """
+
+    def __init__(
+        self,
+        path: Path = CACHE_DIR / "schedule.sqlite3",
+        min_hours: float = SCHEDULE_MIN_HOURS,
+        max_hours: float = SCHEDULE_MAX_HOURS,
+        target_yield: float = SCHEDULE_TARGET_YIELD,
+    ) -> None:
+        self.path = Path(path)
+        self.min_hours = min_hours
+        self.max_hours = max(min_hours, max_hours)
+        self.target_yield = target_yield
+        self._conn: Optional[sqlite3.Connection] = None
+
+    # -- lifecycle ----------------------------------------------------------
+
+    def open(self) -> None:
+        if self._conn is not None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.executescript(SCHEMA_SQL)
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    # -- schedule -----------------------------------------------------------
+
+    def _state(self, name: str, default_hours: float) -> tuple[float, float, float]:
+        """``(interval_hours, yield_avg, next_run_at)``; new sources are due now."""
+        self.open()
+        row = self._conn.execute(  # type: ignore[union-attr]
+            "SELECT interval_hours, yield_avg, next_run_at FROM sources WHERE name = ?", (name,),
+        ).fetchone()
+        if row is None:
+            return self._clamp(default_hours), self.target_yield, 0.0
+        return row
+
+    def _clamp(self, hours: float) -> float:
+        return min(self.max_hours, max(self.min_hours, hours))
+
+    def is_due(self, name: str, default_hours: float, now: Optional[float] = None) -> bool:
+        now = time.time() if now is None else now
+        _, _, next_run_at = self._state(name, default_hours)
+        return next_run_at <= now + SCHEDULE_SLACK_SECONDS
+
+    def record(self, name: str, default_hours: float, started_at: float, inserted: int, ok: bool = True) -> None:
+        """Store a finished run and reschedule the source."""
+        finished_at = time.time()
+        interval, yield_avg, _ = self._state(name, default_hours)
+        if ok:
+            yield_avg = SCHEDULE_SMOOTHING * inserted + (1 - SCHEDULE_SMOOTHING) * yield_avg
+            factor = self.target_yield / max(yield_avg, 0.1)
+            interval = self._clamp(interval * min(2.0, max(0.5, factor)))
+        # A failed run keeps its interval: no evidence either way
+        next_run_at = finished_at + interval * 3600
+        with self._conn:  # type: ignore[union-attr]
+            self._conn.execute(  # type: ignore[union-attr]
+                "INSERT INTO runs VALUES (?, ?, ?, ?, ?)",
+                (name, started_at, finished_at, inserted, int(ok)),
+            )
+            self._conn.execute(  # type: ignore[union-attr]
+                "INSERT OR REPLACE INTO sources VALUES (?, ?, ?, ?)",
+                (name, interval, yield_avg, next_run_at),
+            )
+        logger.info(
+            "Schedule: %s yielded %d (avg %.1f) — next run in %.1fh.",
+            name, inserted, yield_avg, interval,
+        )
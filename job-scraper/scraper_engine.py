@@ -1,60 +1,669 @@
 from __future__ import annotations
 
+import argparse
 import asyncio
+import json
+import os
+import signal
 import sys
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import AsyncIterator, Callable, Optional, Union
 
-from playwright.async_api import async_playwright
+from playwright.async_api import Page, async_playwright
 
-from browser import StealthBrowser
-from database import DatabaseManager
-from scrapers import PythonOrgScraper, SimplifyJobsScraper
-from utils import human_delay, logger
+import cpu_pool
+from browser import ContextPool, PagePool, PooledContext, StealthBrowser
+from async_database import AnyDatabase, AsyncDatabaseManager
+from database import DatabaseManager, db_call
+from dedupe import NEAR_DUP_ENABLED, NearDuplicateIndex
+from frontier import FRONTIER_CHUNK, FRONTIER_ENABLED, CrawlFrontier, active_crawls
+from http_cache import CACHE_DIR, ResponseCache
+from http_client import HttpFetcher
+from metrics import METRICS
+from registry import REGISTRY, BaseScraper
+from scheduler import AdaptiveScheduler
+import scrapers  # noqa: F401  (registers the built-in sources)
+from utils import MAX_CONCURRENCY, HostThrottle, logger
 
+ENGINE_MODES = ("sequential", "concurrent")
+ENGINE_ROLES = ("standalone", "coordinator", "worker")
+COORDINATOR_STEPS = ("all", "enqueue", "record")
+DB_BACKENDS = ("sync", "async")
 
-async def main() -> None:
-    logger.info("═══════════════════════════════════════════════════════════")
-    logger.info("  Job Scraper Engine — starting run")
-    logger.info("═══════════════════════════════════════════════════════════")
+# Set SCRAPER_HTTP_TIER=0 to force every source through the browser
+HTTP_TIER_ENABLED = os.getenv("SCRAPER_HTTP_TIER", "1") != "0"
+# Set SCRAPER_HTTP_CACHE=0 to disable conditional requests / unchanged-page skipping
+HTTP_CACHE_ENABLED = os.getenv("SCRAPER_HTTP_CACHE", "1") != "0"
+# Per-run JSON reports and the Prometheus textfile land here
+METRICS_DIR = Path(os.getenv("SCRAPER_METRICS_DIR", CACHE_DIR / "metrics"))
+# Daemon mode: how often the long-lived process checks which sources are due
+DAEMON_POLL_SECONDS = float(os.getenv("SCRAPER_DAEMON_POLL_SECONDS", "300"))
+# Sharded runs: how often coordinator and idle workers look at the queue
+SHARD_POLL_SECONDS = float(os.getenv("SCRAPER_SHARD_POLL_SECONDS", "10"))
+# A worker exits once the queue has been empty this long with no crawl
+# left running; the grace lets workers start before the coordinator.
+SHARD_IDLE_SECONDS = float(os.getenv("SCRAPER_SHARD_IDLE_SECONDS", "120"))
+# How long the coordinator waits for its crawls before recording them as failed
+SHARD_WAIT_SECONDS = float(os.getenv("SCRAPER_SHARD_WAIT_SECONDS", "3600"))
+# What the enqueue step hands to the record step: the queued sources and when
+QUEUED_PATH = Path(os.getenv("SCRAPER_QUEUED_PATH", CACHE_DIR / "queued.json"))
+
+SOURCES = REGISTRY
+
+
+@dataclass
+class RunContext:
+    """Everything the sources of one engine run share."""
+
+    db: AnyDatabase
+    http: HttpFetcher
+    throttle: HostThrottle = field(default_factory=HostThrottle)
+    dedupe: Optional[NearDuplicateIndex] = None
+    scheduler: Optional[AdaptiveScheduler] = None
+    # Daemon mode: warm contexts to borrow instead of launching a browser
+    contexts: Optional[ContextPool] = None
+    # Persist each source's crawl progress so an interrupted run resumes
+    resumable: bool = FRONTIER_ENABLED
+
+
+def needs_browser(scraper_cls: type[BaseScraper]) -> bool:
+    return scraper_cls.REQUIRES_BROWSER or not HTTP_TIER_ENABLED
 
-    db = DatabaseManager()
+
+def make_scraper(
+    scraper_cls: type[BaseScraper],
+    ctx: RunContext,
+    page: Optional[Page],
+    pool: Optional[PagePool] = None,
+    frontier: Optional[CrawlFrontier] = None,
+) -> BaseScraper:
+    """Build a scraper for the tier it needs: plain HTTP or a browser page."""
+    if frontier is None and ctx.resumable:
+        frontier = CrawlFrontier(ctx.db, scraper_cls.NAME)
+    if not needs_browser(scraper_cls):
+        return scraper_cls(
+            None, ctx.db, throttle=ctx.throttle, http=ctx.http, dedupe=ctx.dedupe, frontier=frontier,
+        )
+    return scraper_cls(page, ctx.db, pool=pool, throttle=ctx.throttle, dedupe=ctx.dedupe, frontier=frontier)
+
+
+async def run_scraper(
+    scraper_cls: type[BaseScraper],
+    ctx: RunContext,
+    build: Callable[[], BaseScraper],
+) -> int:
+    """Run one scraper, logging (not raising) any failure; records the run."""
+    started_at = time.time()
+    ok = True
     try:
-        db.connect()
-    except Exception:
-        logger.critical("Cannot proceed without database. Exiting.")
-        sys.exit(1)
+        inserted = await build().scrape()
+    except Exception as exc:
+        logger.error("%s failed: %s", scraper_cls.__name__, exc, exc_info=True)
+        inserted, ok = 0, False
+    if ctx.scheduler is not None:
+        ctx.scheduler.record(scraper_cls.NAME, scraper_cls.SCHEDULE_HOURS, started_at, inserted, ok)
+    return inserted
 
-    total_inserted = 0
 
+@asynccontextmanager
+async def browser_session(ctx: RunContext) -> AsyncIterator[Union[StealthBrowser, PooledContext]]:
+    """A browser to run sources in: a borrowed warm context, or a fresh launch."""
+    if ctx.contexts is not None:
+        async with ctx.contexts.borrow() as session:
+            yield session
+        return
     async with async_playwright() as pw:
         stealth = StealthBrowser(pw)
         try:
-            page = await stealth.launch()
+            await stealth.launch()
+            yield stealth
+        finally:
+            await stealth.close()
+
+
+@asynccontextmanager
+async def source_page(ctx: RunContext, browser: bool) -> AsyncIterator[Optional[Page]]:
+    """A browser page if *browser*, else ``None`` for the HTTP tier."""
+    if not browser:
+        yield None
+        return
+    async with browser_session(ctx) as session:
+        yield session.page
+
+
+async def run_sequential(ctx: RunContext, sources: list[type[BaseScraper]]) -> int:
+    """Run every source one after the other.
+
+    HTTP-tier sources run first; Playwright is only launched if at least
+    one remaining source needs a browser, and those share a single page.
+    """
+    total_inserted = 0
+
+    for cls in (c for c in sources if not needs_browser(c)):
+        total_inserted += await run_scraper(cls, ctx, lambda: make_scraper(cls, ctx, None))
+
+    browser_sources = [c for c in sources if needs_browser(c)]
+    if not browser_sources:
+        return total_inserted
+
+    async with browser_session(ctx) as session:
+        page = session.page
+        for cls in browser_sources:
+            total_inserted += await run_scraper(cls, ctx, lambda: make_scraper(cls, ctx, page))
+
+    return total_inserted
+
+
+async def run_concurrent(ctx: RunContext, sources: list[type[BaseScraper]]) -> int:
+    """Run every source at the same time.
+
+    HTTP-tier sources run alongside the browser ones; browser sources each
+    hold one page from a shared pool and borrow more for detail visits.
+    Politeness is enforced per host, so sources on different hosts never
+    wait on each other.
+    """
+
+    async def run_browser_sources(browser_sources: list[type[BaseScraper]]) -> int:
+        async with browser_session(ctx) as session:
+            # Leave at least one page free for detail visits beyond the listing pages
+            pool = session.page_pool(max(MAX_CONCURRENCY, len(browser_sources) + 1))
+            logger.info("Concurrent mode: %d browser sources, %d pages.", len(browser_sources), pool.size)
+
+            async def run_on_pool_page(cls: type[BaseScraper]) -> int:
+                async with pool.page() as page:
+                    return await run_scraper(cls, ctx, lambda: make_scraper(cls, ctx, page, pool))
+
+            results = await asyncio.gather(*(run_on_pool_page(c) for c in browser_sources))
+            return sum(results)
+
+    tasks = [
+        run_scraper(cls, ctx, lambda cls=cls: make_scraper(cls, ctx, None))
+        for cls in sources if not needs_browser(cls)
+    ]
+    browser_sources = [c for c in sources if needs_browser(c)]
+    if browser_sources:
+        tasks.append(run_browser_sources(browser_sources))
+
+    results = await asyncio.gather(*tasks)
+    return sum(results)
+
+
+def due_sources(scheduler: AdaptiveScheduler, sources: list[type[BaseScraper]]) -> list[type[BaseScraper]]:
+    due = [cls for cls in sources if scheduler.is_due(cls.NAME, cls.SCHEDULE_HOURS)]
+    logger.info("Scheduled run: %d of %d sources due (%s).",
+                len(due), len(sources), ", ".join(cls.NAME for cls in due) or "none")
+    return due
+
+
+async def run_sources(ctx: RunContext, mode: str, sources: list[type[BaseScraper]]) -> int:
+    if mode == "concurrent":
+        return await run_concurrent(ctx, sources)
+    return await run_sequential(ctx, sources)
+
+
+async def connect_or_exit(db_backend: str) -> AnyDatabase:
+    db: AnyDatabase = AsyncDatabaseManager() if db_backend == "async" else DatabaseManager()
+    try:
+        await db_call(db.connect)
+    except Exception:
+        logger.critical("Cannot proceed without database. Exiting.")
+        sys.exit(1)
+    return db
+
+
+def make_context(db: AnyDatabase, scheduler: Optional[AdaptiveScheduler]) -> RunContext:
+    return RunContext(
+        db=db,
+        http=HttpFetcher(cache=ResponseCache() if HTTP_CACHE_ENABLED else None),
+        dedupe=NearDuplicateIndex() if NEAR_DUP_ENABLED else None,
+        scheduler=scheduler,
+    )
+
+
+async def close_context(ctx: RunContext) -> None:
+    await ctx.http.close()
+    if ctx.dedupe is not None:
+        ctx.dedupe.close()
+    if ctx.scheduler is not None:
+        ctx.scheduler.close()
+
+
+async def main(
+    mode: str = "sequential",
+    source_names: Optional[list[str]] = None,
+    db_backend: str = "sync",
+    scheduled: bool = False,
+) -> None:
+    sources = [SOURCES[name] for name in (source_names or SOURCES)]
+
+    logger.info("═══════════════════════════════════════════════════════════")
+    logger.info("  Job Scraper Engine — starting run (%s)", mode)
+    logger.info("═══════════════════════════════════════════════════════════")
+
+    scheduler = AdaptiveScheduler()
+    if scheduled:
+        sources = due_sources(scheduler, sources)
+        if not sources:
+            scheduler.close()
+            return
+
+    db = await connect_or_exit(db_backend)
+    ctx = make_context(db, scheduler)
+    try:
+        await cpu_pool.start()
+        total_inserted = await run_sources(ctx, mode, sources)
+    finally:
+        await close_context(ctx)
+        cpu_pool.shutdown()
+
+    await db_call(db.close)
+
+    logger.info("═══════════════════════════════════════════════════════════")
+    logger.info("  Run complete — %d new jobs inserted in total.", total_inserted)
+    log_metrics()
+    logger.info("═══════════════════════════════════════════════════════════")
+
 
-            # Source 1: Python.org
+async def daemon(
+    mode: str = "sequential",
+    source_names: Optional[list[str]] = None,
+    db_backend: str = "sync",
+    poll_seconds: float = DAEMON_POLL_SECONDS,
+) -> None:
+    """Stay up and run sources as the adaptive schedule makes them due.
+
+    One Chromium and a warm :class:`ContextPool` live for the whole process,
+    as do the database connection, HTTP client and caches, so a scheduled
+    run borrows a context instead of cold-starting a browser.  Each cycle
+    that runs something gets its own metrics export.  Stops cleanly on
+    SIGTERM / SIGINT.
+    """
+    sources = [SOURCES[name] for name in (source_names or SOURCES)]
+
+    logger.info("═══════════════════════════════════════════════════════════")
+    logger.info("  Job Scraper Engine — daemon (%s), polling every %.0fs", mode, poll_seconds)
+    logger.info("═══════════════════════════════════════════════════════════")
+
+    stop = stop_on_signals()
+    db = await connect_or_exit(db_backend)
+    ctx = make_context(db, AdaptiveScheduler())
+    try:
+        await cpu_pool.start()
+        async with async_playwright() as pw:
+            if any(needs_browser(cls) for cls in sources):
+                ctx.contexts = ContextPool(pw)
+                await ctx.contexts.start()
             try:
-                python_scraper = PythonOrgScraper(page, db)
-                total_inserted += await python_scraper.scrape()
-            except Exception as exc:
-                logger.error("PythonOrgScraper failed: %s", exc, exc_info=True)
+                while not stop.is_set():
+                    due = due_sources(ctx.scheduler, sources)  # type: ignore[arg-type]
+                    if due:
+                        METRICS.reset()
+                        try:
+                            await db_call(db.connect)  # reopens a dropped connection
+                            total_inserted = await run_sources(ctx, mode, due)
+                        except Exception as exc:
+                            logger.error("Daemon cycle failed: %s", exc, exc_info=True)
+                        else:
+                            logger.info("  Cycle complete — %d new jobs inserted.", total_inserted)
+                            log_metrics()
+                    try:
+                        await asyncio.wait_for(stop.wait(), poll_seconds)
+                    except asyncio.TimeoutError:
+                        pass
+            finally:
+                if ctx.contexts is not None:
+                    await ctx.contexts.close()
+    finally:
+        await close_context(ctx)
+        cpu_pool.shutdown()
+        await db_call(db.close)
+    logger.info("Daemon stopped.")
+
+
+def stop_on_signals() -> asyncio.Event:
+    """An event set by SIGTERM / SIGINT."""
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, stop.set)
+    return stop
+
+
+# -- sharded runs ------------------------------------------------------------
+
+def items_need_browser(scraper_cls: type[BaseScraper]) -> bool:
+    # Queued items only need a page if the source fetches something per item
+    return needs_browser(scraper_cls) and scraper_cls.enrich is not BaseScraper.enrich
+
+
+async def walk_listing(ctx: RunContext, scraper_cls: type[BaseScraper]) -> int:
+    """Walk a source's listing as a leased crawl unit, queueing its items for every worker."""
+    frontier = CrawlFrontier(ctx.db, scraper_cls.NAME, shared=True)
+    try:
+        async with source_page(ctx, needs_browser(scraper_cls)) as page:
+            inserted = await make_scraper(scraper_cls, ctx, page, frontier=frontier).scrape()
+    except Exception as exc:
+        logger.error("Listing walk of %s failed: %s", scraper_cls.__name__, exc, exc_info=True)
+        await frontier.end_crawl(ok=False)
+        return 0
+    await frontier.end_crawl(ok=True)
+    return inserted
+
+
+async def drain_items(ctx: RunContext, scraper_cls: type[BaseScraper]) -> Optional[int]:
+    """Lease a chunk of a source's queued items and run it through the pipeline.
+
+    ``None`` if none were waiting.  Chunks are kept small so that idle
+    workers find work until the crawl's end; leases a failed run still
+    holds expire and are handed to another worker.
+    """
+    frontier = CrawlFrontier(ctx.db, scraper_cls.NAME)
+    payloads = await frontier.resume(FRONTIER_CHUNK)
+    if not payloads:
+        return None
+    try:
+        async with source_page(ctx, items_need_browser(scraper_cls)) as page:
+            scraper = make_scraper(scraper_cls, ctx, page, frontier=frontier)
+            return await scraper.scrape([scraper.frontier_item(payload) for payload in payloads])
+    except Exception as exc:
+        logger.error("%s failed on queued items: %s", scraper_cls.__name__, exc, exc_info=True)
+        return 0
+
+
+async def enqueue_crawls(db: AnyDatabase, sources: list[type[BaseScraper]]) -> tuple[list[str], float]:
+    """Queue a crawl of each source not still being crawled; returns those queued and since when."""
+    running = await active_crawls(db, [cls.NAME for cls in sources])
+    if running:
+        logger.info("Still being crawled, left to its workers: %s.", ", ".join(sorted(running)))
+    queued = [cls.NAME for cls in sources if cls.NAME not in running]
+    # scrapedAt comes from the database's clock, so new postings are counted on it too
+    started_at = await db_call(db.db_now) or time.time()
+    for name in queued:
+        await CrawlFrontier(db, name).enqueue_crawl()
+    logger.info("Queued %d crawls: %s.", len(queued), ", ".join(queued) or "none")
+    return queued, started_at
+
+
+async def record_crawls(
+    db: AnyDatabase,
+    scheduler: AdaptiveScheduler,
+    queued: list[str],
+    started_at: float,
+    wait_seconds: float,
+    poll_seconds: float,
+) -> int:
+    """Wait for the *queued* crawls to close and record them with the scheduler.
+
+    Returns the number of new postings.  A crawl still open after
+    *wait_seconds* is recorded as failed and resumed by the next run's
+    workers.
+    """
+    pending = set(queued)
+    deadline = time.monotonic() + wait_seconds
+    while pending and time.monotonic() < deadline:
+        await asyncio.sleep(poll_seconds)
+        pending = await active_crawls(db, sorted(pending))
+    if pending:
+        logger.warning("Crawls still open after %.0fs: %s.", wait_seconds, ", ".join(sorted(pending)))
+
+    total_inserted = 0
+    for name in queued:
+        cls = SOURCES[name]
+        inserted = await db_call(db.count_new_jobs, cls.SOURCE_SITE, started_at)
+        scheduler.record(name, cls.SCHEDULE_HOURS, started_at, inserted, name not in pending)
+        logger.info("  %-10s %d new jobs%s", name, inserted, " (unfinished)" if name in pending else "")
+        total_inserted += inserted
+    return total_inserted
+
 
-            await human_delay(2.0, 4.0)
+async def coordinate(
+    source_names: Optional[list[str]] = None,
+    db_backend: str = "sync",
+    scheduled: bool = False,
+    step: str = "all",
+    wait_seconds: float = SHARD_WAIT_SECONDS,
+    poll_seconds: float = SHARD_POLL_SECONDS,
+) -> None:
+    """Queue a crawl of each (due) source for workers, then wait for them.
 
-            # Source 2: Simplify.jobs
+    Sources still being crawled from an earlier run are left to it.  Once
+    a source's crawl is closed its new postings are counted and recorded
+    with the adaptive scheduler.  *step* ``enqueue`` only queues the
+    crawls and writes what it queued to ``QUEUED_PATH``; ``record`` picks
+    that up and does the waiting and recording, so that workers can be
+    started in between only when there is something to crawl.
+    """
+    logger.info("═══════════════════════════════════════════════════════════")
+    logger.info("  Job Scraper Engine — coordinator (%s)", step)
+    logger.info("═══════════════════════════════════════════════════════════")
+
+    sources: list[type[BaseScraper]] = []
+    queued: list[str] = []
+    started_at = time.time()
+    total_inserted = 0
+    scheduler = AdaptiveScheduler()
+    try:
+        if step == "record":
+            try:
+                handoff = json.loads(QUEUED_PATH.read_text())
+            except (OSError, ValueError) as exc:
+                logger.error("Nothing to record — could not read %s: %s", QUEUED_PATH, exc)
+                sys.exit(1)
+            queued, started_at = handoff["sources"], handoff["startedAt"]
+        else:
+            sources = [SOURCES[name] for name in (source_names or SOURCES)]
+            if scheduled:
+                sources = due_sources(scheduler, sources)
+        if sources or queued:
+            db = await connect_or_exit(db_backend)
             try:
-                simplify_scraper = SimplifyJobsScraper(page, db)
-                total_inserted += await simplify_scraper.scrape()
-            except Exception as exc:
-                logger.error("SimplifyJobsScraper failed: %s", exc, exc_info=True)
+                if sources:
+                    queued, started_at = await enqueue_crawls(db, sources)
+                if step != "enqueue":
+                    total_inserted = await record_crawls(
+                        db, scheduler, queued, started_at, wait_seconds, poll_seconds,
+                    )
+            finally:
+                await db_call(db.close)
+    finally:
+        scheduler.close()
 
-        finally:
-            await stealth.close()
+    if step == "enqueue":
+        QUEUED_PATH.parent.mkdir(parents=True, exist_ok=True)
+        QUEUED_PATH.write_text(json.dumps({"sources": queued, "startedAt": started_at}))
+        return
 
-    db.close()
+    logger.info("═══════════════════════════════════════════════════════════")
+    logger.info("  Coordinated run complete — %d new jobs inserted in total.", total_inserted)
+    logger.info("═══════════════════════════════════════════════════════════")
+
+
+async def work(
+    source_names: Optional[list[str]] = None,
+    db_backend: str = "sync",
+    idle_seconds: float = SHARD_IDLE_SECONDS,
+    poll_seconds: float = SHARD_POLL_SECONDS,
+) -> None:
+    """Pull work units from the shared queue until there are none left.
+
+    Queued listing walks are taken first, so the items they discover reach
+    the other workers early; otherwise the worker leases chunks of pending
+    items of any source.  Leases use ``SKIP LOCKED``, so any number of
+    workers against one Postgres split the crawl without overlap.  Run one
+    coordinator and several workers (``--role worker``) with the same
+    ``DATABASE_URL``.  Stops cleanly on SIGTERM / SIGINT; a worker killed
+    mid-unit has its leases handed out again once they expire.
+    """
+    sources = [SOURCES[name] for name in (source_names or SOURCES)]
+    names = [cls.NAME for cls in sources]
 
     logger.info("═══════════════════════════════════════════════════════════")
-    logger.info("  Run complete — %d new jobs inserted in total.", total_inserted)
+    logger.info("  Job Scraper Engine — worker")
     logger.info("═══════════════════════════════════════════════════════════")
 
+    stop = stop_on_signals()
+    db = await connect_or_exit(db_backend)
+    # Scheduling is the coordinator's; every source keeps a frontier here
+    ctx = make_context(db, None)
+    ctx.resumable = True
+    total_inserted = 0
+    try:
+        await cpu_pool.start()
+        async with async_playwright() as pw:
+            if any(needs_browser(cls) for cls in sources):
+                ctx.contexts = ContextPool(pw)
+                await ctx.contexts.start()
+            try:
+                idle_since: Optional[float] = None
+                while not stop.is_set():
+                    busy = False
+                    for cls in sources:
+                        if await CrawlFrontier(db, cls.NAME).take_crawl():
+                            total_inserted += await walk_listing(ctx, cls)
+                            busy = True
+                            break
+                    else:
+                        for cls in sources:
+                            inserted = await drain_items(ctx, cls)
+                            if inserted is not None:
+                                total_inserted += inserted
+                                busy = True
+                    if busy:
+                        idle_since = None
+                        continue
+                    idle_since = idle_since or time.monotonic()
+                    if time.monotonic() - idle_since >= idle_seconds and not await active_crawls(db, names):
+                        break
+                    try:
+                        await asyncio.wait_for(stop.wait(), poll_seconds)
+                    except asyncio.TimeoutError:
+                        pass
+            finally:
+                if ctx.contexts is not None:
+                    await ctx.contexts.close()
+    finally:
+        await close_context(ctx)
+        cpu_pool.shutdown()
+        await db_call(db.close)
+
+    logger.info("═══════════════════════════════════════════════════════════")
+    logger.info("  Worker done — %d new jobs inserted.", total_inserted)
+    log_metrics()
+    logger.info("═══════════════════════════════════════════════════════════")
+
+
+async def reindex_terms(db_backend: str = "sync") -> None:
+    """Backfill the skill/title search index from every stored posting."""
+    db = await connect_or_exit(db_backend)
+    try:
+        count = await db_call(db.reindex_terms)
+    finally:
+        await db_call(db.close)
+    logger.info("Search index rebuilt for %d postings.", count)
+
+
+def log_metrics() -> None:
+    """Log a per-source summary of the run and export its metrics."""
+    for source, data in sorted(METRICS.report()["sources"].items()):
+        timers, counters = data["timers"], data["counters"]
+        logger.info(
+            "  %-10s %6.1fs total  %5.1fs loading  %5.1fs waiting  %5.1fs parsing  %5.1fs mapping  %5.1fs writing  "
+            "%d/%d new  %.0f KiB",
+            source,
+            timers.get("scrape_seconds", {}).get("sum", 0.0),
+            sum(timers.get(t, {}).get("sum", 0.0) for t in (
+                "http_fetch_seconds", "page_goto_seconds", "page_content_seconds", "api_fetch_seconds",
+            )),
+            sum(timers.get(t, {}).get("sum", 0.0) for t in (
+                "human_delay_seconds", "throttle_wait_seconds", "retry_backoff_seconds",
+            )),
+            timers.get("parse_seconds", {}).get("sum", 0.0),
+            timers.get("map_seconds", {}).get("sum", 0.0),
+            timers.get("db_insert_seconds", {}).get("sum", 0.0),
+            counters.get("jobs_new_total", 0),
+            counters.get("jobs_written_total", 0),
+            counters.get("bytes_total", 0) / 1024,
+        )
+    try:
+        report_path, prom_path = METRICS.write(METRICS_DIR)
+    except OSError as exc:
+        logger.warning("Could not write run metrics to %s: %s", METRICS_DIR, exc)
+        return
+    logger.info("  Metrics: %s, %s", report_path, prom_path)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Career Copilot job scraper engine.")
+    parser.add_argument(
+        "--mode",
+        choices=ENGINE_MODES,
+        default=os.getenv("SCRAPER_MODE", "sequential"),
+        help="sequential: one source at a time (default); "
+             "concurrent: all sources in parallel on a page pool.",
+    )
+    parser.add_argument(
+        "--source",
+        dest="sources",
+        action="append",
+        choices=list(SOURCES),
+        help="Only run this source (repeatable).  Defaults to all sources.",
+    )
+    parser.add_argument(
+        "--db",
+        dest="db_backend",
+        choices=DB_BACKENDS,
+        default=os.getenv("SCRAPER_DB", "sync"),
+        help="sync: one psycopg2 connection (default); "
+             "async: psycopg 3 connection pool with prepared statements.",
+    )
+    parser.add_argument(
+        "--scheduled",
+        action="store_true",
+        default=os.getenv("SCRAPER_SCHEDULED", "0") == "1",
+        help="Only run sources whose adaptive crawl interval has elapsed.",
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        default=os.getenv("SCRAPER_DAEMON", "0") == "1",
+        help="Keep running with a warm browser context pool, scraping sources "
+             "as they fall due (implies --scheduled).",
+    )
+    parser.add_argument(
+        "--role",
+        choices=ENGINE_ROLES,
+        default=os.getenv("SCRAPER_ROLE", "standalone"),
+        help="standalone: crawl every source in this process (default); "
+             "coordinator: queue source crawls in Postgres for workers and wait for them; "
+             "worker: run queued listing walks and item chunks until the queue is empty.",
+    )
+    parser.add_argument(
+        "--step",
+        choices=COORDINATOR_STEPS,
+        default=os.getenv("SCRAPER_COORDINATOR_STEP", "all"),
+        help="With --role coordinator — all: queue the crawls, wait for them and record them (default); "
+             "enqueue: only queue them and note what was queued; record: wait for and record those.",
+    )
+    parser.add_argument(
+        "--reindex-terms",
+        action="store_true",
+        help="Rebuild the skill/title search index of all stored postings and exit.",
+    )
+    return parser.parse_args(argv)
+
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    args = parse_args()
+    if args.reindex_terms:
+        asyncio.run(reindex_terms(args.db_backend))
+    elif args.role == "coordinator":
+        asyncio.run(coordinate(args.sources, args.db_backend, args.scheduled, args.step))
+    elif args.role == "worker":
+        asyncio.run(work(args.sources, args.db_backend))
+    elif args.daemon:
+        asyncio.run(daemon(args.mode, args.sources, args.db_backend))
+    else:
+        asyncio.run(main(args.mode, args.sources, args.db_backend, args.scheduled))
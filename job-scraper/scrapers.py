@@ -1,154 +1,326 @@
 from __future__ import annotations
 
+import asyncio
+import json
 import re
-from typing import Any, Optional
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Optional
 
 from bs4 import BeautifulSoup, Tag
+from playwright.async_api import Error as PlaywrightError
 from playwright.async_api import Page, Response
 
-from database import DatabaseManager
+import cpu_pool
+from api_pagination import ApiEndpoint, learn_endpoint, next_cursor
+from async_database import AnyDatabase
+from browser import PagePool
+from classifier import classify
+from database import db_call
+from dedupe import NearDuplicateIndex
+from frontier import CrawlFrontier
+from html_parse import parse_description, parse_listing
+from http_client import FetchError, FetchResult, HttpFetcher, retry_after_seconds
+from json_extract import JsonJobExtractor
+from metrics import METRICS
+from registry import BaseScraper, register
+from salary import wage_columns
 from utils import (
-    MAX_JOBS_PER_SOURCE,
-    extract_salary,
+    CRAWL_MAX_PAGES,
+    MAX_CONCURRENCY_PER_SOURCE,
+    INCREMENTAL_SYNC,
+    CrawlBudget,
+    HostThrottle,
+    RetryPolicy,
     human_delay,
-    infer_experience_level,
     infer_location_requirement,
     logger,
 )
 
 # PythonOrgScraper
 
-class PythonOrgScraper:
+@register
+class PythonOrgScraper(BaseScraper):
     """Scrapes job listings from https://www.python.org/jobs/.
 
     Server-rendered HTML — no anti-bot protection.
+
+    When constructed with an ``http`` fetcher, pages are fetched over plain
+    HTTP and no browser is needed at all; if that fetcher has a response
+    cache, pages unchanged since the last run are skipped before parsing.  With ``http`` or a ``pool``
+    (concurrent engine mode) detail pages are fetched in parallel, at most
+    ``MAX_CONCURRENCY_PER_SOURCE`` at a time.  Every request is paced by
+    ``throttle``; pages that fail transiently are retried per ``retry``.
     """
 
+    NAME = "python"
     SOURCE_SITE = "Python.org"
     BASE_URL = "https://www.python.org"
     LISTING_URL = "https://www.python.org/jobs/"
-
-    def __init__(self, page: Page, db: DatabaseManager) -> None:
-        self.page = page
-        self.db = db
-
-    async def scrape(self) -> int:
-        """Run the full scrape pipeline.  Returns count of new rows inserted."""
-        logger.info("━━  PythonOrgScraper  ━━  starting …")
-        inserted = 0
+    REQUIRES_BROWSER = False
+    SCHEDULE_HOURS = 4.0
+
+    def __init__(
+        self,
+        page: Optional[Page],
+        db: AnyDatabase,
+        pool: Optional[PagePool] = None,
+        throttle: Optional[HostThrottle] = None,
+        http: Optional[HttpFetcher] = None,
+        dedupe: Optional[NearDuplicateIndex] = None,
+        budget: Optional[CrawlBudget] = None,
+        retry: Optional[RetryPolicy] = None,
+        frontier: Optional[CrawlFrontier] = None,
+        incremental: bool = INCREMENTAL_SYNC,
+        max_pages: int = CRAWL_MAX_PAGES,
+    ) -> None:
+        if page is None and http is None:
+            raise ValueError("PythonOrgScraper needs a page or an HTTP fetcher.")
+        super().__init__(
+            page, db, pool=pool, throttle=throttle, http=http, dedupe=dedupe, budget=budget, retry=retry,
+            frontier=frontier,
+        )
+        self.incremental = incremental
+        self.max_pages = max(1, max_pages)
+        self._parallel = pool is not None or http is not None
+        self._known: set[str] = set()
+        self._queued = 0
+
+    async def list_jobs(self) -> AsyncIterator[tuple[int, dict[str, Any]]]:
+        """Stream listing cards still worth a detail visit, page by page.
+
+        Listing pages after the first are fetched a wave at a time
+        (concurrently when parallel), so detail fetches for page 1 overlap
+        with loading the next pages.  The crawl stops after ``max_pages``
+        pages or once the budget runs out.  Unless incremental, detail
+        visits stop at the first page whose postings are all stored
+        already; later pages are then only read to record what is still
+        listed.  Detail pages an interrupted crawl left unfinished come
+        first.
+        """
+        for card in await self.resume_items(_card_url):
+            yield self.frontier_item(card)
 
         try:
-            await self.page.goto(self.LISTING_URL, wait_until="domcontentloaded", timeout=30_000)
-            await human_delay()
+            listing = await self._fetch_retrying(self.LISTING_URL, self.page)
         except Exception as exc:
             logger.error("Failed to load %s: %s", self.LISTING_URL, exc)
-            return 0
-
-        # -- collect job cards from the listing page ------------------------
-        cards = await self._parse_listing_page()
-        logger.info("Found %d job cards on listing page.", len(cards))
-
-        for idx, card in enumerate(cards[:MAX_JOBS_PER_SOURCE]):
-            logger.info("  [%d/%d] %s", idx + 1, min(len(cards), MAX_JOBS_PER_SOURCE), card.get("title", "?"))
-            try:
-                job = await self._enrich_from_detail(card)
-                if self.db.insert_job(job):
-                    inserted += 1
-            except Exception as exc:
-                logger.warning("  ⚠  Skipping card %d: %s", idx + 1, exc)
-            await human_delay()
-
-        logger.info("━━  PythonOrgScraper  ━━  done.  Inserted %d new jobs.", inserted)
-        return inserted
-
-    async def _parse_listing_page(self) -> list[dict[str, Any]]:
-        """Extract basic metadata from every <li> in ol.list-recent-jobs."""
-        html = await self.page.content()
-        soup = BeautifulSoup(html, "lxml")
-        ol = soup.select_one("ol.list-recent-jobs")
-        if not ol:
-            logger.warning("Could not find ol.list-recent-jobs.")
+            return
+
+        # -- collect job cards from the first listing page ------------------
+        with METRICS.timer("parse_seconds"):
+            cards, last_page = await cpu_pool.run(parse_listing, listing.text, self.BASE_URL)
+        if not listing.changed:
+            # Still walked: postings an earlier run left unfetched may be on it
+            logger.info("Listing page 1 unchanged since last run.")
+        page_urls = [f"{self.LISTING_URL}?page={n}" for n in range(2, min(last_page, self.max_pages) + 1)]
+        logger.info("Found %d job cards on listing page 1 of %d.", len(cards), last_page)
+
+        # -- walk the remaining pages while they keep yielding new jobs ----
+        listed = [c["sourceUrl"] for c in cards]
+        stopped = last_page > self.max_pages
+        caught_up = False
+        wave_size = MAX_CONCURRENCY_PER_SOURCE if self._parallel else 1
+        while True:
+            if not caught_up:
+                fresh = await self._select_new(cards)
+                for card in await self.claim(fresh, _card_url):
+                    yield self.frontier_item(card)
+                if cards and not fresh and not self.incremental:
+                    # Later pages are still read, only so that the listing
+                    # sync doesn't deactivate the postings on them
+                    logger.info("Every posting on this page is already stored — no more detail visits.")
+                    caught_up = True
+            if not page_urls:
+                break
+            if self.budget.exhausted:
+                logger.info("Crawl budget exhausted (%s) — stopping the crawl.", self.budget.exhausted_by)
+                stopped = True
+                break
+            wave, page_urls = page_urls[:wave_size], page_urls[wave_size:]
+            pages = await asyncio.gather(*(self._fetch_listing_page(url) for url in wave))
+            if any(page_cards is None for page_cards in pages):
+                stopped = True
+            cards = [card for page_cards in pages for card in page_cards or []]
+            listed.extend(c["sourceUrl"] for c in cards)
+
+        # Only a walk over every listing page shows which postings are gone
+        await self._sync_listing(listed, complete=not stopped)
+
+    async def _fetch_listing_page(self, url: str) -> Optional[list[dict[str, Any]]]:
+        """Cards on a later listing page; ``None`` if it could not be loaded."""
+        try:
+            listing = await self._fetch_retrying(url)
+        except Exception as exc:
+            logger.warning("Could not load listing page %s: %s", url, exc)
+            return None
+        with METRICS.timer("parse_seconds"):
+            cards, _ = await cpu_pool.run(parse_listing, listing.text, self.BASE_URL)
+        logger.info("Found %d job cards on %s.", len(cards), url)
+        return cards
+
+    async def _select_new(self, cards: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Drop cards for postings already stored (kept when incremental)."""
+        if not cards:
             return []
+        known = await db_call(self.db.existing_source_urls, [c["sourceUrl"] for c in cards])
+        self._known |= known
+        if self.incremental:
+            return cards
+        fresh = [c for c in cards if c["sourceUrl"] not in known]
+        if known:
+            logger.info("Skipping %d already-stored jobs; %d new.", len(known), len(fresh))
+        return fresh
+
+    async def _sync_listing(self, urls: list[str], complete: bool) -> None:
+        deactivated = await db_call(self.db.sync_listing, self.SOURCE_SITE, urls, complete)
+        if deactivated:
+            logger.info("Marked %d postings no longer listed as inactive.", deactivated)
+
+    def enrich_workers(self) -> int:
+        return MAX_CONCURRENCY_PER_SOURCE if self._parallel else 1
+
+    def frontier_item(self, payload: dict[str, Any]) -> tuple[int, dict[str, Any]]:
+        self._queued += 1
+        return self._queued - 1, payload
+
+    async def enrich(self, item: tuple[int, dict[str, Any]]) -> Optional[tuple[dict[str, Any], str]]:
+        """Fetch the card's detail page."""
+        idx, card = item
+        logger.info("  [%d] %s", idx + 1, card.get("title", "?"))
+        return await self._fetch_detail(card)
+
+    def map_job(self, item: tuple[dict[str, Any], str]) -> dict[str, Any]:
+        return map_python_detail(item)
+
+    def cpu_map(self) -> Callable[[tuple[dict[str, Any], str]], dict[str, Any]]:
+        return map_python_detail
+
+    @asynccontextmanager
+    async def _detail_page(self) -> AsyncIterator[Optional[Page]]:
+        """Yield a page for a detail visit: borrowed from the pool if any.
+
+        Yields ``None`` on the HTTP tier, where no page is needed.
+        """
+        if self.http:
+            yield None
+        elif self.pool:
+            async with self.pool.page() as page:
+                yield page
+        else:
+            yield self.page
+
+    async def _fetch_html(self, url: str, page: Optional[Page]) -> FetchResult:
+        """Fetch *url* over HTTP when available, else via *page*.
+
+        Requests are paced per host by the throttle, which is told how each
+        one went so it can adapt the host's rate.  Failures raise
+        :class:`FetchError`.  Browser fetches are always reported as changed;
+        changed pages count against the byte budget.
+        """
+        await self.throttle.wait(url)
+        start = time.perf_counter()
+        try:
+            if self.http:
+                with METRICS.timer("http_fetch_seconds"):
+                    result = await self.http.fetch(url)
+            else:
+                result = await self._load_page(url, page)  # type: ignore[arg-type]
+        except FetchError as exc:
+            if exc.congested:
+                self.throttle.backoff(url, exc.retry_after)
+            raise
+        self.throttle.success(url, time.perf_counter() - start)
+        if result.changed:
+            self.budget.add_bytes(len(result.text))
+            METRICS.inc("bytes_total", len(result.text))
+        else:
+            METRICS.inc("pages_unchanged_total")
+        return result
 
-        results: list[dict[str, Any]] = []
-        for li in ol.find_all("li", recursive=False):
+    @staticmethod
+    async def _load_page(url: str, page: Page) -> FetchResult:
+        try:
+            with METRICS.timer("page_goto_seconds"):
+                response = await page.goto(url, wait_until="domcontentloaded", timeout=30_000)
+        except PlaywrightError as exc:  # timeouts and network errors
+            raise FetchError(url, reason=exc.message.splitlines()[0]) from exc
+        if response is not None and response.status >= 400:
+            retry_after = retry_after_seconds(await response.header_value("retry-after"))
+            raise FetchError(url, response.status, retry_after)
+        with METRICS.timer("page_content_seconds"):
+            return FetchResult(await page.content(), changed=True)
+
+    async def _fetch_retrying(self, url: str, page: Optional[Page] = None) -> FetchResult:
+        """:meth:`_fetch_html` with transient failures retried after a backoff.
+
+        Without *page*, each try borrows a detail page and gives it back
+        before backing off, so a waiting retry doesn't hold one.
+        """
+        attempt = 0
+        while True:
             try:
-                # Title + URL
-                title_link = li.select_one("h2.listing-company a")
-                if not title_link:
-                    continue
-                title = title_link.get_text(strip=True)
-                href = title_link.get("href", "")
-                source_url = href if href.startswith("http") else f"{self.BASE_URL}{href}"
-
-                # Company name —  extract from <span class="listing-company-name">
-                company_span = li.select_one("span.listing-company-name")
-                company = ""
-                if company_span:
-                    full_span_text = company_span.get_text(separator=" ", strip=True)
-                    company = full_span_text
-                    for child in company_span.children:
-                        if isinstance(child, Tag):
-                            child_text = child.get_text(strip=True)
-                            company = company.replace(child_text, "", 1)
-                    company = company.strip().strip("—–-").strip()
-
-                # Location
-                loc_tag = li.select_one("span.listing-location a")
-                location = loc_tag.get_text(strip=True) if loc_tag else ""
-
-                # Posted at
-                time_tag = li.select_one("span.listing-posted time")
-                posted_at = ""
-                if time_tag:
-                    posted_at = time_tag.get("datetime", "") or time_tag.get_text(strip=True)
-
-                results.append({
-                    "title": title,
-                    "companyName": company or "Unknown",
-                    "location": location or "Not specified",
-                    "sourceUrl": source_url,
-                    "postedAt": posted_at,
-                })
-            except Exception as exc:
-                logger.debug("Skipping malformed <li>: %s", exc)
-
-        return results
-
-    async def _enrich_from_detail(self, card: dict[str, Any]) -> dict[str, Any]:
-        """Navigate to the detail page and fill in remaining fields."""
+                if page is not None:
+                    return await self._fetch_html(url, page)
+                async with self._detail_page() as detail_page:
+                    return await self._fetch_html(url, detail_page)
+            except FetchError as exc:
+                if not await self.retry_later(exc, attempt):
+                    raise
+            attempt += 1
+
+    def _parse_listing_page(self, html: str) -> tuple[list[dict[str, Any]], int]:
+        """Extract basic metadata from every <li> in ol.list-recent-jobs.
+
+        Also returns the last page number linked from ``ul.pagination``
+        (1 if the listing isn't paginated).
+        """
+        return parse_listing(html, self.BASE_URL)
+
+    async def _fetch_detail(self, card: dict[str, Any]) -> Optional[tuple[dict[str, Any], str]]:
+        """Fetch a card's detail page.  Returns ``(card, html)``.
+
+        Returns ``None`` if the page is unchanged since it was last scraped
+        and its posting is stored — the cache is written before the row, so
+        an unchanged page whose row never made it (a crash, a failed batch)
+        is written again.  If it still fails after the retries it is left in the frontier for
+        a later run; after the frontier's last attempt (or without one) the
+        HTML is empty so the card still gets defaults.
+        """
         url = card["sourceUrl"]
         try:
-            await self.page.goto(url, wait_until="domcontentloaded", timeout=30_000)
-            await human_delay(0.5, 1.5)
+            detail = await self._fetch_retrying(url)
         except Exception as exc:
             logger.warning("Could not load detail page %s: %s", url, exc)
-            return self._fill_defaults(card, "")
-
-        html = await self.page.content()
-        soup = BeautifulSoup(html, "lxml")
-
-        desc_div = soup.select_one("div.job-description")
-        description = desc_div.get_text(separator="\n", strip=True) if desc_div else ""
+            if self.frontier and await self.frontier.release(url):
+                return None
+            # Never overwrite a stored posting with an empty description
+            return None if url in self._known else (card, "")
+        if not detail.changed and url in self._known:
+            logger.debug("  ⊘ Detail page unchanged: %s", card.get("title", "?"))
+            return None
+        return card, detail.text
 
-        return self._fill_defaults(card, description)
+    @staticmethod
+    def _parse_detail(html: str) -> str:
+        """Extract the plain-text job description from a detail page."""
+        return parse_description(html)
 
     @staticmethod
     def _fill_defaults(card: dict[str, Any], description: str) -> dict[str, Any]:
         """Merge card metadata with description-derived fields."""
         title = card.get("title", "")
         location = card.get("location", "Not specified")
-        wage = extract_salary(description) if description else None
-        exp = infer_experience_level(title, description)
-        loc_req = infer_location_requirement(title, location, description)
+        inferred = classify(title, location, description)
 
         return {
             "title": title,
             "companyName": card.get("companyName", "Unknown"),
             "description": description or "No description available.",
-            "wage": wage,
-            "locationRequirement": loc_req,
-            "experienceLevel": exp,
+            "wage": inferred.salary,
+            **wage_columns(inferred.salary),
+            "locationRequirement": inferred.location_requirement,
+            "experienceLevel": inferred.experience_level,
             "location": location,
             "sourceUrl": card.get("sourceUrl", ""),
             "sourceSite": PythonOrgScraper.SOURCE_SITE,
@@ -157,98 +329,216 @@ class PythonOrgScraper:
 
 # SimplifyJobsScraper
 
-class SimplifyJobsScraper:
+# Runs in the page: replays an API request with the page's cookies
+_FETCH_JS = """async ([url, init]) => {
+    const response = await fetch(url, init);
+    return [response.status, await response.text(), response.headers.get("retry-after")];
+}"""
+
+@register
+class SimplifyJobsScraper(BaseScraper):
     """Scrapes job listings from https://simplify.jobs/.
 
     Primary strategy: intercept XHR/Fetch API responses to capture structured
-    JSON data.  Fallback: parse the rendered DOM.
+    JSON data, then page through the search API directly.  Fallback: parse
+    the rendered DOM.
     """
 
+    NAME = "simplify"
     SOURCE_SITE = "SimplifyJobs"
     SEARCH_URL = "https://simplify.jobs/jobs?query=software+engineer"
+    REQUIRES_BROWSER = True
+    SCHEDULE_HOURS = 4.0
 
-    def __init__(self, page: Page, db: DatabaseManager) -> None:
-        self.page = page
-        self.db = db
+    def __init__(self, page: Page, db: AnyDatabase, max_pages: int = CRAWL_MAX_PAGES, **kwargs: Any) -> None:
+        super().__init__(page, db, **kwargs)
+        self.max_pages = max(1, max_pages)
         self._api_jobs: list[dict[str, Any]] = []
-
-    async def scrape(self) -> int:
-        """Run the full scrape pipeline.  Returns count of new rows inserted."""
-        logger.info("━━  SimplifyJobsScraper  ━━  starting …")
-        inserted = 0
-
-        # Register API response interceptor BEFORE navigation
+        self._extractor = JsonJobExtractor()
+        self._endpoint: Optional[ApiEndpoint] = None
+        self._seen_ids: set[str] = set()
+        self._queued = 0
+
+    async def list_jobs(self) -> AsyncIterator[Any]:
+        """API job objects, or ``(idx, card_html)`` DOM cards as a fallback.
+
+        The search API call made while the page loads is intercepted and its
+        pagination parameter learned; later result pages are then requested
+        directly with in-page ``fetch`` (so cookies and tokens apply), a
+        wave at a time, until the budget or ``max_pages`` runs out.  With a
+        frontier, jobs an interrupted crawl left unwritten come first and
+        paging resumes after the last page it reached.
+        """
+        for job in await self.resume_items(self._api_job_url):
+            self._seen_ids.add(self._job_key(job))
+            yield job
+
+        # Register API response interceptor BEFORE navigation.  It is removed
+        # again afterwards so a pooled page can be reused by other sources.
         self.page.on("response", self._on_response)
-
         try:
-            await self.page.goto(self.SEARCH_URL, wait_until="networkidle", timeout=60_000)
-            await human_delay(2.0, 4.0)
-        except Exception as exc:
-            logger.warning("Page load issue (may still have data): %s", exc)
+            try:
+                with METRICS.timer("page_goto_seconds"):
+                    await self.page.goto(self.SEARCH_URL, wait_until="networkidle", timeout=60_000)
+                await human_delay(2.0, 4.0)
+            except Exception as exc:
+                logger.warning("Page load issue (may still have data): %s", exc)
 
-        # Scroll down to trigger lazy-loading of more results
-        for _ in range(3):
-            await self.page.evaluate("window.scrollBy(0, window.innerHeight)")
-            await human_delay(1.0, 2.5)
+            # Scroll only until the results are lazy-loaded through the API
+            for _ in range(3):
+                if self._endpoint:
+                    break
+                await self.page.evaluate("window.scrollBy(0, window.innerHeight)")
+                await human_delay(1.0, 2.5)
+        finally:
+            self.page.remove_listener("response", self._on_response)
 
         # Decide strategy based on intercepted data
-        if self._api_jobs:
-            logger.info("Intercepted %d jobs from API responses.", len(self._api_jobs))
-            jobs = self._api_jobs[:MAX_JOBS_PER_SOURCE]
-            for idx, job in enumerate(jobs):
-                logger.info("  [%d/%d] %s", idx + 1, len(jobs), job.get("title", "?"))
-                try:
-                    mapped = self._map_api_job(job)
-                    if self.db.insert_job(mapped):
-                        inserted += 1
-                except Exception as exc:
-                    logger.warning("  ⚠  Skipping API job %d: %s", idx + 1, exc)
-        else:
+        if not self._api_jobs:
             logger.info("No API data intercepted — falling back to DOM parsing.")
-            inserted = await self._scrape_from_dom()
+            for item in await self._list_dom_cards():
+                yield item
+            return
+
+        logger.info("Intercepted %d jobs from API responses.", len(self._api_jobs))
+        for job in await self._take_new(self._api_jobs):
+            yield job
+        if self._endpoint is None:
+            logger.info("Search API isn't paginated by page, offset or cursor — stopping here.")
+            return
+        logger.info("Paging the search API by %s: %s", self._endpoint.kind, self._endpoint.url)
+        async for job in self._paginate(self._endpoint):
+            yield job
+
+    async def _paginate(self, endpoint: ApiEndpoint) -> AsyncIterator[dict[str, Any]]:
+        """Jobs from the API pages after the intercepted one.
+
+        Page- and offset-paginated APIs are fetched concurrently in waves of
+        ``MAX_CONCURRENCY_PER_SOURCE``; cursors are inherently sequential.
+        The position reached is saved in the frontier after every wave.
+        """
+        pages, cursor = 1, endpoint.cursor
+        saved = await self.frontier.cursor(endpoint.url) if self.frontier else None
+        if saved:
+            pages, cursor = saved["pages"], saved.get("cursor")
+            logger.info("Resuming the search API after page %d.", pages)
+        while pages < self.max_pages and not self.budget.exhausted:
+            if endpoint.kind == "cursor":
+                if not cursor:
+                    return
+                wave = [endpoint.request(cursor=cursor)]
+            else:
+                size = min(MAX_CONCURRENCY_PER_SOURCE, self.max_pages - pages)
+                wave = [endpoint.request(pages + i) for i in range(size)]
+            payloads = await asyncio.gather(*(self._fetch_api(endpoint, url, body) for url, body in wave))
+            pages += len(wave)
+
+            for (url, _), payload in zip(wave, payloads):
+                jobs = self._extractor.extract(url, payload) if payload is not None else []
+                if not jobs:  # past the last page (or a failed request)
+                    return
+                for job in await self._take_new(jobs):
+                    yield job
+                cursor = next_cursor(endpoint, payload) if endpoint.kind == "cursor" else None
+            if self.frontier:
+                await self.frontier.save_cursor(endpoint.url, {"pages": pages, "cursor": cursor})
+        if self.budget.exhausted:
+            logger.info("Crawl budget exhausted (%s) — stopping the crawl.", self.budget.exhausted_by)
+
+    async def _fetch_api(self, endpoint: ApiEndpoint, url: str, body: Optional[str]) -> Any:
+        """Replay the search request from inside the page; ``None`` on failure.
+
+        Paced by the throttle like page loads; transient failures (429, 5xx)
+        are retried after a backoff.
+        """
+        init: dict[str, Any] = {"method": endpoint.method, "headers": endpoint.headers, "credentials": "include"}
+        if body is not None and endpoint.method != "GET":
+            init["body"] = body
+        attempt = 0
+        while True:
+            await self.throttle.wait(url)
+            start = time.perf_counter()
+            try:
+                with METRICS.timer("api_fetch_seconds"):
+                    status, text, retry_after = await self.page.evaluate(_FETCH_JS, [url, init])
+            except Exception as exc:
+                logger.warning("API page request failed: %s", exc)
+                return None
+            if status == 200:
+                self.throttle.success(url, time.perf_counter() - start)
+                break
+            error = FetchError(url, status, retry_after_seconds(retry_after))
+            if error.congested:
+                self.throttle.backoff(url, error.retry_after)
+            if not await self.retry_later(error, attempt):
+                logger.warning("API page request returned HTTP %s: %s", status, url)
+                return None
+            attempt += 1
+        self.budget.add_bytes(len(text))
+        METRICS.inc("bytes_total", len(text))
+        try:
+            return json.loads(text)
+        except ValueError:
+            return None
+
+    async def _take_new(self, jobs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Jobs not seen before in this run, cut to what the budget grants."""
+        fresh = []
+        for job in jobs:
+            key = self._job_key(job)
+            if key not in self._seen_ids:
+                self._seen_ids.add(key)
+                fresh.append(job)
+        fresh = await self.claim(fresh, self._api_job_url)
+        for job in fresh:
+            self._queued += 1
+            logger.info("  [%d] %s", self._queued, job.get("title") or job.get("name") or "?")
+        return fresh
+
+    @staticmethod
+    def _job_key(job: dict[str, Any]) -> str:
+        return str(job.get("id") or job.get("_id") or job.get("slug") or (job.get("title"), job.get("company_name")))
+
+    def map_job(self, item: Any) -> Optional[dict[str, Any]]:
+        return map_simplify_item(item)
 
-        logger.info("━━  SimplifyJobsScraper  ━━  done.  Inserted %d new jobs.", inserted)
-        return inserted
+    def cpu_map(self) -> Callable[[Any], Optional[dict[str, Any]]]:
+        return map_simplify_item
 
+    async def finish(self) -> None:
+        # Only part of the listing is captured, so unseen postings are left to expire
+        await db_call(self.db.sync_listing, self.SOURCE_SITE, self.batcher.seen_urls)
 
     async def _on_response(self, response: Response) -> None:
-        """Callback for every network response. Captures JSON job data."""
+        """Callback for every network response. Captures JSON job data.
+
+        Bodies from URL patterns already known to hold no jobs (telemetry,
+        config, …) aren't parsed.  The first response holding jobs also
+        teaches us the search endpoint.
+        """
         try:
             url = response.url
             if response.status != 200:
                 return
             content_type = response.headers.get("content-type", "")
-            if "application/json" not in content_type:
+            if "application/json" not in content_type or not self._extractor.wants(url):
                 return
 
             body = await response.json()
-            self._extract_jobs_from_json(body, url)
+            jobs = self._extractor.extract(url, body)
+            if not jobs:
+                return
+            self._api_jobs.extend(jobs)
+            if self._endpoint is None:
+                request = response.request
+                self._endpoint = learn_endpoint(
+                    url, request.method, request.headers, request.post_data, body, len(jobs),
+                )
         except Exception:
             pass  
 
-    def _extract_jobs_from_json(self, data: Any, url: str) -> None:
-        """Recursively look for job-like objects in the JSON payload."""
-        if isinstance(data, dict):
-            if "company_name" in data or "companyName" in data:
-                if "title" in data or "name" in data:
-                    self._api_jobs.append(data)
-                    return
-
-            for key in ("jobs", "results", "data", "items", "listings", "hits"):
-                if key in data and isinstance(data[key], list):
-                    for item in data[key]:
-                        self._extract_jobs_from_json(item, url)
-                    return
-
-            for value in data.values():
-                if isinstance(value, (dict, list)):
-                    self._extract_jobs_from_json(value, url)
-
-        elif isinstance(data, list):
-            for item in data:
-                self._extract_jobs_from_json(item, url)
-
-    def _map_api_job(self, raw: dict[str, Any]) -> dict[str, Any]:
+    @staticmethod
+    def _map_api_job(raw: dict[str, Any]) -> dict[str, Any]:
         """Map an intercepted API job object to our DB schema."""
         title = raw.get("title") or raw.get("name") or "Untitled"
         company = (
@@ -267,6 +557,7 @@ class SimplifyJobsScraper:
         )
 
         wage = raw.get("salary") or raw.get("wage") or raw.get("compensation")
+        infer_wage = False
         if isinstance(wage, dict):
             lo = wage.get("min") or wage.get("low") or ""
             hi = wage.get("max") or wage.get("high") or ""
@@ -277,7 +568,7 @@ class SimplifyJobsScraper:
         elif isinstance(wage, str) and wage:
             pass  # keep as-is
         else:
-            wage = extract_salary(str(description))
+            wage, infer_wage = None, True
 
         location = (
             raw.get("location")
@@ -292,21 +583,15 @@ class SimplifyJobsScraper:
             location = ", ".join(str(l) for l in location) or "Not specified"
 
         loc_req = raw.get("locationRequirement") or raw.get("work_type") or ""
-        if not loc_req:
-            loc_req = infer_location_requirement(title, str(location), str(description))
-
         exp = raw.get("experienceLevel") or raw.get("experience_level") or raw.get("seniority")
-        if not exp:
-            exp = infer_experience_level(title, str(description))
-
-        job_id = raw.get("id") or raw.get("_id") or raw.get("slug") or ""
-        slug = raw.get("slug") or re.sub(r"[^a-z0-9]+", "-", title.lower()).strip("-")
-        source_url = raw.get("url") or raw.get("apply_url") or raw.get("sourceUrl")
-        if not source_url and job_id:
-            source_url = f"https://simplify.jobs/p/{job_id}/{slug}"
-        if not source_url:
-            source_url = f"https://simplify.jobs/jobs?query={title.replace(' ', '+')}"
-
+        # Only scan the description when the API left something to infer
+        if infer_wage or not loc_req or not exp:
+            inferred = classify(title, str(location), str(description))
+            wage = inferred.salary if infer_wage else wage
+            loc_req = loc_req or inferred.location_requirement
+            exp = exp or inferred.experience_level
+
+        source_url = SimplifyJobsScraper._api_job_url(raw)
         posted_at = raw.get("postedAt") or raw.get("posted_at") or raw.get("created_at") or ""
 
         return {
@@ -314,43 +599,52 @@ class SimplifyJobsScraper:
             "companyName": str(company),
             "description": str(description),
             "wage": str(wage) if wage else None,
+            **wage_columns(str(wage) if wage else None),
             "locationRequirement": str(loc_req),
             "experienceLevel": str(exp) if exp else None,
             "location": str(location),
             "sourceUrl": str(source_url),
-            "sourceSite": self.SOURCE_SITE,
+            "sourceSite": SimplifyJobsScraper.SOURCE_SITE,
             "postedAt": str(posted_at) if posted_at else None,
         }
 
+    @staticmethod
+    def _api_job_url(raw: dict[str, Any]) -> str:
+        """``sourceUrl`` of the row an API job object maps to."""
+        title = raw.get("title") or raw.get("name") or "Untitled"
+        job_id = raw.get("id") or raw.get("_id") or raw.get("slug") or ""
+        slug = raw.get("slug") or re.sub(r"[^a-z0-9]+", "-", title.lower()).strip("-")
+        source_url = raw.get("url") or raw.get("apply_url") or raw.get("sourceUrl")
+        if not source_url and job_id:
+            source_url = f"https://simplify.jobs/p/{job_id}/{slug}"
+        if not source_url:
+            source_url = f"https://simplify.jobs/jobs?query={title.replace(' ', '+')}"
+        return str(source_url)
+
     # -- DOM fallback -------------------------------------------------------
 
-    async def _scrape_from_dom(self) -> int:
-        """Parse rendered DOM when API interception yields no results."""
-        inserted = 0
+    async def _list_dom_cards(self) -> list[tuple[int, str]]:
+        """Job cards of the rendered DOM when API interception yields no results.
 
+        Cards are handed on as HTML, which (unlike a ``Tag``) can cross to
+        a worker process.
+        """
         try:
             await self.page.wait_for_selector("h3", timeout=15_000)
         except Exception:
             logger.warning("Timed out waiting for job card elements.")
-            return 0
+            return []
 
-        html = await self.page.content()
-        soup = BeautifulSoup(html, "lxml")
+        with METRICS.timer("page_content_seconds"):
+            html = await self.page.content()
+        with METRICS.timer("parse_seconds"):
+            cards = await cpu_pool.run(dom_cards, html)
 
-        cards = soup.select("button:has(h3)")
         logger.info("DOM fallback found %d potential job cards.", len(cards))
+        return list(enumerate(cards[:self.budget.take_jobs(len(cards))]))
 
-        for idx, card in enumerate(cards[:MAX_JOBS_PER_SOURCE]):
-            try:
-                job = self._parse_dom_card(card, idx)
-                if job and self.db.insert_job(job):
-                    inserted += 1
-            except Exception as exc:
-                logger.warning("  ⚠  DOM card %d error: %s", idx, exc)
-
-        return inserted
-
-    def _parse_dom_card(self, card: Tag, idx: int) -> Optional[dict[str, Any]]:
+    @staticmethod
+    def _parse_dom_card(card: Tag, idx: int) -> Optional[dict[str, Any]]:
         """Extract fields from a single DOM card element."""
         h3 = card.select_one("h3")
         title = h3.get_text(strip=True) if h3 else None
@@ -399,10 +693,43 @@ class SimplifyJobsScraper:
             "companyName": company,
             "description": f"Job listing for {title} at {company}.",
             "wage": wage,
+            **wage_columns(wage),
             "locationRequirement": loc_req or infer_location_requirement(title, location, ""),
             "experienceLevel": exp,
             "location": location,
             "sourceUrl": source_url,
-            "sourceSite": self.SOURCE_SITE,
+            "sourceSite": SimplifyJobsScraper.SOURCE_SITE,
             "postedAt": None,
         }
+
+
+# Mapping functions
+
+# Module-level so worker processes can unpickle them by name.  The scrapers'
+# map_job calls the same functions, so in-process and process-pool runs
+# produce identical rows.
+
+def _card_url(card: dict[str, Any]) -> str:
+    return card["sourceUrl"]
+
+
+def map_python_detail(item: tuple[dict[str, Any], str]) -> dict[str, Any]:
+    """Row for a ``(card, detail_html)`` pair of :class:`PythonOrgScraper`."""
+    card, html = item
+    with METRICS.timer("parse_seconds", PythonOrgScraper.NAME):
+        description = PythonOrgScraper._parse_detail(html)
+    return PythonOrgScraper._fill_defaults(card, description)
+
+
+def map_simplify_item(item: Any) -> Optional[dict[str, Any]]:
+    """Row for an API job object or an ``(idx, card_html)`` DOM card."""
+    if isinstance(item, dict):
+        return SimplifyJobsScraper._map_api_job(item)
+    idx, html = item
+    card = BeautifulSoup(html, "lxml").select_one("button")
+    return SimplifyJobsScraper._parse_dom_card(card, idx) if card is not None else None
+
+
+def dom_cards(html: str) -> list[str]:
+    """HTML of each job card on a rendered SimplifyJobs search page."""
+    return [str(card) for card in BeautifulSoup(html, "lxml").select("button:has(h3)")]
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The scraper's modules are flat files in job-scraper/, imported by name
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,100 @@
+"""Golden tests: ``classify`` must agree with the ``infer_*`` / ``extract_salary`` originals."""
+
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from classifier import Classification, _classify_reference, classify, classify_many
+from scrapers import PythonOrgScraper, parse_listing
+
+FIXTURES = Path(__file__).resolve().parent.parent / "bench" / "fixtures"
+
+# (title, location, description) → what the original functions return,
+# quirks included (e.g. "sentry level" reads as entry level).
+GOLDEN = [
+    (("Senior Python Developer", "Remote, USA", "Pays $120,000 - $150,000 per year."),
+     Classification("$120,000 - $150,000 per year", "Senior", "Remote")),
+    (("Software Engineer Intern", "Boston, MA", "Summer internship. $45/hr"),
+     Classification("$45", "Intern", "On-site")),
+    (("Junior Data Analyst", "Austin, TX", "Entry-level role, hybrid schedule, USD 60,000-70,000"),
+     Classification("USD 60,000-70,000", "Junior", "Hybrid")),
+    (("Mid-level Backend Engineer", "Berlin", "Salary 65,000 EUR. On site."),
+     Classification("65,000 EUR", "Mid", "On-site")),
+    (("Sr. DevOps Engineer", "London", "GBP 90,000 plus bonus; telecommute two days"),
+     Classification("GBP 90,000", "Senior", "Remote")),
+    (("Staff Engineer", "Paris", "We value intermediate skills."),
+     Classification(None, "Mid", "On-site")),
+    (("Head of Engineering", "NYC", "Lead a team of 12."),
+     Classification(None, "Lead", "On-site")),
+    (("VP, Platform", "San Francisco", "No salary listed."),
+     Classification(None, "Director", "On-site")),
+    (("Developer", "Hybrid - Toronto", "Competitive pay"),
+     Classification(None, None, "Hybrid")),
+    (("Engineer", "Chicago", "staffing agency, sentry level monitoring"),
+     Classification(None, "Junior", "On-site")),
+    (("Internal Tools Engineer", "Remote", "internal tooling"),
+     Classification(None, None, "Remote")),
+    (("Python Developer", "", "$100k and equity"),
+     Classification("$100", None, "On-site")),
+    (("Developer", "Denver", "Pay: $55 per hour, REMOTE OK"),
+     Classification("$55 per hour", None, "Remote")),
+    (("Principal Engineer", "Seattle", "Salary: 150000 usd"),
+     Classification("150000 usd", "Lead", "On-site")),
+    (("", "", ""),
+     Classification(None, None, "On-site")),
+    (("Ingénieur Senior", "Montréal", "Télétravail — 80 000 EUR"),
+     Classification("000 EUR", "Senior", "On-site")),
+    # 'ſ' folds onto 's' case-insensitively, and İ lowercases to two characters
+    (("ſenior developer", "Remote", "50ſ USD"),
+     Classification(None, None, "Remote")),
+    (("İstanbul Senior Engineer", "İzmir", "Hybrid, $80,000 annually"),
+     Classification("$80,000 annually", "Senior", "Hybrid")),
+]
+
+
+def recorded_postings() -> list[tuple[str, str, str]]:
+    """Titles, locations and descriptions from the recorded pages in bench/fixtures."""
+    cards, _ = parse_listing((FIXTURES / "python_listing.html").read_text(), PythonOrgScraper.BASE_URL)
+    description = PythonOrgScraper._parse_detail((FIXTURES / "python_detail.html").read_text())
+    postings = [(card["title"], card.get("location") or "", description) for card in cards]
+    for result in json.loads((FIXTURES / "simplify_search.json").read_text())["results"]:
+        for hit in result.get("hits", []):
+            doc = hit["document"]
+            postings.append((
+                doc.get("title") or "",
+                ", ".join(doc.get("locations") or []),
+                " ".join(str(doc.get(key) or "") for key in ("description", "work_type", "experience_level")),
+            ))
+    return postings
+
+
+@pytest.mark.parametrize(("args", "expected"), GOLDEN)
+def test_golden(args, expected):
+    assert _classify_reference(*args) == expected
+    assert classify(*args) == expected
+
+
+def test_recorded_postings_match_reference():
+    postings = recorded_postings()
+    assert postings
+    assert classify_many(postings) == [_classify_reference(*p) for p in postings]
+
+
+def test_random_text_matches_reference():
+    tokens = [
+        "intern", "internship", "Junior", "entry level", "entry-level", "mid-level", "intermediate",
+        "Senior", "sr.", "lead", "Principal", "staff", "director", "head of", "vp", "vice president",
+        "remote", "telecommute", "hybrid", "$", "$120,000", "$120,000 - $150,000", "$55/hr", "per year",
+        "USD", "usd 120000", "EUR 5,000-6,000", "100,000 GBP", "to", "–", "python", "developer",
+        ",", ".", "\n", "é", "ſ", "İ", "K", "-",
+    ]
+    rng = random.Random(0)
+
+    def text(n: int) -> str:
+        return "".join(rng.choice(tokens) + rng.choice([" ", "", "-", "\n"]) for _ in range(rng.randint(0, n)))
+
+    for _ in range(3000):
+        args = (text(8), text(4), text(40))
+        assert classify(*args) == _classify_reference(*args), args
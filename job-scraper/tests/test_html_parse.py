@@ -0,0 +1,44 @@
+from pathlib import Path
+
+import pytest
+
+from html_parse import parse_description, parse_listing
+
+FIXTURES = Path(__file__).resolve().parent.parent / "bench" / "fixtures"
+BASE_URL = "https://www.python.org"
+
+LISTING = (FIXTURES / "python_listing.html").read_text()
+DETAIL = (FIXTURES / "python_detail.html").read_text()
+TEMPLATE = "<template><p>Hidden <b>template</b> text</p></template>"
+
+LISTINGS = {
+    "recorded": LISTING,
+    "unpaginated": LISTING.replace('class="pagination', 'class="pages'),
+    "no job list": LISTING.replace("list-recent-jobs", "list-old-jobs"),
+    "template in a card": LISTING.replace('<span class="listing-location">', f'{TEMPLATE}<span class="listing-location">', 1),
+    "empty": "",
+}
+DETAILS = {
+    "recorded": DETAIL,
+    "template and script": DETAIL.replace(
+        '<div class="job-description">', f'<div class="job-description">{TEMPLATE}<script>var x = 1;</script>', 1,
+    ),
+    "no description": DETAIL.replace("job-description", "job-summary"),
+    "empty": "",
+}
+
+
+def test_fixtures_exercise_the_parsers():
+    cards, last_page = parse_listing(LISTING, BASE_URL, backend="bs4")
+    assert cards and last_page > 1
+    assert parse_description(DETAIL, backend="bs4")
+
+
+@pytest.mark.parametrize("html", LISTINGS.values(), ids=LISTINGS.keys())
+def test_listing_backends_agree(html):
+    assert parse_listing(html, BASE_URL, backend="lxml") == parse_listing(html, BASE_URL, backend="bs4")
+
+
+@pytest.mark.parametrize("html", DETAILS.values(), ids=DETAILS.keys())
+def test_description_backends_agree(html):
+    assert parse_description(html, backend="lxml") == parse_description(html, backend="bs4")
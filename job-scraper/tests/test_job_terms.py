@@ -0,0 +1,30 @@
+import json
+
+import pytest
+
+from job_terms import VOCABULARY_PATH, skill_term, skill_terms
+
+SKILLS = json.loads(VOCABULARY_PATH.read_text())["skills"]
+
+
+@pytest.mark.parametrize("skill", ["Rust", "Go", "Golang", "Swift", "REST", "Spring Boot"])
+def test_ambiguous_skills_are_searched_in_text(skill):
+    assert skill_term(skill) is None
+
+
+def test_rust_posting_is_not_indexed_as_rust():
+    # Which is why a user's "Rust" must not be looked up in the index
+    assert "rust" not in skill_terms("Senior Rust engineer. Rust, Go, Swift, Ruby and C.")
+
+
+@pytest.mark.parametrize("skill", ["Python", "TypeScript", "C++", "Node.js", "PostgreSQL"])
+def test_indexed_skills_have_a_term(skill):
+    assert skill_term(skill) is not None
+
+
+@pytest.mark.parametrize("skill", [name for canonical, names in SKILLS.items() for name in (canonical, *names)])
+def test_looked_up_terms_are_indexed_from_text(skill):
+    # A skill the dashboard looks up must be found by the indexer when a posting names it
+    term = skill_term(skill)
+    if term is not None:
+        assert term in skill_terms(skill)
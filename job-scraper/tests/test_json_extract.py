@@ -0,0 +1,34 @@
+from json_extract import UNRELATED_AFTER, UNRELATED_RECHECK, JsonJobExtractor, response_kind
+
+SEARCH = "https://api.example.com/search?q=engineer&page=1"
+FACETS = "https://api.example.com/search?q=engineer&facet_by=level"
+JOBS = {"results": [{"title": "Backend Engineer", "company_name": "Acme"}]}
+FACET_COUNTS = {"facet_counts": [{"field_name": "level", "counts": [{"value": "Senior", "count": 3}]}]}
+
+
+def test_response_kind_keeps_query_names_only():
+    assert response_kind(SEARCH) == response_kind("https://api.example.com/search?page=7&q=python")
+    assert response_kind(SEARCH) != response_kind(FACETS)
+
+
+def test_facet_call_does_not_hide_search_responses():
+    extractor = JsonJobExtractor()
+    for _ in range(UNRELATED_AFTER):
+        assert extractor.extract(FACETS, FACET_COUNTS) == []
+    assert not extractor.wants(FACETS)
+    assert extractor.wants(SEARCH)
+    assert extractor.extract(SEARCH, JOBS) == JOBS["results"]
+
+
+def test_unrelated_kind_is_rechecked_and_forgiven():
+    extractor = JsonJobExtractor()
+    url = "https://api.example.com/search"
+    assert extractor.extract(url, FACET_COUNTS) == []
+    assert extractor.wants(url)  # one job-less payload isn't enough
+    for _ in range(UNRELATED_AFTER - 1):
+        extractor.extract(url, FACET_COUNTS)
+    wanted = [extractor.wants(url) for _ in range(UNRELATED_RECHECK)]
+    assert wanted.count(True) == 1 and wanted[-1]
+    # The rechecked response carried jobs: the kind is wanted again
+    assert extractor.extract(url, JOBS) == JOBS["results"]
+    assert extractor.wants(url)
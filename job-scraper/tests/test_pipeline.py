@@ -0,0 +1,24 @@
+import asyncio
+
+import pytest
+
+from pipeline import Stage, run_pipeline
+
+
+class FailingBatcher:
+    async def add(self, job):
+        raise RuntimeError("insert failed")
+
+    async def flush(self):
+        return 0
+
+
+async def passthrough(item):
+    return item
+
+
+def test_writer_failure_stops_the_pipeline():
+    # With the writer gone the stages would block on a full queue forever
+    run = run_pipeline(range(500), [Stage("map", passthrough, workers=2)], FailingBatcher(), queue_size=5)
+    with pytest.raises(RuntimeError, match="insert failed"):
+        asyncio.run(asyncio.wait_for(run, 5))
@@ -0,0 +1,33 @@
+import pytest
+
+from salary import SalaryRange, parse_wage, wage_columns
+
+
+@pytest.mark.parametrize(("wage", "expected"), [
+    ("$120,000 - $150,000 per year", SalaryRange(120000, 150000, "USD", "year", 135000)),
+    ("$55/hr", SalaryRange(55, 55, "USD", "hour", 114400)),
+    ("€4.500 - 5.000 monthly", SalaryRange(4500, 5000, "EUR", "month", 57000)),
+    ("CA$90k", SalaryRange(90000, 90000, "CAD", "year", 90000)),
+    ("₹ 25,00,000", SalaryRange(2500000, 2500000, "INR", "year", 2500000)),
+])
+def test_parse_wage(wage, expected):
+    assert parse_wage(wage) == expected
+
+
+@pytest.mark.parametrize("wage", [
+    None,
+    "",
+    "Competitive",
+    # A funding amount, not pay: would overflow the integer wageAnnualized column
+    "$3,000,000,000",
+    "$90,000 per hour",
+    "$0.01",
+])
+def test_parse_wage_rejects(wage):
+    assert parse_wage(wage) is None
+
+
+def test_implausible_wage_leaves_columns_null():
+    assert wage_columns("$3,000,000,000") == {
+        "wageMin": None, "wageMax": None, "wageCurrency": None, "wagePeriod": None, "wageAnnualized": None,
+    }
@@ -2,9 +2,19 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import math
+import os
 import random
 import re
+import time
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
+from urllib.parse import urlsplit
+
+from fake_useragent import UserAgent
+
+from metrics import METRICS
 
 # Logging
 logging.basicConfig(
@@ -15,10 +25,69 @@ logging.basicConfig(
 logger = logging.getLogger("scraper_engine")
 
 # Constants
-MAX_JOBS_PER_SOURCE = 15
 HUMAN_DELAY_MIN = 1.0
 HUMAN_DELAY_MAX = 4.0
 
+# Concurrent engine mode: total open pages, and in-flight pages per source
+MAX_CONCURRENCY = int(os.getenv("SCRAPER_MAX_CONCURRENCY", "6"))
+MAX_CONCURRENCY_PER_SOURCE = int(os.getenv("SCRAPER_MAX_CONCURRENCY_PER_SOURCE", "3"))
+
+# Per-source crawl budget: detail pages visited, listing pages walked, wall
+# time and bytes downloaded — whichever runs out first ends the crawl.
+MAX_JOBS_PER_SOURCE = int(os.getenv("SCRAPER_MAX_JOBS_PER_SOURCE", "50"))
+CRAWL_MAX_PAGES = int(os.getenv("SCRAPER_CRAWL_MAX_PAGES", "10"))
+CRAWL_MAX_SECONDS = float(os.getenv("SCRAPER_CRAWL_MAX_SECONDS", "600"))
+CRAWL_MAX_BYTES = int(os.getenv("SCRAPER_CRAWL_MAX_BYTES", str(20 * 1024 * 1024)))
+
+# Jobs buffered per source before a bulk insert round trip
+DB_BATCH_SIZE = int(os.getenv("SCRAPER_DB_BATCH_SIZE", "25"))
+
+# Incremental sync: SCRAPER_INCREMENTAL=1 re-checks already-stored postings
+# (conditional requests keep unchanged ones cheap) so edits are picked up.
+INCREMENTAL_SYNC = os.getenv("SCRAPER_INCREMENTAL", "0") == "1"
+# Postings a source hasn't listed for this many days are marked inactive
+STALE_AFTER_DAYS = int(os.getenv("SCRAPER_STALE_AFTER_DAYS", "14"))
+
+# Bounded queue length between pipeline stages (backpressure)
+PIPELINE_QUEUE_SIZE = int(os.getenv("SCRAPER_PIPELINE_QUEUE_SIZE", "50"))
+
+# Browser request blocking — SCRAPER_BLOCK_RESOURCES=0 turns it off.  XHR /
+# fetch / document / script are never blocked by type, only by domain.
+BLOCK_RESOURCES = os.getenv("SCRAPER_BLOCK_RESOURCES", "1") != "0"
+BLOCKED_RESOURCE_TYPES: frozenset[str] = frozenset(
+    t.strip() for t in os.getenv(
+        "SCRAPER_BLOCKED_RESOURCE_TYPES", "image,media,font,stylesheet"
+    ).split(",") if t.strip()
+)
+BLOCKED_DOMAINS: tuple[str, ...] = tuple(
+    d.strip() for d in os.getenv(
+        "SCRAPER_BLOCKED_DOMAINS",
+        "google-analytics.com,googletagmanager.com,doubleclick.net,googlesyndication.com,"
+        "facebook.net,connect.facebook.com,hotjar.com,segment.io,segment.com,mixpanel.com,"
+        "amplitude.com,fullstory.com,clarity.ms,intercom.io,intercomcdn.com,"
+        "ads.linkedin.com,px.ads.linkedin.com,bat.bing.com,adservice.google.com",
+    ).split(",") if d.strip()
+)
+
+# Per-host rate limit, in requests/second.  Each host starts at
+# SCRAPER_RATE_INITIAL and adapts AIMD-style within [MIN, MAX]: +INCREASE
+# after each response faster than TARGET_LATENCY seconds, ×DECREASE after a
+# slower one, a timeout or a 429/503.  BURST requests may start back to back.
+RATE_INITIAL = float(os.getenv("SCRAPER_RATE_INITIAL", "0.5"))
+RATE_MIN = float(os.getenv("SCRAPER_RATE_MIN", "0.1"))
+RATE_MAX = float(os.getenv("SCRAPER_RATE_MAX", "8"))
+RATE_BURST = float(os.getenv("SCRAPER_RATE_BURST", "2"))
+RATE_INCREASE = float(os.getenv("SCRAPER_RATE_INCREASE", "0.1"))
+RATE_DECREASE = float(os.getenv("SCRAPER_RATE_DECREASE", "0.5"))
+RATE_TARGET_LATENCY = float(os.getenv("SCRAPER_RATE_TARGET_LATENCY", "2.0"))
+
+# Pages that fail transiently (timeouts, 429, 5xx) get RETRY_ATTEMPTS tries
+# in all, with a random backoff of up to RETRY_BASE_DELAY * 2^n seconds
+# (at most RETRY_MAX_DELAY) between them.
+RETRY_ATTEMPTS = int(os.getenv("SCRAPER_RETRY_ATTEMPTS", "4"))
+RETRY_BASE_DELAY = float(os.getenv("SCRAPER_RETRY_BASE_DELAY", "2"))
+RETRY_MAX_DELAY = float(os.getenv("SCRAPER_RETRY_MAX_DELAY", "60"))
+
 VIEWPORT_POOL: list[dict[str, int]] = [
     {"width": 1920, "height": 1080},
     {"width": 1366, "height": 768},
@@ -27,9 +96,199 @@ VIEWPORT_POOL: list[dict[str, int]] = [
     {"width": 1280, "height": 720},
 ]
 
+# Daemon mode: warm browser contexts kept open between runs.  A context is
+# replaced after serving this many pages, or once its JS heap has grown by
+# more than CONTEXT_MAX_HEAP_GROWTH_MB since it was created.
+CONTEXT_POOL_SIZE = int(os.getenv("SCRAPER_CONTEXT_POOL_SIZE", "2"))
+CONTEXT_MAX_PAGES = int(os.getenv("SCRAPER_CONTEXT_MAX_PAGES", "200"))
+CONTEXT_MAX_HEAP_GROWTH_MB = float(os.getenv("SCRAPER_CONTEXT_MAX_HEAP_GROWTH_MB", "256"))
+
+
+@lru_cache(maxsize=1)
+def _user_agents() -> UserAgent:
+    # Loading the browser data file is the slow part; do it once per process
+    return UserAgent(browsers=["chrome", "edge", "firefox"])
+
+
+def random_user_agent() -> str:
+    return _user_agents().random
+
+
 async def human_delay(lo: float = HUMAN_DELAY_MIN, hi: float = HUMAN_DELAY_MAX) -> None:
     """Sleep a random interval to mimic human pacing."""
-    await asyncio.sleep(random.uniform(lo, hi))
+    with METRICS.timer("human_delay_seconds"):
+        await asyncio.sleep(random.uniform(lo, hi))
+
+
+@dataclass
+class _HostBucket:
+    rate: float  # requests/second currently allowed
+    tokens: float  # may go negative: requests already promised a later start
+    updated: float
+    paused_until: float = 0.0
+    cut_at: float = -math.inf  # last multiplicative decrease
+
+
+class HostThrottle:
+    """Per-host politeness: an adaptive token bucket for each host.
+
+    :meth:`wait` takes a token for the URL's host, sleeping until one is
+    due, so concurrent workers hitting one host share its rate while
+    different hosts never wait on each other.  The rate follows AIMD:
+    :meth:`success` adds *increase* req/s after a response faster than
+    *target_latency*, while a slow one or :meth:`backoff` (429/503,
+    timeouts) multiplies it by *decrease* — at most once per
+    *target_latency*, so one burst of failures counts as one congestion
+    signal.  A ``Retry-After`` pauses the host outright.
+    """
+
+    def __init__(
+        self,
+        rate: float = RATE_INITIAL,
+        min_rate: float = RATE_MIN,
+        max_rate: float = RATE_MAX,
+        burst: float = RATE_BURST,
+        increase: float = RATE_INCREASE,
+        decrease: float = RATE_DECREASE,
+        target_latency: float = RATE_TARGET_LATENCY,
+    ) -> None:
+        self.initial_rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.increase = increase
+        self.decrease = decrease
+        self.target_latency = target_latency
+        self._buckets: dict[str, _HostBucket] = {}
+
+    @classmethod
+    def unlimited(cls) -> HostThrottle:
+        """A throttle that never waits, e.g. to measure work rather than pacing."""
+        return cls(rate=math.inf, max_rate=math.inf)
+
+    def rate(self, url: str) -> float:
+        """Requests/second currently allowed to the URL's host."""
+        return self._bucket(urlsplit(url).netloc).rate
+
+    async def wait(self, url: str) -> None:
+        bucket = self._bucket(urlsplit(url).netloc)
+        if math.isinf(bucket.rate):
+            return
+        now = self._refill(bucket)
+        bucket.tokens -= 1
+        delay = max(bucket.paused_until - now, -bucket.tokens / bucket.rate)
+        if delay > 0:
+            with METRICS.timer("throttle_wait_seconds"):
+                await asyncio.sleep(delay)
+
+    def success(self, url: str, seconds: float) -> None:
+        """Report a response that took *seconds*: speeds the host up unless it was slow."""
+        bucket = self._bucket(urlsplit(url).netloc)
+        if seconds > self.target_latency:
+            self._cut(bucket)
+        elif bucket.rate < self.max_rate:
+            self._refill(bucket)
+            bucket.rate = min(self.max_rate, bucket.rate + self.increase)
+
+    def backoff(self, url: str, retry_after: Optional[float] = None) -> None:
+        """Report a 429/503 or timeout: slow the host down, pausing it for *retry_after* seconds."""
+        bucket = self._bucket(urlsplit(url).netloc)
+        METRICS.inc("throttle_backoffs_total")
+        self._cut(bucket)
+        if retry_after:
+            now = asyncio.get_running_loop().time()
+            bucket.paused_until = max(bucket.paused_until, now + retry_after)
+
+    def _bucket(self, host: str) -> _HostBucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            now = asyncio.get_running_loop().time()
+            bucket = self._buckets[host] = _HostBucket(self.initial_rate, self.burst, now)
+        return bucket
+
+    def _refill(self, bucket: _HostBucket) -> float:
+        """Credit the tokens earned since the last update at the current rate."""
+        now = asyncio.get_running_loop().time()
+        bucket.tokens = min(self.burst, bucket.tokens + (now - bucket.updated) * bucket.rate)
+        bucket.updated = now
+        return now
+
+    def _cut(self, bucket: _HostBucket) -> None:
+        now = self._refill(bucket)
+        if math.isinf(bucket.rate) or now - bucket.cut_at < self.target_latency:
+            return
+        bucket.rate = max(self.min_rate, bucket.rate * self.decrease)
+        bucket.cut_at = now
+
+
+class RetryPolicy:
+    """Jittered exponential backoff for transient failures.
+
+    Attempt *n* (from 0) that fails waits a uniformly random time of up to
+    ``base * 2**n`` seconds, capped at *cap* ("full jitter", so workers that
+    failed together don't retry together), for at most *attempts* tries.
+    """
+
+    def __init__(self, attempts: int = RETRY_ATTEMPTS, base: float = RETRY_BASE_DELAY, cap: float = RETRY_MAX_DELAY) -> None:
+        self.attempts = max(1, attempts)
+        self.base = base
+        self.cap = cap
+
+    def delay(self, attempt: int) -> float:
+        return random.uniform(0, min(self.cap, self.base * 2 ** attempt))
+
+
+class CrawlBudget:
+    """Throughput budget for one source's crawl.
+
+    :meth:`take_jobs` hands out detail-visit slots until *max_jobs* are
+    spent; :meth:`add_bytes` accounts downloaded pages.  Once the job, byte
+    or time allowance runs out the budget is :attr:`exhausted` and the
+    crawl stops queueing work.
+    """
+
+    def __init__(
+        self,
+        max_jobs: int = MAX_JOBS_PER_SOURCE,
+        max_seconds: float = CRAWL_MAX_SECONDS,
+        max_bytes: int = CRAWL_MAX_BYTES,
+    ) -> None:
+        self.max_jobs = max_jobs
+        self.max_bytes = max_bytes
+        self.jobs = 0
+        self.bytes = 0
+        self._deadline = time.monotonic() + max_seconds
+
+    def take_jobs(self, wanted: int) -> int:
+        """Reserve up to *wanted* detail visits; returns how many were granted."""
+        if self.exhausted:
+            return 0
+        granted = max(0, min(wanted, self.max_jobs - self.jobs))
+        self.jobs += granted
+        return granted
+
+    @property
+    def jobs_left(self) -> int:
+        """Detail visits :meth:`take_jobs` would still grant."""
+        return 0 if self.exhausted else max(0, self.max_jobs - self.jobs)
+
+    def add_bytes(self, count: int) -> None:
+        self.bytes += count
+
+    @property
+    def exhausted(self) -> bool:
+        return self.exhausted_by is not None
+
+    @property
+    def exhausted_by(self) -> Optional[str]:
+        """Which allowance ran out (``"jobs"``, ``"bytes"``, ``"time"``), if any."""
+        if self.jobs >= self.max_jobs:
+            return "jobs"
+        if self.bytes >= self.max_bytes:
+            return "bytes"
+        if time.monotonic() >= self._deadline:
+            return "time"
+        return None
 
 
 def extract_salary(text: str) -> Optional[str]:
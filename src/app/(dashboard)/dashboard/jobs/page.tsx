@@ -51,11 +51,13 @@ export default async function JobsPage({
     db
       .select()
       .from(ScrapedJobsTable)
+      .where(eq(ScrapedJobsTable.isActive, true))
       .limit(JOBS_PER_PAGE)
       .offset(offset),
     db
       .select({ total: count() })
-      .from(ScrapedJobsTable),
+      .from(ScrapedJobsTable)
+      .where(eq(ScrapedJobsTable.isActive, true)),
   ]);
 
   const totalJobs = totalCountResult[0]?.total ?? 0;
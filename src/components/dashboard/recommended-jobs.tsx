@@ -1,10 +1,12 @@
-// Server Component: fetches the user's resume skills and scraped jobs,
-// scores each job against the user's skills, and renders the top 5 matches.
+// Server Component: fetches the user's resume skills, looks up candidate
+// jobs in the scraper's term index, scores them against the user's skills,
+// and renders the top 5 matches.
 
 import { auth } from "@clerk/nextjs/server";
 import { db } from "@/drizzle/db";
-import { UserTable, UserResumeTable, ScrapedJobsTable, SavedJobsTable } from "@/drizzle/schema";
-import { eq, desc } from "drizzle-orm";
+import { UserTable, UserResumeTable, ScrapedJobsTable, ScrapedJobTermsTable, SavedJobsTable } from "@/drizzle/schema";
+import { and, count, desc, eq, inArray, or, sql } from "drizzle-orm";
+import { skillTerm, titleTerms } from "@/lib/jobTerms";
 import { Sparkles, FileText } from "lucide-react";
 import Link from "next/link";
 import { Job } from "./job-card";
@@ -18,35 +20,40 @@ type MatchData = {
 };
 
 // ── Scoring Algorithm ──────────────────────────────────────────────
-// Pure function: takes a job and the user's skills, returns a 0–100 score.
-// No external libraries — just string matching and basic math.
+// Pure function: takes a candidate job and the user's skills, returns a
+// 0–100 score.  Skills the scraper's vocabulary knows were already matched
+// through the term index (`indexedHits`); only the others are searched for
+// in the job text.
 function calculateMatchScore(
   job: { title: string; description: string },
-  userSkills: string[],
-  primaryJobTitles: string[]
+  indexedHits: number,
+  freeTextSkills: string[],
+  skillCount: number,
+  primaryTitleTerms: string[][]
 ): number {
-  if (userSkills.length === 0) return 0;
-
-  // Combine title + description into one searchable string
-  const searchText = `${job.title} ${job.description}`.toLowerCase();
-
-  // Count how many of the user's skills appear in the job text
-  let matchCount = 0;
-  for (const skill of userSkills) {
-    if (searchText.includes(skill.toLowerCase())) {
-      matchCount++;
+  if (skillCount === 0) return 0;
+
+  let matchCount = indexedHits;
+  if (freeTextSkills.length > 0) {
+    const searchText = `${job.title} ${job.description}`.toLowerCase();
+    for (const skill of freeTextSkills) {
+      if (searchText.includes(skill.toLowerCase())) {
+        matchCount++;
+      }
     }
   }
 
   // Base score: percentage of user skills found in the job
-  let score = Math.round((matchCount / userSkills.length) * 100);
+  let score = Math.round((matchCount / skillCount) * 100);
 
   // Bonus: +15 points if the job title closely matches one of the
-  // user's primary job titles (e.g., "Frontend Developer" in both)
-  const jobTitleLower = job.title.toLowerCase();
-  const hasTitleMatch = primaryJobTitles.some((title) =>
-    jobTitleLower.includes(title.toLowerCase()) ||
-    title.toLowerCase().includes(jobTitleLower)
+  // user's primary job titles (all words of one appear in the other)
+  const jobTitleTerms = new Set(titleTerms(job.title));
+  const hasTitleMatch = primaryTitleTerms.some((terms) =>
+    terms.length > 0 && (
+      terms.every((term) => jobTitleTerms.has(term)) ||
+      [...jobTitleTerms].every((term) => terms.includes(term))
+    )
   );
   if (hasTitleMatch) {
     score += 15;
@@ -57,6 +64,11 @@ function calculateMatchScore(
 }
 
 const TOP_N_JOBS = 5;
+// Jobs ranked by indexed term matches that get fully scored
+const CANDIDATE_LIMIT = 50;
+// Skills outside the vocabulary can only be matched by text search, which
+// is limited to this many of the latest jobs
+const RECENT_SCAN_LIMIT = 100;
 
 export async function RecommendedJobs() {
   // ── Step 1: Authenticate ─────────────────────────────────────────
@@ -118,14 +130,50 @@ export async function RecommendedJobs() {
     );
   }
 
-  // ── Step 4: Fetch jobs + saved IDs in parallel ───────────────────
-  const [rawJobs, savedRows] = await Promise.all([
-    // Fetch the latest 100 jobs for scoring
+  // ── Step 4: Look up candidate jobs in the term index ─────────────
+  const indexedSkills = new Set<string>();
+  const freeTextSkills: string[] = [];
+  for (const skill of matchData.coreSkills) {
+    const term = skillTerm(skill);
+    if (term) indexedSkills.add(term);
+    else freeTextSkills.push(skill);
+  }
+  const primaryTitleTerms = matchData.primaryJobTitles.map(titleTerms);
+  const titleWords = [...new Set(primaryTitleTerms.flat())];
+
+  const termConditions = [
+    indexedSkills.size > 0 &&
+      and(eq(ScrapedJobTermsTable.field, "skill"), inArray(ScrapedJobTermsTable.term, [...indexedSkills])),
+    titleWords.length > 0 &&
+      and(eq(ScrapedJobTermsTable.field, "title"), inArray(ScrapedJobTermsTable.term, titleWords)),
+  ].filter((condition) => condition !== false);
+
+  const skillHits = sql<number>`count(*) filter (where ${ScrapedJobTermsTable.field} = 'skill')`.mapWith(Number);
+  const rankedJobs = termConditions.length === 0 ? [] : await db
+    .select({ jobId: ScrapedJobTermsTable.jobId, skillHits })
+    .from(ScrapedJobTermsTable)
+    .innerJoin(ScrapedJobsTable, eq(ScrapedJobsTable.id, ScrapedJobTermsTable.jobId))
+    .where(and(eq(ScrapedJobsTable.isActive, true), or(...termConditions)))
+    .groupBy(ScrapedJobTermsTable.jobId)
+    .orderBy(desc(skillHits), desc(count()))
+    .limit(CANDIDATE_LIMIT);
+
+  const indexedHits = new Map(rankedJobs.map((row) => [row.jobId, row.skillHits]));
+
+  // ── Step 5: Fetch candidate jobs + saved IDs in parallel ─────────
+  const [matchedJobs, recentJobs, savedRows] = await Promise.all([
+    indexedHits.size === 0 ? [] : db
+      .select()
+      .from(ScrapedJobsTable)
+      .where(inArray(ScrapedJobsTable.id, [...indexedHits.keys()])),
+    // The latest live jobs fill in when few match, and are text-searched
+    // for skills the index can't answer
     db
       .select()
       .from(ScrapedJobsTable)
+      .where(eq(ScrapedJobsTable.isActive, true))
       .orderBy(desc(ScrapedJobsTable.scrapedAt))
-      .limit(100),
+      .limit(freeTextSkills.length > 0 ? RECENT_SCAN_LIMIT : TOP_N_JOBS),
     // Fetch the user's saved job IDs to show filled bookmarks
     db
       .select({ jobId: SavedJobsTable.jobId })
@@ -134,8 +182,9 @@ export async function RecommendedJobs() {
   ]);
 
   const savedJobIds = new Set(savedRows.map((r) => r.jobId));
+  const rawJobs = [...new Map([...matchedJobs, ...recentJobs].map((row) => [row.id, row])).values()];
 
-  // ── Step 5: Score, sort, and pick the top N jobs ─────────────────
+  // ── Step 6: Score, sort, and pick the top N jobs ─────────────────
   const scoredJobs: Job[] = rawJobs
     .map((row) => ({
       id: row.id,
@@ -150,8 +199,10 @@ export async function RecommendedJobs() {
       isSaved: savedJobIds.has(row.id),
       matchScore: calculateMatchScore(
         { title: row.title, description: row.description },
-        matchData.coreSkills,
-        matchData.primaryJobTitles
+        indexedHits.get(row.id) ?? 0,
+        freeTextSkills,
+        matchData.coreSkills.length,
+        primaryTitleTerms
       ),
     }))
     // Sort by highest match score first
@@ -159,7 +210,7 @@ export async function RecommendedJobs() {
     // Take only the top results
     .slice(0, TOP_N_JOBS);
 
-  // ── Step 6: Render ───────────────────────────────────────────────
+  // ── Step 7: Render ───────────────────────────────────────────────
   return (
     <div className="space-y-6">
       <div className="flex flex-col sm:flex-row sm:items-center justify-between gap-4 pb-2">
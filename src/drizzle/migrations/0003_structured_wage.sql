@@ -0,0 +1,6 @@
+ALTER TABLE "scraped_jobs" ADD COLUMN "wageMin" real;--> statement-breakpoint
+ALTER TABLE "scraped_jobs" ADD COLUMN "wageMax" real;--> statement-breakpoint
+ALTER TABLE "scraped_jobs" ADD COLUMN "wageCurrency" varchar(3);--> statement-breakpoint
+ALTER TABLE "scraped_jobs" ADD COLUMN "wagePeriod" varchar;--> statement-breakpoint
+ALTER TABLE "scraped_jobs" ADD COLUMN "wageAnnualized" integer;--> statement-breakpoint
+CREATE INDEX "scraped_jobs_wage_annualized_index" ON "scraped_jobs" USING btree ("wageAnnualized");
\ No newline at end of file
@@ -0,0 +1,4 @@
+ALTER TABLE "scraped_jobs" ADD COLUMN "contentHash" varchar;--> statement-breakpoint
+ALTER TABLE "scraped_jobs" ADD COLUMN "lastSeenAt" timestamp with time zone DEFAULT now() NOT NULL;--> statement-breakpoint
+ALTER TABLE "scraped_jobs" ADD COLUMN "isActive" boolean DEFAULT true NOT NULL;--> statement-breakpoint
+CREATE INDEX "scraped_jobs_active_index" ON "scraped_jobs" USING btree ("isActive","scrapedAt");
\ No newline at end of file
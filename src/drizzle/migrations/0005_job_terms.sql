@@ -0,0 +1,9 @@
+CREATE TABLE "scraped_job_terms" (
+	"field" varchar NOT NULL,
+	"term" varchar NOT NULL,
+	"jobId" uuid NOT NULL,
+	CONSTRAINT "scraped_job_terms_field_term_jobId_pk" PRIMARY KEY("field","term","jobId")
+);
+--> statement-breakpoint
+ALTER TABLE "scraped_job_terms" ADD CONSTRAINT "scraped_job_terms_jobId_scraped_jobs_id_fk" FOREIGN KEY ("jobId") REFERENCES "public"."scraped_jobs"("id") ON DELETE cascade ON UPDATE no action;--> statement-breakpoint
+CREATE INDEX "scraped_job_terms_job_id_index" ON "scraped_job_terms" USING btree ("jobId");
\ No newline at end of file
@@ -0,0 +1,15 @@
+CREATE TABLE "scrape_frontier" (
+	"source" varchar NOT NULL,
+	"key" text NOT NULL,
+	"kind" varchar NOT NULL,
+	"status" varchar DEFAULT 'pending' NOT NULL,
+	"payload" jsonb,
+	"attempts" integer DEFAULT 0 NOT NULL,
+	"leaseOwner" varchar,
+	"leaseExpiresAt" timestamp with time zone,
+	"createdAt" timestamp with time zone DEFAULT now() NOT NULL,
+	"updatedAt" timestamp with time zone DEFAULT now() NOT NULL,
+	CONSTRAINT "scrape_frontier_source_key_pk" PRIMARY KEY("source","key")
+);
+--> statement-breakpoint
+CREATE INDEX "scrape_frontier_status_index" ON "scrape_frontier" USING btree ("source","kind","status");
\ No newline at end of file
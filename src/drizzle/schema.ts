@@ -2,6 +2,8 @@ export * from '@/drizzle/schema/user'
 export * from './schema/userResume'
 export * from './schema/userNotificationSettings'
 export * from './schema/scrapedJobs'
+export * from './schema/scrapedJobTerms'
+export * from './schema/scrapeFrontier'
 export * from './schema/savedJobs'
 export * from './schema/generatedCoverLetter'
 export * from './schema/interviewSessions'
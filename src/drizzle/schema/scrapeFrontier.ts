@@ -0,0 +1,29 @@
+import { index, integer, jsonb, pgTable, primaryKey, text, timestamp, varchar } from "drizzle-orm/pg-core";
+
+export const frontierKinds = ["item", "cursor", "crawl"] as const
+export type frontierKind = (typeof frontierKinds)[number]
+
+export const frontierStatuses = ["pending", "leased", "done", "failed"] as const
+export type frontierStatus = (typeof frontierStatuses)[number]
+
+// Crawl progress of each scraper source (see job-scraper/frontier.py): work
+// items a crawl discovered, leased row by row to the run processing them,
+// plus saved listing positions.  In sharded runs a "crawl" row queues the
+// source's listing walk for a worker.  Cleared once a crawl completes.
+export const ScrapeFrontierTable = pgTable("scrape_frontier", {
+    source: varchar().notNull(),
+    key: text().notNull(), // sourceUrl of an item; cursor name of a cursor; "crawl"
+    kind: varchar({ enum: frontierKinds }).notNull(),
+    status: varchar({ enum: frontierStatuses }).notNull().default("pending"),
+    payload: jsonb(), // the item itself, or the listing position
+    attempts: integer().notNull().default(0), // times leased
+    leaseOwner: varchar(),
+    leaseExpiresAt: timestamp({withTimezone: true}),
+    createdAt: timestamp({withTimezone: true}).notNull().defaultNow(),
+    updatedAt: timestamp({withTimezone: true}).notNull().defaultNow(),
+},
+(table) => ({
+    pk: primaryKey({ columns: [table.source, table.key] }),
+    statusIndex: index("scrape_frontier_status_index").on(table.source, table.kind, table.status),
+}),
+)
@@ -0,0 +1,27 @@
+import { index, pgTable, primaryKey, uuid, varchar } from "drizzle-orm/pg-core";
+import { ScrapedJobsTable } from "./scrapedJobs";
+import { relations } from "drizzle-orm";
+
+export const jobTermFields = ["skill", "title"] as const
+export type jobTermField = (typeof jobTermFields)[number]
+
+// Inverted index over scraped_jobs, maintained by the scraper as it writes
+// postings: vocabulary skills found in title + description, and the
+// normalized words of the title (see job-scraper/job_terms.py).
+export const ScrapedJobTermsTable = pgTable("scraped_job_terms", {
+    field: varchar({ enum: jobTermFields }).notNull(),
+    term: varchar().notNull(),
+    jobId: uuid().notNull().references(() => ScrapedJobsTable.id, {onDelete: "cascade"}),
+},
+(table) => ({
+    pk: primaryKey({ columns: [table.field, table.term, table.jobId] }),
+    jobIdIndex: index("scraped_job_terms_job_id_index").on(table.jobId),
+}),
+)
+
+export const scrapedJobTermsRelations = relations(ScrapedJobTermsTable, ({one}) => ({
+    job: one(ScrapedJobsTable, {
+        fields: [ScrapedJobTermsTable.jobId],
+        references: [ScrapedJobsTable.id]
+    })
+}))
@@ -1,8 +1,9 @@
 import { relations } from "drizzle-orm";
-import { pgTable, text, timestamp, uuid, varchar } from "drizzle-orm/pg-core";
+import { boolean, index, integer, pgTable, real, text, timestamp, uuid, varchar } from "drizzle-orm/pg-core";
 import { SavedJobsTable } from "./savedJobs";
 import { InterviewSessionsTable } from "./interviewSessions";
 import { GeneratedCoverLettersTable } from "./generatedCoverLetter";
+import { ScrapedJobTermsTable } from "./scrapedJobTerms";
 
 export const ScrapedJobsTable = pgTable("scraped_jobs", {
     id: uuid().primaryKey().defaultRandom(),
@@ -10,17 +11,32 @@ export const ScrapedJobsTable = pgTable("scraped_jobs", {
     companyName: varchar().notNull(),
     description: text().notNull(),
     wage: varchar(),
+    // Parsed from `wage` by the scraper; NULL when it has no amount
+    wageMin: real(),
+    wageMax: real(),
+    wageCurrency: varchar({ length: 3 }), // ISO 4217
+    wagePeriod: varchar(), // hour | day | week | month | year
+    wageAnnualized: integer(), // midpoint converted to a yearly amount
     locationRequirement: varchar().notNull(),
     experienceLevel: varchar(),
     location: varchar().notNull(),
     sourceUrl: text().unique().notNull(),
     sourceSite: varchar().notNull(),
     scrapedAt: timestamp({withTimezone: true}).notNull().defaultNow(), // When did we findd it?
-    postedAt: varchar() // When was it posted by the Company?
-})
+    postedAt: varchar(), // When was it posted by the Company?
+    contentHash: varchar(), // SHA-256 of the scraped content; a re-scrape only updates the row when it changes
+    lastSeenAt: timestamp({withTimezone: true}).notNull().defaultNow(), // Last time the source still listed it
+    isActive: boolean().notNull().default(true), // False once the source stopped listing it
+},
+(table) => ({
+    wageAnnualizedIndex: index("scraped_jobs_wage_annualized_index").on(table.wageAnnualized),
+    activeIndex: index("scraped_jobs_active_index").on(table.isActive, table.scrapedAt),
+}),
+)
 
 export const scrapedJobsRelations = relations(ScrapedJobsTable, ({one, many}) => ({
     savedJobs: many(SavedJobsTable),
     interviewSessions: many(InterviewSessionsTable),
     generatedCoverLetters: many(GeneratedCoverLettersTable),
+    terms: many(ScrapedJobTermsTable),
 }))
\ No newline at end of file
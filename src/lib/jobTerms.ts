@@ -0,0 +1,56 @@
+// Mirrors job-scraper/job_terms.py: the scraper fills scraped_job_terms
+// with the same tokenizer and vocabulary, so skills and job titles
+// normalized here can be looked up in the index directly.
+import vocabulary from "../../job-scraper/skill_vocabulary.json"
+
+const HYPHEN = /(?<=[a-z0-9])-(?=[a-z0-9])/g
+const TOKEN = /[a-z0-9.+#]+/g
+
+// Lower-cased word tokens: keeps `+ # .` inside tokens (c++, node.js, .net),
+// joins hyphenated words and drops sentence punctuation.
+export function tokenize(text: string): string[] {
+  const tokens: string[] = []
+  for (const raw of text.toLowerCase().replace(HYPHEN, "").match(TOKEN) ?? []) {
+    let token = raw.replace(/\.+$/, "")
+    if (token.startsWith("..")) token = "." + token.replace(/^\.+/, "")
+    if (token && token !== ".") tokens.push(token)
+  }
+  return tokens
+}
+
+const phrase = (text: string) => tokenize(text).join(" ")
+
+// Normalized skill phrase → canonical term
+const skillAliases = new Map<string, string>()
+for (const [canonical, names] of Object.entries(vocabulary.skills)) {
+  const term = phrase(canonical)
+  for (const name of [canonical, ...names]) {
+    const key = phrase(name)
+    if (!skillAliases.has(key)) skillAliases.set(key, term)
+  }
+}
+// Terms of ambiguous words ("go", "rest"): only indexed when spelled out
+// ("golang"), so skills mapping to them are searched in job text instead
+const ambiguousTerms = new Set(
+  vocabulary.ambiguous.map((word) => skillAliases.get(phrase(word))).filter((term) => term !== undefined)
+)
+const stopwords = new Set(vocabulary.stopwords)
+const titleAliases = new Map(
+  Object.entries(vocabulary.titleAliases).map(([alias, word]) => [phrase(alias), phrase(word)])
+)
+
+// Canonical index term of a skill, or null if the vocabulary doesn't know it
+// or it is ambiguous; either way the skill is searched in job text
+export function skillTerm(skill: string): string | null {
+  const term = skillAliases.get(phrase(skill))
+  return term === undefined || ambiguousTerms.has(term) ? null : term
+}
+
+// Normalized words of a job title, without stopwords
+export function titleTerms(title: string): string[] {
+  const terms = new Set<string>()
+  for (const token of tokenize(title)) {
+    if (!stopwords.has(token)) terms.add(titleAliases.get(token) ?? token)
+  }
+  return [...terms]
+}